@@ -336,6 +336,8 @@ rst_epilog = """
 
 .. |SlideShapes| replace:: :class:`.SlideShapes`
 
+.. |SpatialIndex| replace:: :class:`.SpatialIndex`
+
 .. |str| replace:: :class:`str`
 
 .. |Table| replace:: :class:`Table`
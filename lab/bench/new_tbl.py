@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of `CT_Table.new_tbl()` over a range of table sizes.
+
+Prints the time taken to generate a table of each size along with the time
+per cell. Generation is linear in the number of cells when the time per
+cell stays roughly constant as the table grows, up to 10,000 cells and
+beyond. Run from the root of the repository:
+
+    $ python lab/bench/new_tbl.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+from pptx.oxml.shapes.table import CT_Table  # noqa
+from pptx.util import Inches  # noqa
+
+COLS = 10
+ROW_COUNTS = (100, 250, 500, 1000, 2000)
+REPEAT = 5
+
+
+def time_new_tbl(rows, cols):
+    """Return best time in seconds to generate a *rows* x *cols* table."""
+    timer = timeit.Timer(
+        lambda: CT_Table.new_tbl(rows, cols, Inches(10), Inches(7.5))
+    )
+    return min(timer.repeat(repeat=REPEAT, number=1))
+
+
+def main():
+    print('%8s %12s %14s' % ('cells', 'seconds', 'usec/cell'))
+    for rows in ROW_COUNTS:
+        cells = rows * COLS
+        seconds = time_new_tbl(rows, COLS)
+        print('%8d %12.4f %14.2f' % (cells, seconds, seconds / cells * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@ sys.modules['pptx.exceptions'] = exceptions
 del sys
 
 from pptx.api import Presentation  # noqa
+from pptx.oxml.xmlchemy import trusted_values  # noqa
 
 from pptx.opc.constants import CONTENT_TYPE as CT  # noqa: E402
 from pptx.opc.package import PartFactory  # noqa: E402
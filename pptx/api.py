@@ -17,17 +17,54 @@ from .opc.constants import CONTENT_TYPE as CT
 from .package import Package
 
 
-def Presentation(pptx=None):
+#: Maps each part group name accepted by the *load* argument of
+#: :func:`Presentation` to the content types of the parts in that group.
+_LOAD_GROUPS = {
+    'slides':  (CT.PML_SLIDE,),
+    'layouts': (CT.PML_SLIDE_LAYOUT,),
+    'masters': (CT.PML_SLIDE_MASTER,),
+    'notes':   (CT.PML_NOTES_SLIDE, CT.PML_NOTES_MASTER),
+    'charts':  (CT.DML_CHART,),
+    'media':   (
+        CT.BMP, CT.GIF, CT.JPEG, CT.MS_PHOTO, CT.PNG, CT.TIFF, CT.X_EMF,
+        CT.X_WMF, CT.ASF, CT.AVI, CT.MOV, CT.MP4, CT.MPG, CT.MS_VIDEO,
+        CT.SWF, CT.VIDEO, CT.WMV, CT.X_MS_VIDEO,
+    ),
+}
+
+#: Content types of parts that are loaded regardless of the *load* argument,
+#: being required to open the presentation at all.
+_ALWAYS_LOADED = (
+    CT.PML_PRESENTATION_MAIN, CT.PML_PRES_MACRO_MAIN, CT.PML_TEMPLATE_MAIN,
+    CT.PML_SLIDESHOW_MAIN, CT.OPC_CORE_PROPERTIES,
+)
+
+
+def Presentation(pptx=None, load=None):
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    By default every part in the package is loaded. *load* restricts this to
+    the parts needed, either as a sequence of group names drawn from
+    ``'slides'``, ``'layouts'``, ``'masters'``, ``'notes'``, ``'charts'`` and
+    ``'media'``, or as a callable that takes a content type and returns
+    |True| if parts of that type should be loaded. The presentation part
+    and core properties are always loaded. Other parts are kept as opaque
+    blobs that are never parsed and are written unchanged on save; objects
+    depending on them, such as the slides when ``'slides'`` is not loaded,
+    are not available::
+
+        >>> prs = Presentation('deck.pptx', load=('slides',))
+        >>> [slide.shapes.title.text for slide in prs.slides]
     """
     if pptx is None:
         pptx = _default_pptx_path()
 
-    presentation_part = Package.open(pptx).main_document_part
+    part_filter = None if load is None else _part_filter(load)
+    presentation_part = Package.open(pptx, part_filter).main_document_part
 
     if not _is_pptx_package(presentation_part):
         tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
@@ -44,6 +81,29 @@ def _default_pptx_path():
     return os.path.join(_thisdir, 'templates', 'default.pptx')
 
 
+def _part_filter(load):
+    """
+    Return a content type predicate for the *load* argument of
+    :func:`Presentation`, accepting the content types it selects and those
+    that are always loaded. Raises |ValueError| on an unknown group name.
+    """
+    if callable(load):
+        return lambda content_type: (
+            content_type in _ALWAYS_LOADED or bool(load(content_type))
+        )
+
+    content_types = set(_ALWAYS_LOADED)
+    for group_name in load:
+        if group_name not in _LOAD_GROUPS:
+            raise ValueError(
+                "load group must be one of '%s', got '%s'" % (
+                    "', '".join(sorted(_LOAD_GROUPS)), group_name
+                )
+            )
+        content_types.update(_LOAD_GROUPS[group_name])
+    return content_types.__contains__
+
+
 def _is_pptx_package(prs_part):
     """
     Return |True| if *prs_part* is a valid main document part, |False|
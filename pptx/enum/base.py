@@ -184,6 +184,14 @@ class XmlEnumeration(Enumeration):
     __members__ = ()
     __ms_name__ = ''
 
+    @classmethod
+    def convert_to_xml(cls, enum_val):
+        """
+        Return the XML value of the enumeration value *enum_val* without
+        first validating it.
+        """
+        return cls._member_to_xml[enum_val]
+
     @classmethod
     def from_xml(cls, xml_val):
         """
@@ -198,7 +206,7 @@ class XmlEnumeration(Enumeration):
         Return the XML value of the enumeration value *enum_val*.
         """
         cls.validate(enum_val)
-        return cls._member_to_xml[enum_val]
+        return cls.convert_to_xml(enum_val)
 
 
 class EnumMember(object):
@@ -0,0 +1,157 @@
+# encoding: utf-8
+
+"""
+Streaming text extraction from a presentation package, for use where only
+the text is needed and loading the full object model would be wasteful.
+"""
+
+from __future__ import absolute_import
+
+from lxml import etree
+
+from .opc.constants import RELATIONSHIP_TYPE as RT
+from .opc.packuri import PACKAGE_URI
+from .opc.phys_pkg import PhysPkgReader
+from .opc.pkgreader import PackageReader
+from .oxml.ns import qn
+
+
+_BR, _CNVPR, _P, _T = qn('a:br'), qn('p:cNvPr'), qn('a:p'), qn('a:t')
+_MC_FALLBACK = (
+    '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+)
+_SHAPE_TAGS = (
+    qn('p:sp'), qn('p:grpSp'), qn('p:graphicFrame'), qn('p:cxnSp'),
+    qn('p:pic'), qn('p:contentPart'),
+)
+_TEXT_TAGS = (qn('a:r'), qn('a:fld'))
+
+
+def iter_text(pptx):
+    """
+    Generate a `(slide_index, shape_id, paragraph_text)` 3-tuple for each
+    paragraph in each slide of the presentation in *pptx*, which can be
+    either a path to a file (a string) or a file-like object. Slides are
+    visited in presentation order and *slide_index* is the zero-based index
+    of the slide in |Slides|. *shape_id* is the id of the shape containing
+    the paragraph, which for a table is that of its graphic frame.
+
+    The package is read without being loaded; each slide part is parsed
+    incrementally and discarded as it goes, so memory use does not grow
+    with the size of the presentation.
+    """
+    phys_reader = PhysPkgReader(pptx)
+    try:
+        for slide_idx, slide_partname in _iter_slide_partnames(phys_reader):
+            for shape_id, text in _iter_paragraphs(
+                    phys_reader, slide_partname):
+                yield slide_idx, shape_id, text
+    finally:
+        phys_reader.close()
+
+
+def iter_notes_text(pptx):
+    """
+    Generate a `(slide_index, shape_id, paragraph_text)` 3-tuple for each
+    paragraph in the notes page of each slide in *pptx*, in the same manner
+    as :func:`iter_text`. *shape_id* identifies a shape on the notes page.
+    Slides without a notes page produce no records.
+    """
+    phys_reader = PhysPkgReader(pptx)
+    try:
+        for slide_idx, slide_partname in _iter_slide_partnames(phys_reader):
+            notes_partname = _related_partname(
+                phys_reader, slide_partname, RT.NOTES_SLIDE
+            )
+            if notes_partname is None:
+                continue
+            for shape_id, text in _iter_paragraphs(
+                    phys_reader, notes_partname):
+                yield slide_idx, shape_id, text
+    finally:
+        phys_reader.close()
+
+
+def _free(elm):
+    """
+    Release the memory held by *elm*, which has been fully processed, and by
+    any preceding siblings.
+    """
+    elm.clear()
+    parent = elm.getparent()
+    while elm.getprevious() is not None:
+        del parent[0]
+
+
+def _iter_paragraphs(phys_reader, partname):
+    """
+    Generate a `(shape_id, paragraph_text)` 2-tuple for each paragraph in
+    the part *partname*. The content of an `mc:Fallback` element is skipped
+    as it repeats that of the preceding `mc:Choice` element.
+    """
+    shape_id, fallback_depth = None, 0
+    tags = (_CNVPR, _P, _MC_FALLBACK) + _SHAPE_TAGS
+    with phys_reader.open(partname) as stream:
+        for event, elm in etree.iterparse(
+                stream, events=('start', 'end'), tag=tags):
+            if elm.tag == _MC_FALLBACK:
+                fallback_depth += 1 if event == 'start' else -1
+                continue
+            if event == 'start':
+                continue
+            if elm.tag == _CNVPR:
+                shape_id = int(elm.get('id'))
+            elif elm.tag == _P and not fallback_depth:
+                yield shape_id, _paragraph_text(elm)
+            _free(elm)
+
+
+def _iter_slide_partnames(phys_reader):
+    """
+    Generate a `(slide_index, slide_partname)` 2-tuple for each slide in
+    the presentation in *phys_reader*, in presentation order. A slide id
+    whose relationship is missing refers to no slide and is skipped, though
+    it still counts toward the index of each slide that follows it.
+    """
+    prs_partname = _related_partname(
+        phys_reader, PACKAGE_URI, RT.OFFICE_DOCUMENT
+    )
+    slide_partnames = dict(
+        (srel.rId, srel.target_partname)
+        for srel in PackageReader.srels_for(phys_reader, prs_partname)
+        if srel.reltype == RT.SLIDE
+    )
+    sldId, r_id = qn('p:sldId'), qn('r:id')
+    with phys_reader.open(prs_partname) as stream:
+        slide_idx = 0
+        for _, elm in etree.iterparse(stream, tag=sldId):
+            slide_partname = slide_partnames.get(elm.get(r_id))
+            if slide_partname is not None:
+                yield slide_idx, slide_partname
+            slide_idx += 1
+
+
+def _paragraph_text(p):
+    """
+    Return the text of paragraph element *p*, formed the same way as
+    |_Paragraph.text|, with a line feed for each line break.
+    """
+    texts = []
+    for child in p:
+        if child.tag == _BR:
+            texts.append(u'\n')
+        elif child.tag in _TEXT_TAGS:
+            texts.append(child.findtext(_T) or u'')
+    return u''.join(texts)
+
+
+def _related_partname(phys_reader, source_uri, reltype):
+    """
+    Return the partname of the first part related to the source identified
+    by *source_uri* with a relationship of *reltype*, or |None| if there is
+    no such part.
+    """
+    for srel in PackageReader.srels_for(phys_reader, source_uri):
+        if srel.reltype == reltype and not srel.is_external:
+            return srel.target_partname
+    return None
@@ -27,6 +27,15 @@ nsmap = {
     'r':  NS.OFC_RELATIONSHIPS,
 }
 
+_MC = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+_MC_CHOICE = '{%s}Choice' % _MC
+_MC_PREFIX_ATTRS = ('{%s}Ignorable' % _MC, '{%s}MustUnderstand' % _MC)
+_XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+# ---text of an element as stored by lxml, bypassing any `text` property
+#    defined on a custom element class, such as that of `a:r`---
+_raw_text = etree.ElementBase.text
+
 
 def oxml_tostring(elm, encoding=None, pretty_print=False, standalone=None):
     return etree.tostring(
@@ -40,6 +49,65 @@ def serialize_part_xml(part_elm):
     return xml
 
 
+def write_part_xml(part_elm, file):
+    """
+    Write the XML for *part_elm* to the binary file-like object *file*. The
+    bytes written are the same as those returned by `serialize_part_xml()`,
+    but are emitted incrementally, so the serialized form of a very large
+    part is never held in memory all at once.
+    """
+    with etree.xmlfile(file, encoding='UTF-8') as xf:
+        xf.write_declaration(standalone=True)
+        xf.write(part_elm)
+
+
+def minify_part_xml(part_elm):
+    """
+    Reduce the serialized size of the XML rooted at *part_elm*, in place.
+    Namespace declarations are hoisted to the root element and those
+    redundant or unused are removed, along with whitespace-only text that is
+    not significant. Declarations on the root element are preserved, as are
+    those for prefixes named by markup-compatibility attributes, which are
+    not otherwise recognized as used.
+    """
+    keep_prefixes, top_nsmap, conflicts = set(part_elm.nsmap), {}, set()
+    for elm in part_elm.iter(etree.Element):
+        for prefix, uri in elm.nsmap.items():
+            if prefix is None or prefix in conflicts:
+                continue
+            if top_nsmap.setdefault(prefix, uri) != uri:
+                conflicts.add(prefix)
+        for attr_name in _MC_PREFIX_ATTRS:
+            keep_prefixes.update(elm.get(attr_name, '').split())
+        if elm.tag == _MC_CHOICE:
+            keep_prefixes.update(elm.get('Requires', '').split())
+    for prefix in conflicts:
+        del top_nsmap[prefix]
+    keep_prefixes.discard(None)
+    etree.cleanup_namespaces(
+        part_elm, top_nsmap=top_nsmap, keep_ns_prefixes=sorted(keep_prefixes)
+    )
+    _strip_ignorable_whitespace(part_elm)
+
+
+def _strip_ignorable_whitespace(elm):
+    """
+    Remove whitespace-only text and tails from *elm* and its descendants,
+    except where `xml:space="preserve"` is in effect. Text is only removed
+    from elements having child elements, so leaf element values such as
+    that of `a:t` are never altered.
+    """
+    if elm.get(_XML_SPACE) == 'preserve':
+        return
+    text = _raw_text.__get__(elm)
+    if len(elm) and text is not None and not text.strip():
+        _raw_text.__set__(elm, None)
+    for child in elm.iterchildren(etree.Element):
+        if child.tail is not None and not child.tail.strip():
+            child.tail = None
+        _strip_ignorable_whitespace(child)
+
+
 class CT_Default(BaseOxmlElement):
     """
     ``<Default>`` element, specifying the default content type to be applied
@@ -10,7 +10,9 @@ from __future__ import absolute_import
 from pptx.util import lazyproperty
 
 from .constants import RELATIONSHIP_TYPE as RT
-from .oxml import CT_Relationships, serialize_part_xml
+from .oxml import (
+    CT_Relationships, minify_part_xml, serialize_part_xml, write_part_xml
+)
 from ..oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
 from .pkgreader import PackageReader
@@ -114,14 +116,17 @@ class OpcPackage(object):
         raise Exception('ProgrammingError: ran out of candidate_partnames')
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, part_filter=None):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
+        *pkg_file*. When *part_filter* is provided, it is called with the
+        content type of each part and a part for which it returns |False| is
+        loaded as a plain |Part| holding its blob unparsed, rather than
+        being constructed by |PartFactory|.
         """
         pkg_reader = PackageReader.from_file(pkg_file)
         package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        Unmarshaller.unmarshal(pkg_reader, package, PartFactory, part_filter)
         return package
 
     def part_related_by(self, reltype):
@@ -156,14 +161,31 @@ class OpcPackage(object):
         """
         return RelationshipCollection(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, minify=False):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a file-like object. When *minify* is |True|, the
+        XML of each part is minified before being written and a dict is
+        returned mapping each content type to the number of bytes by which
+        the XML parts of that type read from the original package have
+        shrunk, counted as each part is written.
         """
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+            if minify:
+                part.minify()
+        sizes = PackageWriter.write(pkg_file, self.rels, self.parts)
+        if not minify:
+            return None
+        savings = {}
+        for part in self.parts:
+            if part.load_size is None:
+                continue
+            content_type = part.content_type
+            savings[content_type] = savings.get(content_type, 0) + (
+                part.load_size - sizes[part.partname]
+            )
+        return savings
 
 
 class Part(object):
@@ -241,6 +263,16 @@ class Part(object):
         """
         return self.rels.add_relationship(reltype, target, rId, is_external)
 
+    def minify(self):
+        """
+        Reduce the size of this part as written to the package. A binary
+        part is left unchanged, so this base implementation does nothing.
+        """
+
+    # ---size in bytes of the XML this part was parsed from, |None| for a
+    #    binary part or one not read from a package---
+    load_size = None
+
     @property
     def package(self):
         """
@@ -319,6 +351,15 @@ class Part(object):
         rel = self.rels[rId]
         return rel.target_ref
 
+    def write_blob(self, file):
+        """
+        Write the contents of this part to the binary file-like object
+        *file*, as when saving it to a package. Subclasses that can produce
+        their blob incrementally override this to avoid holding it in memory
+        all at once.
+        """
+        file.write(self.blob)
+
     def _rel_ref_count(self, rId):
         """
         Return the count of references in this part's XML to the relationship
@@ -348,7 +389,16 @@ class XmlPart(Part):
     @classmethod
     def load(cls, partname, content_type, blob, package):
         element = parse_xml(blob)
-        return cls(partname, content_type, element, package)
+        part = cls(partname, content_type, element, package)
+        part.load_size = len(blob)
+        return part
+
+    def minify(self):
+        """
+        Remove redundant namespace declarations and ignorable whitespace from
+        the XML of this part.
+        """
+        minify_part_xml(self._element)
 
     @property
     def part(self):
@@ -359,6 +409,13 @@ class XmlPart(Part):
         """
         return self
 
+    def write_blob(self, file):
+        """
+        Serialize the XML of this part directly into *file*, without first
+        producing the complete blob in memory.
+        """
+        write_part_xml(self._element, file)
+
 
 class PartFactory(object):
     """
@@ -393,6 +450,14 @@ class RelationshipCollection(dict):
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
 
+    def __delitem__(self, rId):
+        """
+        Remove the relationship identified by *rId*, along with its entry in
+        :attr:`related_parts`.
+        """
+        super(RelationshipCollection, self).__delitem__(rId)
+        self._target_parts_by_rId.pop(rId, None)
+
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
         Return a newly added |_Relationship| instance.
@@ -403,6 +468,25 @@ class RelationshipCollection(dict):
             self._target_parts_by_rId[rId] = target
         return rel
 
+    def add_relationships(self, reltype, target_parts):
+        """
+        Return a list containing the rId of a newly added relationship of
+        *reltype* to each part in *target_parts*, in that order. Unlike
+        :meth:`get_or_add`, no check is made for an existing relationship to
+        each part, and the rIds are allocated in a single pass over the
+        numbering, so adding many relationships takes linear time.
+        """
+        rIds = []
+        n = 0
+        for target_part in target_parts:
+            n += 1
+            while 'rId%d' % n in self:
+                n += 1
+            rId = 'rId%d' % n
+            self.add_relationship(reltype, target_part, rId)
+            rIds.append(rId)
+        return rIds
+
     def get_or_add(self, reltype, target_part):
         """
         Return relationship of *reltype* to *target_part*, newly added if not
@@ -510,14 +594,16 @@ class Unmarshaller(object):
     instance.
     """
     @staticmethod
-    def unmarshal(pkg_reader, package, part_factory):
+    def unmarshal(pkg_reader, package, part_factory, part_filter=None):
         """
         Construct graph of parts and realized relationships based on the
         contents of *pkg_reader*, delegating construction of each part to
-        *part_factory*. Package relationships are added to *pkg*.
+        *part_factory*, or only those whose content type *part_filter*
+        accepts when one is provided. Package relationships are added to
+        *pkg*.
         """
         parts = Unmarshaller._unmarshal_parts(
-            pkg_reader, package, part_factory
+            pkg_reader, package, part_factory, part_filter
         )
         Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
         for part in parts.values():
@@ -525,15 +611,22 @@ class Unmarshaller(object):
         package.after_unmarshal()
 
     @staticmethod
-    def _unmarshal_parts(pkg_reader, package, part_factory):
+    def _unmarshal_parts(pkg_reader, package, part_factory, part_filter=None):
         """
         Return a dictionary of |Part| instances unmarshalled from
         *pkg_reader*, keyed by partname. Side-effect is that each part in
-        *pkg_reader* is constructed using *part_factory*.
+        *pkg_reader* is constructed using *part_factory*, except that a part
+        whose content type is rejected by *part_filter* is constructed as a
+        plain |Part|, leaving its blob unparsed.
         """
         parts = {}
         for partname, content_type, blob in pkg_reader.iter_sparts():
-            parts[partname] = part_factory(
+            load_part = (
+                part_factory
+                if part_filter is None or part_filter(content_type)
+                else Part.load
+            )
+            parts[partname] = load_part(
                 partname, content_type, blob, package
             )
         return parts
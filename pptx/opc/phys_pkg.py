@@ -7,8 +7,10 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 from __future__ import absolute_import
 
 import os
+import time
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from io import BytesIO
+from zipfile import ZipFile, ZipInfo, is_zipfile, ZIP_DEFLATED
 
 from ..compat import is_string
 from ..exceptions import PackageNotFoundError
@@ -81,6 +83,14 @@ class _DirPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def open(self, pack_uri):
+        """
+        Return a readable binary file-like object for the file corresponding
+        to *pack_uri* in the package directory.
+        """
+        path = os.path.join(self._path, pack_uri.membername)
+        return open(path, 'rb')
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri*, or None if the
@@ -121,6 +131,14 @@ class _ZipPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def open(self, pack_uri):
+        """
+        Return a readable binary file-like object for the zip member
+        corresponding to *pack_uri*. Its bytes are decompressed as they are
+        read, so the member need never be held in memory all at once.
+        """
+        return self._zipf.open(pack_uri.membername)
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri* or None if no rels
@@ -148,9 +166,45 @@ class _ZipPkgWriter(PhysPkgWriter):
         """
         self._zipf.close()
 
+    def open(self, pack_uri):
+        """
+        Return a writable binary file-like object for the member of this zip
+        package corresponding to *pack_uri*. Bytes written to it are
+        compressed into the archive as they arrive where the Python version
+        supports it (3.6+), and are buffered and written when the stream is
+        closed otherwise. The stream must be closed before another member is
+        written; it can be used as a context manager for that purpose.
+        """
+        zinfo = ZipInfo(
+            pack_uri.membername, date_time=time.localtime(time.time())[:6]
+        )
+        zinfo.compress_type = ZIP_DEFLATED
+        zinfo.external_attr = 0o600 << 16
+        try:
+            return self._zipf.open(zinfo, 'w')
+        except RuntimeError:  # ---zip member streaming not supported---
+            return _ZipMemberBuffer(self._zipf, zinfo)
+
     def write(self, pack_uri, blob):
         """
         Write *blob* to this zip package with the membername corresponding to
         *pack_uri*.
         """
         self._zipf.writestr(pack_uri.membername, blob)
+
+
+class _ZipMemberBuffer(BytesIO):
+    """
+    Writable stream that accumulates the bytes of a zip member and writes
+    them to the archive when closed. Stands in for a zip member stream on
+    Python versions where |ZipFile| cannot open a member for writing.
+    """
+    def __init__(self, zipf, zinfo):
+        super(_ZipMemberBuffer, self).__init__()
+        self._zipf = zipf
+        self._zinfo = zinfo
+
+    def close(self):
+        if not self.closed:
+            self._zipf.writestr(self._zinfo, self.getvalue())
+        super(_ZipMemberBuffer, self).close()
@@ -27,13 +27,15 @@ class PackageWriter(object):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. Returns a dict mapping the partname of
+        each part to the number of bytes written for it, before compression.
         """
         phys_writer = PhysPkgWriter(pkg_file)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        sizes = PackageWriter._write_parts(phys_writer, parts)
         phys_writer.close()
+        return sizes
 
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
@@ -50,12 +52,20 @@ class PackageWriter(object):
     def _write_parts(phys_writer, parts):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. Each blob
+        is streamed into its zip member rather than first being serialized
+        in full. Returns a dict mapping each partname to the number of bytes
+        written for that part.
         """
+        sizes = {}
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            with phys_writer.open(part.partname) as stream:
+                counter = _CountingStream(stream)
+                part.write_blob(counter)
+            sizes[part.partname] = counter.count
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
+        return sizes
 
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
@@ -66,6 +76,21 @@ class PackageWriter(object):
         phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
 
 
+class _CountingStream(object):
+    """
+    Binary file-like object that passes what is written to it on to
+    *stream*, keeping count of the bytes written.
+    """
+    def __init__(self, stream):
+        super(_CountingStream, self).__init__()
+        self._stream = stream
+        self.count = 0
+
+    def write(self, data):
+        self._stream.write(data)
+        self.count += len(data)
+
+
 class _ContentTypesItem(object):
     """
     Service class that composes a content types item ([Content_Types].xml)
@@ -10,7 +10,8 @@ from __future__ import (
 
 from .simpletypes import ST_SlideId, ST_SlideSizeCoordinate, XsdString
 from .xmlchemy import (
-    BaseOxmlElement, RequiredAttribute, ZeroOrOne, ZeroOrMore
+    BaseOxmlElement, RequiredAttribute, VersionedElementMixin, ZeroOrOne,
+    ZeroOrMore
 )
 
 
@@ -36,7 +37,7 @@ class CT_SlideId(BaseOxmlElement):
     rId = RequiredAttribute('r:id', XsdString)
 
 
-class CT_SlideIdList(BaseOxmlElement):
+class CT_SlideIdList(VersionedElementMixin, BaseOxmlElement):
     """
     ``<p:sldIdLst>`` element, direct child of <p:presentation> that contains
     a list of the slide parts in the presentation.
@@ -50,6 +51,19 @@ class CT_SlideIdList(BaseOxmlElement):
         """
         return self._add_sldId(id=self._next_id, rId=rId)
 
+    def add_sldIds(self, rIds):
+        """
+        Return a list of newly created ``<p:sldId>`` child elements, one for
+        each rId in *rIds*, in that order. Slide ids are allocated as
+        a single range following the largest id in use, so the existing ids
+        are examined only once however many elements are added.
+        """
+        next_id = self._next_id
+        return [
+            self._add_sldId(id=next_id + offset, rId=rId)
+            for offset, rId in enumerate(rIds)
+        ]
+
     @property
     def _next_id(self):
         """
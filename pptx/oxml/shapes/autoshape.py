@@ -96,6 +96,27 @@ class CT_Path2D(BaseOxmlElement):
         pt.x, pt.y = x, y
         return moveTo
 
+    def add_operations(self, operations):
+        """Append a drawing element for each of *operations*.
+
+        *operations* is an iterable of `(tag, x, y)` 3-tuples, where *tag* is
+        one of 'a:moveTo', 'a:lnTo', or 'a:close' and *x* and *y* are the
+        integer coordinates of the point, ignored for 'a:close'. The
+        elements are parsed together and appended in a single step, which
+        is much faster than adding them one at a time for a long path.
+        """
+        fragments = [
+            '<a:close/>' if tag == 'a:close' else
+            '<%s><a:pt x="%d" y="%d"/></%s>' % (tag, x, y, tag)
+            for tag, x, y in operations
+        ]
+        if not fragments:
+            return
+        path = parse_xml(
+            '<a:path %s>%s</a:path>' % (nsdecls('a'), ''.join(fragments))
+        )
+        self.extend(list(path))
+
 
 class CT_Path2DClose(BaseOxmlElement):
     """`a:close` custom element class."""
@@ -6,6 +6,8 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
 from pptx.oxml import parse_xml
 from pptx.oxml.ns import nsdecls, qn
@@ -14,11 +16,13 @@ from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement
-from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
+from pptx.oxml.xmlchemy import (
+    BaseOxmlElement, OneAndOnlyOne, VersionedElementMixin, ZeroOrOne
+)
 from pptx.util import Emu
 
 
-class CT_GroupShape(BaseShapeElement):
+class CT_GroupShape(VersionedElementMixin, BaseShapeElement):
     """
     Used for the shape tree (``<p:spTree>``) element as well as the group
     shape (``<p:grpSp>``) element.
@@ -40,6 +44,15 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
+    def add_autoshapes(self, ids, names, prst, xs, ys, cxs, cys):
+        """
+        Append a new ``<p:sp>`` autoshape of preset geometry *prst* for each
+        item in the parallel sequences *ids*, *names*, *xs*, *ys*, *cxs*, and
+        *cys*. Return the new elements as a list.
+        """
+        prototype = CT_Shape.new_autoshape_sp(0, 'prototype', prst, 0, 0, 0, 0)
+        return self._add_sp_copies(prototype, ids, names, xs, ys, cxs, cys)
+
     def add_cxnSp(self, id_, name, type_member, x, y, cx, cy, flipH, flipV):
         """
         Append a new ``<p:cxnSp>`` shape to the group/shapetree having the
@@ -52,23 +65,19 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(cxnSp, 'p:extLst')
         return cxnSp
 
-    def add_freeform_sp(self, x, y, cx, cy):
+    def add_freeform_sp(self, id_, name, x, y, cx, cy):
         """Append a new freeform `p:sp` with specified position and size."""
-        shape_id = self._next_shape_id
-        name = 'Freeform %d' % (shape_id-1,)
-        sp = CT_Shape.new_freeform_sp(shape_id, name, x, y, cx, cy)
+        sp = CT_Shape.new_freeform_sp(id_, name, x, y, cx, cy)
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
-    def add_grpSp(self):
+    def add_grpSp(self, id_, name):
         """Return `p:grpSp` element newly appended to this shape tree.
 
-        The element contains no sub-shapes, is positioned at (0, 0), and has
-        width and height of zero.
+        The element has *id_* and *name*, contains no sub-shapes, is
+        positioned at (0, 0), and has width and height of zero.
         """
-        shape_id = self._next_shape_id
-        name = 'Group %d' % (shape_id-1,)
-        grpSp = CT_GroupShape.new_grpSp(shape_id, name)
+        grpSp = CT_GroupShape.new_grpSp(id_, name)
         self.insert_element_before(grpSp, 'p:extLst')
         return grpSp
 
@@ -112,6 +121,15 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
+    def add_textboxes(self, ids, names, xs, ys, cxs, cys):
+        """
+        Append a new textbox ``<p:sp>`` shape for each item in the parallel
+        sequences *ids*, *names*, *xs*, *ys*, *cxs*, and *cys*. Return the
+        new elements as a list.
+        """
+        prototype = CT_Shape.new_textbox_sp(0, 'prototype', 0, 0, 0, 0)
+        return self._add_sp_copies(prototype, ids, names, xs, ys, cxs, cys)
+
     @property
     def chExt(self):
         """Descendent `p:grpSpPr/a:xfrm/a:chExt` element."""
@@ -184,14 +202,16 @@ class CT_GroupShape(BaseShapeElement):
         grpSp = parse_xml(xml)
         return grpSp
 
-    def recalculate_extents(self):
+    def recalculate_extents(self, recursive=True):
         """Adjust x, y, cx, and cy to incorporate all contained shapes.
 
         This would typically be called when a contained shape is added,
         removed, or its position or size updated.
 
         This method is recursive "upwards" since a change in a group shape
-        can change the position and size of its containing group.
+        can change the position and size of its containing group. When
+        *recursive* is False, only this group is adjusted; the caller is then
+        responsible for adjusting any containing groups.
         """
         if not self.tag == qn('p:grpSp'):
             return
@@ -202,7 +222,8 @@ class CT_GroupShape(BaseShapeElement):
         self.chOff.y = self.y = y
         self.chExt.cx = self.cx = cx
         self.chExt.cy = self.cy = cy
-        self.getparent().recalculate_extents()
+        if recursive:
+            self.getparent().recalculate_extents()
 
     @property
     def xfrm(self):
@@ -211,6 +232,30 @@ class CT_GroupShape(BaseShapeElement):
         """
         return self.grpSpPr.xfrm
 
+    def _add_sp_copies(self, prototype, ids, names, xs, ys, cxs, cys):
+        """
+        Return a list of copies of *prototype*, a ``<p:sp>`` element, one for
+        each item in the parallel sequences *ids*, *names*, *xs*, *ys*, *cxs*,
+        and *cys*, having that id, name, position, and size. The copies are
+        inserted into this shape tree as a block, in a single operation.
+        """
+        sps = []
+        for id_, name, x, y, cx, cy in zip(ids, names, xs, ys, cxs, cys):
+            sp = deepcopy(prototype)
+            cNvPr, xfrm = sp.nvSpPr.cNvPr, sp.spPr.xfrm
+            cNvPr.id, cNvPr.name = id_, name
+            off, ext = xfrm.off, xfrm.ext
+            off.x, off.y, ext.cx, ext.cy = x, y, cx, cy
+            sps.append(sp)
+
+        extLst = self.find(qn('p:extLst'))
+        if extLst is None:
+            self.extend(sps)
+        else:
+            idx = self.index(extLst)
+            self[idx:idx] = sps
+        return sps
+
     @property
     def _child_extents(self):
         """(x, y, cx, cy) tuple representing net position and size.
@@ -234,21 +279,6 @@ class CT_GroupShape(BaseShapeElement):
 
         return x, y, cx, cy
 
-    @property
-    def _next_shape_id(self):
-        """Return unique shape id suitable for use with a new shape element.
-
-        The returned id is the next available positive integer drawing object
-        id in shape tree, starting from 1 and making use of any gaps in
-        numbering. In practice, the minimum id is 2 because the spTree
-        element itself is always assigned id="1".
-        """
-        id_str_lst = self.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids)+2):
-            if n not in used_ids:
-                return n
-
 
 class CT_GroupShapeNonVisual(BaseShapeElement):
     """
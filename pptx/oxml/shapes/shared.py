@@ -79,10 +79,12 @@ class BaseShapeElement(BaseOxmlElement):
         """
         The ``<p:ph>`` descendant element if there is one, None otherwise.
         """
-        ph_elms = self.xpath('./*[1]/p:nvPr/p:ph')
-        if len(ph_elms) == 0:
-            return None
-        return ph_elms[0]
+        # ---probe child tags directly rather than evaluating an XPath
+        #    expression, this being checked for each shape on iteration---
+        for nvXxPr in self.iterchildren('*'):
+            nvPr = nvXxPr.find(qn('p:nvPr'))
+            return None if nvPr is None else nvPr.find(qn('p:ph'))
+        return None
 
     @property
     def ph_idx(self):
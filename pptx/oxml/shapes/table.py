@@ -6,11 +6,15 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+
 from pptx.enum.text import MSO_VERTICAL_ANCHOR
 from pptx.oxml import parse_xml
 from pptx.oxml.dml.fill import CT_GradientFillProperties
-from pptx.oxml.ns import nsdecls
-from pptx.oxml.simpletypes import ST_Coordinate, ST_Coordinate32, XsdBoolean
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.simpletypes import (
+    ST_Coordinate, ST_Coordinate32, XsdBoolean, XsdInt
+)
 from pptx.oxml.text import CT_TextBody
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, OneAndOnlyOne, OptionalAttribute,
@@ -114,6 +118,57 @@ class CT_Table(BaseOxmlElement):
         tblPr = self.get_or_add_tblPr()
         setattr(tblPr, propname, value)
 
+    def set_cell_texts(self, texts, row_offset=0, col_offset=0):
+        """
+        Replace the text of a block of cells with the strings in *texts*, a
+        sequence of rows, each a sequence of unicode strings. The first
+        string is placed in the cell at *row_offset*, *col_offset*. The
+        ``<a:tc>`` elements of the block are located once, in a single pass
+        over the rows of the table. Raises |ValueError| if the block does not
+        fit within the table, in which case no cell is changed.
+        """
+        if row_offset < 0 or col_offset < 0:
+            raise ValueError('cell offsets must be non-negative')
+        tr_lst = self.tr_lst[row_offset:row_offset + len(texts)]
+        tc_rows = [tr.tc_lst[col_offset:] for tr in tr_lst]
+        if len(tc_rows) < len(texts) or any(
+            len(row_texts) > len(tcs)
+            for tcs, row_texts in zip(tc_rows, texts)
+        ):
+            raise ValueError(
+                'data of %d rows does not fit in table at row %d, column %d'
+                % (len(texts), row_offset, col_offset)
+            )
+        for tcs, row_texts in zip(tc_rows, texts):
+            for tc, text in zip(tcs, row_texts):
+                tc.set_text(text)
+
+    def text_rows(self, fill_merged=False):
+        """
+        Return the text of each cell in this table as a list of rows, each
+        a list of unicode strings, gathered in a single pass over the
+        ``<a:tr>`` and ``<a:tc>`` elements. A cell covered by a merged cell,
+        having an ``hMerge`` or ``vMerge`` attribute, is |None| unless
+        *fill_merged* is |True|, in which case it holds the text of the
+        merged cell covering it.
+        """
+        rows = []
+        for tr in self.tr_lst:
+            row = []
+            for col_idx, tc in enumerate(tr.tc_lst):
+                if not (tc.hMerge or tc.vMerge):
+                    row.append(tc.cell_text)
+                elif not fill_merged:
+                    row.append(None)
+                elif tc.hMerge and col_idx > 0:
+                    row.append(row[col_idx - 1])
+                elif tc.vMerge and rows and col_idx < len(rows[-1]):
+                    row.append(rows[-1][col_idx])
+                else:
+                    row.append(None)
+            rows.append(row)
+        return rows
+
     @classmethod
     def new_tbl(cls, rows, cols, width, height, tableStyleId=None):
         """
@@ -123,28 +178,30 @@ class CT_Table(BaseOxmlElement):
         if tableStyleId is None:
             tableStyleId = '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}'
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = parse_xml(xml)
-
-        # add specified number of rows and columns
+        # divide width and height evenly between columns and rows
         rowheight = height//rows
         colwidth = width//cols
 
-        for col in range(cols):
-            # adjust width of last col to absorb any div error
-            if col == cols-1:
-                colwidth = width - ((cols-1) * colwidth)
-            tbl.tblGrid.add_gridCol(width=colwidth)
-
-        for row in range(rows):
-            # adjust height of last row to absorb any div error
-            if row == rows-1:
-                rowheight = height - ((rows-1) * rowheight)
-            tr = tbl.add_tr(height=rowheight)
-            for col in range(cols):
-                tr.add_tc()
+        # adjust size of last row and col to absorb any div error
+        widths = [colwidth] * (cols-1) + [width - ((cols-1) * colwidth)]
+        heights = [rowheight] * (rows-1) + [height - ((rows-1) * rowheight)]
+
+        # the whole grid is generated as XML and parsed in one step, which
+        # takes time proportional to the number of cells rather than
+        # invoking the parser once for each cell
+        tr_cells = cls._tc_xml * cols
+        xml = cls._tbl_tmpl() % (
+            tableStyleId,
+            ''.join('<a:gridCol w="%d"/>' % w for w in widths),
+            ''.join('<a:tr h="%d">%s</a:tr>' % (h, tr_cells) for h in heights)
+        )
+        return parse_xml(xml)
 
-        return tbl
+    # ---markup of a single empty cell, repeated for each cell in new_tbl()---
+    _tc_xml = (
+        '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p/></a:txBody><a:tcPr/>'
+        '</a:tc>'
+    )
 
     @classmethod
     def _tbl_tmpl(cls):
@@ -153,8 +210,9 @@ class CT_Table(BaseOxmlElement):
             '  <a:tblPr firstRow="1" bandRow="1">\n'
             '    <a:tableStyleId>%s</a:tableStyleId>\n'
             '  </a:tblPr>\n'
-            '  <a:tblGrid/>\n'
-            '</a:tbl>' % (nsdecls('a'), '%s')
+            '  <a:tblGrid>%s</a:tblGrid>\n'
+            '  %s\n'
+            '</a:tbl>' % (nsdecls('a'), '%s', '%s', '%s')
         )
 
 
@@ -164,6 +222,10 @@ class CT_TableCell(BaseOxmlElement):
     """
     txBody = ZeroOrOne('a:txBody', successors=('a:tcPr', 'a:extLst',))
     tcPr = ZeroOrOne('a:tcPr', successors=('a:extLst',))
+    gridSpan = OptionalAttribute('gridSpan', XsdInt, default=1)
+    rowSpan = OptionalAttribute('rowSpan', XsdInt, default=1)
+    hMerge = OptionalAttribute('hMerge', XsdBoolean, default=False)
+    vMerge = OptionalAttribute('vMerge', XsdBoolean, default=False)
 
     @property
     def anchor(self):
@@ -185,6 +247,28 @@ class CT_TableCell(BaseOxmlElement):
         tcPr = self.get_or_add_tcPr()
         tcPr.anchor = anchor_enum_idx
 
+    def apply_format(self, tcPr=None, rPr=None, algn=None):
+        """
+        Graft the cell formatting in *tcPr*, an ``<a:tcPr>`` element, onto
+        the ``<a:tcPr>`` child of this cell and the character formatting in
+        *rPr*, an ``<a:rPr>`` element, onto each run and end-of-paragraph
+        properties element of this cell. Attributes are copied and any solid
+        fill or latin typeface is copied in place of the existing one. When
+        *algn* is not |None| it is applied as the alignment of each
+        paragraph in the cell.
+        """
+        if tcPr is not None:
+            _graft_properties(self.get_or_add_tcPr(), tcPr)
+        if rPr is None and algn is None:
+            return
+        for p in self.get_or_add_txBody().p_lst:
+            if algn is not None:
+                p.get_or_add_pPr().algn = algn
+            if rPr is not None:
+                for r in p.r_lst:
+                    _graft_properties(r.get_or_add_rPr(), rPr)
+                _graft_properties(p.get_or_add_endParaRPr(), rPr)
+
     @property
     def marT(self):
         """
@@ -244,6 +328,60 @@ class CT_TableCell(BaseOxmlElement):
         tc = parse_xml(xml)
         return tc
 
+    def set_text(self, text):
+        """
+        Replace the text in this cell with a single paragraph containing
+        *text*, in the same way as assigning to ``_Cell.text``. The
+        properties of the first paragraph are kept and each line feed in
+        *text* becomes an ``<a:br>`` element. A run for text having no line
+        feed is copied from a prototype rather than parsed.
+        """
+        txBody = self.get_or_add_txBody()
+        p_lst = txBody.p_lst
+        for p in p_lst[1:]:
+            txBody.remove(p)
+        p = p_lst[0] if p_lst else txBody.add_p()
+        for elm in p.content_children:
+            p.remove(elm)
+
+        if '\n' in text:
+            p.append_text(text)
+        elif text:
+            if CT_TableCell._r_prototype is None:
+                CT_TableCell._r_prototype = parse_xml(
+                    '<a:r %s><a:t/></a:r>' % nsdecls('a')
+                )
+            r = deepcopy(CT_TableCell._r_prototype)
+            r[0].text = text
+            p._insert_r(r)
+
+    @property
+    def cell_text(self):
+        """
+        Unicode text of this cell, with a line feed between paragraphs and
+        for each line break, in the same form as ``_Cell.text_frame.text``.
+        """
+        return '\n'.join(self.text_lines)
+
+    @property
+    def text_lines(self):
+        """
+        List of the lines of text in this cell, as unicode strings. Each
+        paragraph starts a new line, as does each line break within
+        a paragraph. A cell having no text body has no lines.
+        """
+        txBody = self.txBody
+        if txBody is None:
+            return []
+        lines = []
+        for p in txBody.p_lst:
+            text = ''.join(elm.text for elm in p.content_children)
+            lines.extend(text.split('\n'))
+        return lines
+
+    # ---`a:r` element copied for the run of each cell by set_text()---
+    _r_prototype = None
+
     def _get_marX(self, attr_name, default):
         """
         Generalized method to get margin values.
@@ -347,3 +485,21 @@ class CT_TableRow(BaseOxmlElement):
 
     def _new_tc(self):
         return CT_TableCell.new()
+
+
+def _graft_properties(target, proto):
+    """
+    Copy the attributes of properties element *proto* onto *target*, an
+    element of the same type, along with a copy of any ``<a:solidFill>`` or
+    ``<a:latin>`` child, each replacing its counterpart in *target*.
+    """
+    for name, value in proto.attrib.items():
+        target.set(name, value)
+    solidFill = proto.find(qn('a:solidFill'))
+    if solidFill is not None:
+        target._remove_eg_fillProperties()
+        target._insert_solidFill(deepcopy(solidFill))
+    latin = proto.find(qn('a:latin'))
+    if latin is not None:
+        target._remove_latin()
+        target._insert_latin(deepcopy(latin))
@@ -8,7 +8,9 @@ classes.
 from __future__ import absolute_import, print_function
 
 import re
+import threading
 
+from contextlib import contextmanager
 from lxml import etree
 
 from . import oxml_parser
@@ -30,6 +32,40 @@ def OxmlElement(nsptag_str, nsmap=None):
     return oxml_parser.makeelement(nsptag.clark_name, nsmap=nsmap)
 
 
+@contextmanager
+def trusted_values():
+    """
+    Context manager within which attribute assignments skip validation.
+
+    Within the ``with`` block, an assignment to a property generated by
+    |OptionalAttribute| or |RequiredAttribute| converts the value to its XML
+    string form without first validating it against its simple type (range
+    checks, type checks, enumeration membership, etc.). This is useful when
+    generating large numbers of known-good values, such as EMU integers
+    computed by a layout engine or enumeration members. Assigning an invalid
+    value in this mode produces invalid XML rather than raising an
+    exception, so use it only where the values are known to be valid.
+
+    The setting is thread-local and may be nested; it is off by default.
+    """
+    _trust.depth += 1
+    try:
+        yield
+    finally:
+        _trust.depth -= 1
+
+
+class _TrustState(threading.local):
+    """
+    Thread-local nesting depth of |trusted_values| blocks. Validation is
+    skipped when *depth* is non-zero.
+    """
+    depth = 0
+
+
+_trust = _TrustState()
+
+
 def serialize_for_reading(element):
     """
     Serialize *element* to human-readable XML suitable for tests. No XML
@@ -202,7 +238,10 @@ class OptionalAttribute(BaseAttribute):
                 if self._clark_name in obj.attrib:
                     del obj.attrib[self._clark_name]
                 return
-            str_value = self._simple_type.to_xml(value)
+            if _trust.depth:
+                str_value = self._simple_type.convert_to_xml(value)
+            else:
+                str_value = self._simple_type.to_xml(value)
             obj.set(self._clark_name, str_value)
         return set_attr_value
 
@@ -251,7 +290,10 @@ class RequiredAttribute(BaseAttribute):
         property descriptor.
         """
         def set_attr_value(obj, value):
-            str_value = self._simple_type.to_xml(value)
+            if _trust.depth:
+                str_value = self._simple_type.convert_to_xml(value)
+            else:
+                str_value = self._simple_type.to_xml(value)
             obj.set(self._clark_name, str_value)
         return set_attr_value
 
@@ -699,6 +741,59 @@ class ZeroOrOneChoice(_BaseChildElement):
         return '_remove_%s' % self._prop_name
 
 
+class VersionedElementMixin(object):
+    """
+    Mixin for an element class whose children are looked up through tables
+    kept outside the XML, such as a shape tree or the slide list. Changes
+    made to the children through the `append()`, `extend()`, `insert()`,
+    `remove()` and `insert_element_before()` methods of the element each
+    increment its :attr:`version`, so a table can be checked for staleness
+    by comparing one number.
+    """
+
+    def append(self, element):
+        super(VersionedElementMixin, self).append(element)
+        self.increment_version()
+
+    def extend(self, elements):
+        super(VersionedElementMixin, self).extend(elements)
+        self.increment_version()
+
+    def increment_version(self):
+        """
+        Note a change to the children of this element. Other code changing
+        a child in a way that affects lookups, such as renaming a shape,
+        calls this on the element containing it.
+        """
+        self._version = self.version + 1
+
+    def insert(self, index, element):
+        super(VersionedElementMixin, self).insert(index, element)
+        self.increment_version()
+
+    def insert_element_before(self, elm, *tagnames):
+        elm = super(VersionedElementMixin, self).insert_element_before(
+            elm, *tagnames
+        )
+        self.increment_version()
+        return elm
+
+    def remove(self, element):
+        super(VersionedElementMixin, self).remove(element)
+        self.increment_version()
+
+    @property
+    def version(self):
+        """
+        Number of changes noted by :meth:`increment_version`. A lookup table
+        built from the children of this element is current for as long as
+        this value is unchanged. The count is held on the element proxy, so
+        it is only meaningful while a reference to this element is held, as
+        each such lookup table does.
+        """
+        return getattr(self, '_version', 0)
+
+
 class _OxmlElementBase(etree.ElementBase):
     """
     Provides common behavior for oxml element classes
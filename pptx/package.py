@@ -224,6 +224,9 @@ class _MediaParts(object):
         ("file").
         """
         for media_part in self:
+            # ---skip media parts not loaded as |MediaPart|---
+            if not hasattr(media_part, 'sha1'):
+                continue
             if media_part.sha1 == sha1:
                 return media_part
         return None
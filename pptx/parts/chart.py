@@ -10,6 +10,7 @@ from ..chart.chart import Chart
 from .embeddedpackage import EmbeddedXlsxPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
+from ..oxml import parse_xml
 from ..util import lazyproperty
 
 
@@ -17,23 +18,73 @@ class ChartPart(XmlPart):
     """
     A chart part; corresponds to parts having partnames matching
     ppt/charts/chart[1-9][0-9]*.xml
+
+    A newly generated chart part holds the XML produced by the chart XML
+    writer as bytes and only parses it when its element is first accessed.
+    A chart that is added and never touched again is written to the package
+    unchanged on save, without an element tree ever being built for it.
     """
     partname_template = '/ppt/charts/chart%d.xml'
 
+    def __init__(self, partname, content_type, element, package=None,
+                 blob=None):
+        super(ChartPart, self).__init__(
+            partname, content_type, element, package
+        )
+        self._blob = blob
+
     @classmethod
     def new(cls, chart_type, chart_data, package):
         """
         Return a new |ChartPart| instance added to *package* containing
         a chart of *chart_type* and depicting *chart_data*.
         """
-        chart_blob = chart_data.xml_bytes(chart_type)
         partname = package.next_partname(cls.partname_template)
         content_type = CT.DML_CHART
-        chart_part = cls.load(partname, content_type, chart_blob, package)
-        xlsx_blob = chart_data.xlsx_blob
-        chart_part.chart_workbook.update_from_xlsx_blob(xlsx_blob)
+        chart_part = cls(partname, content_type, None, package)
+        xlsx_part = EmbeddedXlsxPart.new(chart_data.xlsx_blob, package)
+        xlsx_rId = chart_part.relate_to(xlsx_part, RT.PACKAGE)
+        chart_part._blob = cls._add_externalData(
+            chart_data.xml_bytes(chart_type), xlsx_rId
+        )
         return chart_part
 
+    def clone(self):
+        """
+        Return a new |ChartPart| instance added to the package of this part
+        and containing a copy of this chart. An embedded workbook is copied
+        into a new |EmbeddedXlsxPart| so each chart can be edited on its
+        own; other parts related to this chart are shared with the copy. The
+        chart XML is copied as bytes and only parsed when the copy is first
+        accessed.
+        """
+        package = self.package
+        partname = package.next_partname(self.partname_template)
+        chart_part = ChartPart(
+            partname, self.content_type, None, package, blob=self.blob
+        )
+        for rel in self.rels.values():
+            if rel.is_external:
+                target = rel.target_ref
+            elif rel.reltype == RT.PACKAGE:
+                target = EmbeddedXlsxPart.new(rel.target_part.blob, package)
+            else:
+                target = rel.target_part
+            chart_part.rels.add_relationship(
+                rel.reltype, target, rel.rId, rel.is_external
+            )
+        return chart_part
+
+    @property
+    def blob(self):
+        """
+        The XML of this part as bytes, returned as-is when the generated XML
+        has not yet been parsed.
+        """
+        if self._chartSpace is None:
+            return self._blob
+        return super(ChartPart, self).blob
+
     @lazyproperty
     def chart(self):
         """
@@ -49,6 +100,57 @@ class ChartPart(XmlPart):
         """
         return ChartWorkbook(self._element, self)
 
+    def minify(self):
+        """
+        Minify the XML of this part, unless it is generated XML not yet
+        parsed, which is already compact and is left as-is rather than
+        parsed just to be minified.
+        """
+        if self._chartSpace is None:
+            return
+        super(ChartPart, self).minify()
+
+    def write_blob(self, file):
+        """
+        Write the XML of this part to *file*, directly from the generated
+        bytes when they have not yet been parsed.
+        """
+        if self._chartSpace is None:
+            file.write(self._blob)
+            return
+        super(ChartPart, self).write_blob(file)
+
+    @staticmethod
+    def _add_externalData(chart_blob, xlsx_rId):
+        """
+        Return *chart_blob* with a `c:externalData` element referring to the
+        embedded workbook related by *xlsx_rId* added as the last child of
+        its `c:chartSpace` root element. Generated chart XML has no
+        `c:printSettings`, `c:userShapes`, or `c:extLst` element, so the
+        last position is always the correct one in the sequence.
+        """
+        externalData_xml = (
+            '<c:externalData r:id="%s"><c:autoUpdate val="0"/></c:externalDa'
+            'ta></c:chartSpace>' % xlsx_rId
+        ).encode('utf-8')
+        head, _, tail = chart_blob.rpartition(b'</c:chartSpace>')
+        return head + externalData_xml + tail
+
+    @property
+    def _element(self):
+        """
+        The `c:chartSpace` root element of this part, parsed from the
+        generated chart XML on first access.
+        """
+        if self._chartSpace is None:
+            self._chartSpace = parse_xml(self._blob)
+            self._blob = None
+        return self._chartSpace
+
+    @_element.setter
+    def _element(self, chartSpace):
+        self._chartSpace = chartSpace
+
 
 class ChartWorkbook(object):
     """
@@ -6,6 +6,8 @@ Presentation part, the main part in a .pptx package.
 
 from __future__ import absolute_import
 
+from copy import deepcopy
+
 from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
@@ -30,6 +32,29 @@ class PresentationPart(XmlPart):
         rId = self.relate_to(slide_part, RT.SLIDE)
         return rId, slide_part.slide
 
+    def add_slides(self, slide_layout, sld, count):
+        """
+        Return a list of *count* (rId, slide) pairs, one for each newly
+        created slide inheriting appearance from *slide_layout* and having
+        a copy of the ``<p:sld>`` element *sld* as its content. The slides
+        are to be appended to the slide list in that order. Partnames and
+        rIds are allocated for the whole batch at once.
+        """
+        slide_count = len(self._element.get_or_add_sldIdLst())
+        slide_layout_part = slide_layout.part
+        slide_parts = [
+            SlidePart.new(
+                PackURI('/ppt/slides/slide%d.xml' % (slide_count + n)),
+                self.package, slide_layout_part, deepcopy(sld)
+            )
+            for n in range(1, count + 1)
+        ]
+        rIds = self.rels.add_relationships(RT.SLIDE, slide_parts)
+        return [
+            (rId, slide_part.slide)
+            for rId, slide_part in zip(rIds, slide_parts)
+        ]
+
     @property
     def core_properties(self):
         """
@@ -38,15 +63,31 @@ class PresentationPart(XmlPart):
         """
         return self.package.core_properties
 
+    def duplicate_slide(self, slide_part, copy_notes=True):
+        """
+        Return an (rId, slide) pair for a newly created slide that is
+        a duplicate of the slide in *slide_part*. The new slide shares images,
+        media and its slide layout with the original and has its own copy of
+        each chart and, when *copy_notes* is |True|, of the notes slide.
+        """
+        new_slide_part = SlidePart(
+            self._next_slide_partname, slide_part.content_type,
+            deepcopy(slide_part._element), self.package
+        )
+        rId = self.relate_to(new_slide_part, RT.SLIDE)
+        new_slide_part.copy_relationships(slide_part, copy_notes)
+        return rId, new_slide_part.slide
+
     def get_slide(self, slide_id):
         """
         Return the |Slide| object identified by *slide_id* (in this
         presentation), or |None| if not found.
         """
-        for sldId in self._element.sldIdLst:
-            if sldId.id == slide_id:
-                return self.related_parts[sldId.rId].slide
-        return None
+        entry = self._slide_lookup.find_by_id(slide_id)
+        if entry is None:
+            return None
+        slide_part = entry[3]
+        return slide_part.slide
 
     @lazyproperty
     def notes_master(self):
@@ -95,6 +136,41 @@ class PresentationPart(XmlPart):
         """
         return self.related_parts[rId].slide_master
 
+    def remove_slide(self, slide_part):
+        """
+        Remove the slide in *slide_part* from this presentation. Its entry in
+        the slide list, any section lists and any custom shows is removed,
+        along with its relationship and each relationship from another slide
+        or its notes slide to it, such as a hyperlink. Parts that are then no
+        longer reachable, such as the notes slide and charts of the removed
+        slide and any image used only by it, are no longer saved with the
+        package. The remaining slide parts are renamed to keep their
+        numbering continuous. Raises |ValueError| if *slide_part* is not
+        a slide in this presentation.
+        """
+        sldIdLst = self._element.get_or_add_sldIdLst()
+        for sldId in sldIdLst.sldId_lst:
+            if self.related_parts[sldId.rId] is slide_part:
+                break
+        else:
+            raise ValueError('slide is not in this presentation')
+
+        sldIdLst.remove(sldId)
+        self.reset_slide_lookup()
+        for section_sldId in self._element.xpath(
+                './p:extLst//*[local-name()="sldId"][@id="%d"]' % sldId.id):
+            section_sldId.getparent().remove(section_sldId)
+        for custShow_sld in self._element.xpath(
+                './p:custShowLst/p:custShow/p:sldLst/p:sld[@r:id="%s"]' %
+                sldId.rId):
+            custShow_sld.getparent().remove(custShow_sld)
+        del self.rels[sldId.rId]
+
+        rIds = [sldId.rId for sldId in sldIdLst]
+        for rId in rIds:
+            self.related_parts[rId].drop_rels_to(slide_part)
+        self.rename_slide_parts(rIds)
+
     def rename_slide_parts(self, rIds):
         """
         Assign incrementing partnames like ``/ppt/slides/slide9.xml`` to the
@@ -109,23 +185,44 @@ class PresentationPart(XmlPart):
                 '/ppt/slides/slide%d.xml' % (idx+1)
             )
 
-    def save(self, path_or_stream):
+    def reset_slide_lookup(self):
+        """
+        Discard the slide lookup maps of this presentation, to be rebuilt on
+        next use. Called after each change to the slide list that moves
+        slides to a new position, so the lookup need not discover each
+        displaced entry in turn.
+        """
+        self._slide_lookup.reset()
+
+    def save(self, path_or_stream, minify=False):
         """
         Save this presentation package to *path_or_stream*, which can be
         either a path to a filesystem location (a string) or a file-like
-        object.
+        object. The XML of each part is minified first when *minify* is
+        |True|, in which case a dict of bytes saved by content type is
+        returned.
         """
-        self.package.save(path_or_stream)
+        return self.package.save(path_or_stream, minify)
 
     def slide_id(self, slide_part):
         """
         Return the slide identifier associated with *slide_part* in this
         presentation.
         """
-        for sldId in self._element.sldIdLst:
-            if self.related_parts[sldId.rId] is slide_part:
-                return sldId.id
-        raise ValueError('matching slide_part not found')
+        entry = self._slide_lookup.find_by_part(slide_part)
+        if entry is None:
+            raise ValueError('matching slide_part not found')
+        return entry[1]
+
+    def slide_index(self, slide_part):
+        """
+        Return the zero-based position of the slide in *slide_part* in the
+        slide list of this presentation.
+        """
+        entry = self._slide_lookup.find_by_part(slide_part)
+        if entry is None:
+            raise ValueError('matching slide_part not found')
+        return entry[2]
 
     @property
     def _next_slide_partname(self):
@@ -137,3 +234,95 @@ class PresentationPart(XmlPart):
         sldIdLst = self._element.get_or_add_sldIdLst()
         partname_str = '/ppt/slides/slide%d.xml' % (len(sldIdLst)+1)
         return PackURI(partname_str)
+
+    @lazyproperty
+    def _slide_lookup(self):
+        """
+        |_SlideLookup| object mapping the slide ids and slide parts of this
+        presentation to their entry in its slide list.
+        """
+        return _SlideLookup(self)
+
+
+class _SlideLookup(object):
+    """
+    Maps each slide id and slide part in a presentation to its entry in the
+    slide list, an (sldId, slide_id, idx, slide_part) 4-tuple, so a slide can
+    be located without a scan of the slide list. The maps are built on first
+    use and rebuilt after a reset, after any change to the children of the
+    ``<p:sldIdLst>`` element, when a key is missing, or when the entry found
+    no longer refers to the same slide, as after a change made directly to
+    its attributes.
+    """
+    def __init__(self, presentation_part):
+        super(_SlideLookup, self).__init__()
+        self._presentation_part = presentation_part
+        self._sldIdLst = None
+        self._version = None
+        self._entries_by_id = {}
+        self._entries_by_part = {}
+
+    def find_by_id(self, slide_id):
+        """
+        Return the entry for the slide identified by *slide_id*, or |None| if
+        there is no such slide.
+        """
+        entry = self._entries_by_id.get(slide_id)
+        if entry is None or not self._is_current(entry):
+            self._build()
+            entry = self._entries_by_id.get(slide_id)
+        return entry
+
+    def find_by_part(self, slide_part):
+        """
+        Return the entry for the slide in *slide_part*, or |None| if that
+        slide is not in the slide list.
+        """
+        entry = self._entries_by_part.get(slide_part)
+        if entry is None or not self._is_current(entry):
+            self._build()
+            entry = self._entries_by_part.get(slide_part)
+        return entry
+
+    def reset(self):
+        """
+        Discard all entries, causing the maps to be rebuilt on next use.
+        """
+        self._sldIdLst = None
+        self._version = None
+        self._entries_by_id = {}
+        self._entries_by_part = {}
+
+    def _build(self):
+        """
+        Populate the maps from a single pass over the slide list.
+        """
+        self.reset()
+        sldIdLst = self._presentation_part._element.sldIdLst
+        if sldIdLst is None:
+            return
+        self._sldIdLst = sldIdLst
+        self._version = sldIdLst.version
+        related_parts = self._presentation_part.related_parts
+        for idx, sldId in enumerate(sldIdLst.sldId_lst):
+            slide_part = related_parts.get(sldId.rId)
+            entry = (sldId, sldId.id, idx, slide_part)
+            self._entries_by_id[sldId.id] = entry
+            self._entries_by_part[slide_part] = entry
+
+    def _is_current(self, entry):
+        """
+        Return |True| if the slide list has not changed since the maps were
+        built and the ``<p:sldId>`` element of *entry* still has the same
+        slide id and refers to the same slide part. Each test takes constant
+        time, so a hit does not scan the slide list.
+        """
+        sldId, slide_id, idx, slide_part = entry
+        sldIdLst = self._presentation_part._element.sldIdLst
+        return (
+            sldIdLst is self._sldIdLst and
+            sldIdLst.version == self._version and
+            sldId.id == slide_id and
+            self._presentation_part.related_parts.get(sldId.rId) is
+            slide_part
+        )
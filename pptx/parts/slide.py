@@ -8,10 +8,14 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from contextlib import contextmanager
+from copy import deepcopy
+
 from .chart import ChartPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
+from ..oxml.ns import qn
 from ..oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from ..oxml.theme import CT_OfficeStyleSheet
 from ..slide import NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
@@ -23,6 +27,41 @@ class BaseSlidePart(XmlPart):
     Base class for slide parts, e.g. slide, slideLayout, slideMaster,
     notesSlide, notesMaster, and handoutMaster.
     """
+    @contextmanager
+    def deferred_group_extents(self):
+        """
+        Context manager that defers recalculation of group shape extents in
+        this part until the end of the `with` block.
+
+        Within the block, :meth:`recalculate_group_extents` only records the
+        group. On exit, each recorded group and each group containing one is
+        recalculated exactly once, working upward from the most deeply nested
+        so each group is adjusted after all the groups it contains. Nested
+        uses of this context manager are folded into the outermost one.
+        """
+        if self._pending_grpSps is not None:
+            yield
+            return
+        self._pending_grpSps = set()
+        try:
+            yield
+        finally:
+            grpSps, self._pending_grpSps = self._pending_grpSps, None
+            self._recalculate_extents_bottom_up(grpSps)
+
+    def drop_rels_to(self, part):
+        """
+        Remove each relationship from this part to *part*, such as the
+        target of a hyperlink to another slide, along with each element in
+        this part that refers to it, so no reference to *part* remains.
+        """
+        for rel in list(self.rels.values()):
+            if rel.is_external or rel.target_part is not part:
+                continue
+            for elm in self._element.xpath('//*[@r:id="%s"]' % rel.rId):
+                elm.getparent().remove(elm)
+            del self.rels[rel.rId]
+
     def get_image(self, rId):
         """
         Return an |Image| object containing the image related to this slide
@@ -50,6 +89,110 @@ class BaseSlidePart(XmlPart):
         """
         return self._element.cSld.name
 
+    def next_shape_id(self):
+        """
+        Return a shape id not yet used in this part, suitable for a new shape.
+
+        Ids are allocated sequentially from one greater than the maximum id
+        in the part XML, which is found by a single scan on the first call.
+        Because every shape collection on this part allocates from here, ids
+        remain unique however many slide or shape collection objects are
+        used to add shapes. A shape element added to the XML by other means
+        should be given an id obtained from this method.
+        """
+        return self.next_shape_ids(1)[0]
+
+    def next_shape_ids(self, count):
+        """
+        Return a sequence of *count* consecutive shape ids not yet used in
+        this part, allocated in the same way as :meth:`next_shape_id`.
+        """
+        if self._max_shape_id is None:
+            self._max_shape_id = self._element.spTree.max_shape_id
+        first_id = self._max_shape_id + 1
+        self._max_shape_id += count
+        return range(first_id, first_id + count)
+
+    def next_shape_name(self, basename, numpart):
+        """
+        Return a shape name like 'Title 3', formed from *basename* and
+        *numpart*, that is not yet used in this part. *numpart* is
+        incremented as necessary to make the name unique. The returned name
+        is reserved so it will not be returned again.
+
+        Names in use are collected by a single scan of the part XML on the
+        first call and kept up to date as names are allocated, registered
+        and unregistered, without scanning the XML again. The largest
+        number used with each base name is tracked too, so a name numbered
+        beyond it is known to be unique without further checking, which is
+        the usual case since *numpart* is generally derived from a newly
+        allocated shape id.
+        """
+        return self._shape_names.next_name(basename, numpart)
+
+    def register_shape_name(self, name):
+        """
+        Record that shape name *name* is in use in this part, so it is not
+        returned by :meth:`next_shape_name`. A shape renamed other than by
+        assigning to :attr:`.BaseShape.name` should have its new name
+        registered using this method, as should the name of a shape added
+        by changing the XML directly.
+        """
+        self._shape_names.add(name)
+
+    def unregister_shape_name(self, name):
+        """
+        Record that one shape named *name* is no longer in this part, so the
+        name may be returned by :meth:`next_shape_name` once no shape uses
+        it. A shape removed or renamed by changing the XML directly should
+        have its old name unregistered using this method.
+        """
+        self._shape_names.remove(name)
+
+    def recalculate_group_extents(self, grpSp):
+        """
+        Adjust the position and size of group shape element *grpSp*, and of
+        any group containing it, to incorporate all the shapes it contains.
+        Within a :meth:`deferred_group_extents` block, the recalculation is
+        postponed until the block exits.
+        """
+        if self._pending_grpSps is None:
+            grpSp.recalculate_extents()
+            return
+        self._pending_grpSps.add(grpSp)
+
+    # ---maximum shape id allocated so far, |None| until first allocation---
+    _max_shape_id = None
+
+    # ---group shape elements awaiting extent recalculation, |None| when
+    #    recalculation is not deferred---
+    _pending_grpSps = None
+
+    @staticmethod
+    def _recalculate_extents_bottom_up(grpSps):
+        """
+        Recalculate the extents of each group shape element in *grpSps* and
+        of each group containing one, once each, innermost first.
+        """
+        grpSp_tag = qn('p:grpSp')
+        stale = set()
+        for grpSp in grpSps:
+            stale.add(grpSp)
+            stale.update(grpSp.iterancestors(grpSp_tag))
+
+        def depth(grpSp):
+            return sum(1 for _ in grpSp.iterancestors(grpSp_tag))
+
+        for grpSp in sorted(stale, key=depth, reverse=True):
+            grpSp.recalculate_extents(recursive=False)
+
+    @lazyproperty
+    def _shape_names(self):
+        """
+        `_ShapeNames` registry of the shape names used in this part.
+        """
+        return _ShapeNames(self._element)
+
 
 class NotesMasterPart(BaseSlidePart):
     """
@@ -118,6 +261,30 @@ class NotesSlidePart(BaseSlidePart):
         notes_slide.clone_master_placeholders(notes_master_part.notes_master)
         return notes_slide_part
 
+    def clone(self, slide_part):
+        """
+        Return a new |NotesSlidePart| instance containing a copy of this notes
+        slide and related to *slide_part* in place of the slide this notes
+        slide belongs to. Other related parts, such as the notes master, are
+        shared with the copy.
+        """
+        package = self.package
+        partname = package.next_partname('/ppt/notesSlides/notesSlide%d.xml')
+        notes_slide_part = NotesSlidePart(
+            partname, self.content_type, deepcopy(self._element), package
+        )
+        for rel in self.rels.values():
+            if rel.is_external:
+                target = rel.target_ref
+            elif rel.reltype == RT.SLIDE:
+                target = slide_part
+            else:
+                target = rel.target_part
+            notes_slide_part.rels.add_relationship(
+                rel.reltype, target, rel.rId, rel.is_external
+            )
+        return notes_slide_part
+
     @lazyproperty
     def notes_master(self):
         """
@@ -155,12 +322,15 @@ class SlidePart(BaseSlidePart):
     Slide part. Corresponds to package files ppt/slides/slide[1-9][0-9]*.xml.
     """
     @classmethod
-    def new(cls, partname, package, slide_layout_part):
+    def new(cls, partname, package, slide_layout_part, sld=None):
         """
         Return a newly-created blank slide part having *partname* and related
-        to *slide_layout_part*.
+        to *slide_layout_part*. When *sld* is provided, that ``<p:sld>``
+        element is used as the content of the new part in place of a new
+        blank slide.
         """
-        sld = CT_Slide.new()
+        if sld is None:
+            sld = CT_Slide.new()
         slide_part = cls(partname, CT.PML_SLIDE, sld, package)
         slide_part.relate_to(slide_layout_part, RT.SLIDE_LAYOUT)
         return slide_part
@@ -175,6 +345,42 @@ class SlidePart(BaseSlidePart):
         rId = self.relate_to(chart_part, RT.CHART)
         return rId
 
+    def copy_relationships(self, slide_part, copy_notes=True):
+        """
+        Add to this part a relationship matching each of those of
+        *slide_part*, having the same rId so a copy of the XML of that slide
+        refers to the same content. The slide layout, images, media and other
+        shared parts are related as-is, without copying them. Each chart is
+        copied, along with its embedded workbook, so it can be edited apart
+        from the original. The notes slide is copied when *copy_notes* is
+        |True| and omitted otherwise. This part must already be related
+        within the package so each copied part receives a unique partname.
+        """
+        for rel in slide_part.rels.values():
+            if rel.is_external:
+                target = rel.target_ref
+            elif rel.reltype == RT.NOTES_SLIDE:
+                if not copy_notes:
+                    continue
+                target = rel.target_part.clone(self)
+            elif rel.reltype == RT.CHART:
+                target = rel.target_part.clone()
+            else:
+                target = rel.target_part
+            self.rels.add_relationship(
+                rel.reltype, target, rel.rId, rel.is_external
+            )
+
+    def drop_rels_to(self, part):
+        """
+        Remove each relationship from this slide to *part*, along with each
+        element referring to it, as :meth:`BaseSlidePart.drop_rels_to` does,
+        and do the same for the notes slide of this slide, if it has one.
+        """
+        super(SlidePart, self).drop_rels_to(part)
+        if self.has_notes_slide:
+            self.part_related_by(RT.NOTES_SLIDE).drop_rels_to(part)
+
     def get_or_add_video_media_part(self, video):
         """Return rIds for media and video relationships to media part.
 
@@ -290,3 +496,83 @@ class SlideMasterPart(BaseSlidePart):
         The |SlideMaster| object representing this part.
         """
         return SlideMaster(self._element, self)
+
+
+class _ShapeNames(object):
+    """
+    Registry of the shape names used in a slide-type part, built by a single
+    scan of the part XML on first use.
+
+    The registry is kept up to date incrementally rather than by scanning the
+    XML again. Names allocated by :meth:`next_name` are registered as they
+    are allocated, and a shape renamed by assigning to :attr:`.BaseShape.name`
+    has its old name unregistered and its new name registered. The names
+    given to shapes added in bulk or to movies are registered as they are
+    added. Other shapes are named from a newly allocated shape id using
+    a base name, like 'TextBox', that no placeholder name uses, so those
+    names are not registered. A shape added, removed or renamed by changing
+    the XML directly should have its name registered or unregistered by the
+    caller. Each name is counted, so a name used by more than one shape
+    remains registered until each of those shapes is gone.
+    """
+
+    def __init__(self, element):
+        super(_ShapeNames, self).__init__()
+        self._element = element
+        self._counts = None
+
+    def add(self, name):
+        """
+        Register *name* as in use.
+        """
+        self._ensure_built()
+        self._add(name)
+
+    def next_name(self, basename, numpart):
+        """
+        Return and register the first unused name formed from *basename*
+        and *numpart* or a greater number.
+        """
+        self._ensure_built()
+        if numpart <= self._max_numparts.get(basename, -1):
+            while '%s %d' % (basename, numpart) in self._counts:
+                numpart += 1
+        name = '%s %d' % (basename, numpart)
+        self._add(name)
+        return name
+
+    def remove(self, name):
+        """
+        Unregister one use of *name*. A name not registered is ignored. The
+        largest number tracked for its base name is left unchanged, which
+        only causes names at or below it to be checked before use.
+        """
+        self._ensure_built()
+        count = self._counts.get(name, 0)
+        if count > 1:
+            self._counts[name] = count - 1
+        elif count:
+            del self._counts[name]
+
+    def _add(self, name):
+        """
+        Register one use of *name*, tracking the number it ends with, if any.
+        """
+        self._counts[name] = self._counts.get(name, 0) + 1
+        basename, _, numpart = name.rpartition(' ')
+        if basename and numpart.isdigit():
+            self._max_numparts[basename] = max(
+                int(numpart), self._max_numparts.get(basename, -1)
+            )
+
+    def _ensure_built(self):
+        """
+        Populate the registry from the part XML if not yet done.
+        """
+        if self._counts is not None:
+            return
+        self._counts, self._max_numparts = {}, {}
+        for cNvPr in self._element.iter(qn('p:cNvPr')):
+            name = cNvPr.get('name')
+            if name is not None:
+                self._add(name)
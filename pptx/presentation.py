@@ -8,6 +8,9 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from .rescale import (
+    rescale_part_element, rescale_transform, scale_font_sizes
+)
 from .shared import PartElementProxy
 from .slide import SlideMasters, Slides
 from .util import lazyproperty
@@ -38,12 +41,84 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file):
+    def iter_tables(self):
+        """
+        Generate each |Table| object on the slides of this presentation, in
+        slide order and then in the document order of the shapes on each
+        slide. Only tables that are direct children of a slide, and not
+        within a group shape, are generated.
+        """
+        for slide in self.slides:
+            for shape in slide.shapes:
+                if shape.has_table:
+                    yield shape.table
+
+    def rescale(self, new_width, new_height, mode='fit', scale_fonts=False):
+        """
+        Change the slide size of this presentation to *new_width* by
+        *new_height* (EMU), moving and resizing the shapes on every slide,
+        slide layout and slide master to suit.
+
+        *mode* determines how shapes are placed on the new slide size:
+        ``'fit'`` (the default) scales them uniformly to fit and centers
+        them, ``'stretch'`` scales each axis independently to fill the new
+        size, and ``'center'`` centers them without scaling. Shapes within
+        a group are moved and sized along with the group.
+
+        When *scale_fonts* is |True|, each explicit font size in those parts
+        and in the default text style of the presentation is also scaled, by
+        the smaller of the horizontal and vertical scale factors. Raises
+        |ValueError| when this presentation has no slide size defined or
+        *mode* is not recognized.
+        """
+        width, height = self.slide_width, self.slide_height
+        if not width or not height:
+            raise ValueError('presentation has no slide size to rescale')
+        if new_width <= 0 or new_height <= 0:
+            raise ValueError('new slide size must be positive')
+        transform = rescale_transform(
+            width, height, new_width, new_height, mode
+        )
+        font_scale = (
+            min(transform[0], transform[2]) if scale_fonts else None
+        )
+
+        for slide_master in self.slide_masters:
+            rescale_part_element(
+                slide_master._element, transform, font_scale
+            )
+            for slide_layout in slide_master.slide_layouts:
+                rescale_part_element(
+                    slide_layout._element, transform, font_scale
+                )
+        for slide in self.slides:
+            rescale_part_element(slide._element, transform, font_scale)
+        if font_scale is not None:
+            scale_font_sizes(self._element, font_scale)
+
+        self.slide_width, self.slide_height = new_width, new_height
+
+    def save(self, file, minify=False):
         """
         Save this presentation to *file*, where *file* can be either a path
         to a file (a string) or a file-like object.
+
+        When *minify* is |True|, the XML of each part is made as compact as
+        possible before it is written. Namespace declarations are hoisted to
+        the root element of each part, redundant and unused ones are
+        removed, and ignorable whitespace is stripped. In that case a dict
+        is returned that maps each part content type to the number of bytes
+        saved across the parts of that type, for example::
+
+            >>> savings = prs.save('deck.pptx', minify=True)
+            >>> sum(savings.values())
+            48213
+
+        Bytes saved are counted as each part is written, against the size of
+        the part as read from the original package, so a part added since is
+        not included and one enlarged by editing may show a negative saving.
         """
-        self.part.save(file)
+        return self.part.save(file, minify)
 
     @property
     def slide_height(self):
@@ -0,0 +1,127 @@
+# encoding: utf-8
+
+"""Rescaling of slide content to suit a new slide size."""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+from array import array
+
+from pptx.oxml.ns import qn
+from pptx.util import Emu
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def rescale_part_element(element, transform, font_scale=None):
+    """Apply *transform* to the shapes in part root *element*.
+
+    *element* is the root element of a slide, slide layout or slide master
+    part. *transform* is an `(sx, tx, sy, ty)` 4-tuple like those produced
+    by :func:`rescale_transform`. The offset and extent of each shape in
+    the shape tree are transformed in one vectorized step. Shapes within a
+    group shape are not visited; they follow their group because the child
+    coordinate space of the group is left unchanged. A connector is moved
+    and sized like any other shape, which carries its endpoints with it.
+    The column widths and row heights of a table are scaled along with its
+    graphic frame so the table continues to fill the frame.
+
+    When *font_scale* is provided, each explicit font size in the part is
+    multiplied by it as well.
+    """
+    offs, exts, tbls = [], [], []
+    graphicFrame_tag = qn('p:graphicFrame')
+    for shape_elm in element.cSld.spTree.iter_shape_elms():
+        xfrm = shape_elm.xfrm
+        if xfrm is None:
+            continue
+        if xfrm.off is not None:
+            offs.append(xfrm.off)
+        if xfrm.ext is not None:
+            exts.append(xfrm.ext)
+        if shape_elm.tag == graphicFrame_tag and shape_elm.has_table:
+            tbl = shape_elm.graphic.graphicData.tbl
+            if tbl is not None:
+                tbls.append(tbl)
+
+    sx, tx, sy, ty = transform
+    _set_values(offs, 'x', 'y', _scaled(offs, 'x', 'y', sx, tx, sy, ty))
+    _set_values(exts, 'cx', 'cy', _scaled(exts, 'cx', 'cy', sx, 0, sy, 0))
+    for tbl in tbls:
+        for gridCol in tbl.tblGrid.gridCol_lst:
+            gridCol.w = Emu(int(round(gridCol.w * sx)))
+        for tr in tbl.tr_lst:
+            tr.h = Emu(int(round(tr.h * sy)))
+
+    if font_scale is not None:
+        scale_font_sizes(element, font_scale)
+
+
+def rescale_transform(width, height, new_width, new_height, mode):
+    """Return `(sx, tx, sy, ty)` mapping a slide onto a new slide size.
+
+    *mode* is 'stretch' to scale each axis independently so the content
+    fills the new slide, 'fit' to scale both axes by the same factor so the
+    content fits within the new slide and is centered on it, or 'center' to
+    center the content unscaled.
+    """
+    if mode == 'stretch':
+        return (new_width / width, 0.0, new_height / height, 0.0)
+    if mode == 'fit':
+        scale = min(new_width / width, new_height / height)
+    elif mode == 'center':
+        scale = 1.0
+    else:
+        raise ValueError(
+            "mode must be 'fit', 'stretch' or 'center', got %r" % mode
+        )
+    return (
+        scale, (new_width - width * scale) / 2,
+        scale, (new_height - height * scale) / 2,
+    )
+
+
+def scale_font_sizes(element, factor):
+    """Multiply each explicit font size within *element* by *factor*.
+
+    Sizes are rounded to the nearest hundredth of a point and kept within
+    the 1 to 4000 point range allowed for a font size.
+    """
+    for rPr in element.xpath(
+        './/a:rPr[@sz]|.//a:defRPr[@sz]|.//a:endParaRPr[@sz]'
+    ):
+        sz = int(round(int(rPr.get('sz')) * factor))
+        rPr.set('sz', str(min(max(sz, 100), 400000)))
+
+
+def _scaled(elms, x_name, y_name, sx, tx, sy, ty):
+    """Return the transformed integer (x, y) values of each of *elms*.
+
+    Values are read from the *x_name* and *y_name* attributes of each
+    element and returned as a flat sequence, x and y of each element in
+    turn.
+    """
+    values = array('d')
+    for elm in elms:
+        values.append(float(elm.get(x_name)))
+        values.append(float(elm.get(y_name)))
+    if numpy is None:
+        return [
+            int(round(v * sx + tx)) if i % 2 == 0 else
+            int(round(v * sy + ty))
+            for i, v in enumerate(values)
+        ]
+    points = numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, 2)
+    points = numpy.rint(points * (sx, sy) + (tx, ty))
+    return points.astype(numpy.int64).ravel().tolist()
+
+
+def _set_values(elms, x_name, y_name, values):
+    """Write the flat (x, y) integer *values* back to each of *elms*."""
+    for idx, elm in enumerate(elms):
+        elm.set(x_name, str(values[2 * idx]))
+        elm.set(y_name, str(values[2 * idx + 1]))
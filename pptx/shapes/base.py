@@ -132,7 +132,16 @@ class BaseShape(object):
 
     @name.setter
     def name(self, value):
-        self._element._nvXxPr.cNvPr.name = value
+        cNvPr = self._element._nvXxPr.cNvPr
+        old_value = cNvPr.name
+        cNvPr.name = value
+        parent_elm = self._element.getparent()
+        if parent_elm is not None:
+            parent_elm.increment_version()
+        part = None if self._parent is None else self._parent.part
+        if part is not None:
+            part.unregister_shape_name(old_value)
+            part.register_shape_name(value)
 
     @property
     def part(self):
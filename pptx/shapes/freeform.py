@@ -6,9 +6,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from array import array
 from collections import Sequence
 
-from pptx.util import lazyproperty
+# ---drawing operation codes, as stored in `FreeformBuilder._ops`---
+_MOVE_TO, _LINE_TO, _CLOSE = 0, 1, 2
 
 
 class FreeformBuilder(Sequence):
@@ -32,15 +34,32 @@ class FreeformBuilder(Sequence):
         self._start_y = start_y
         self._x_scale = x_scale
         self._y_scale = y_scale
+        # ---drawing operations are stored as parallel arrays of operation
+        #    code and (x, y) location, a close operation having location
+        #    (0, 0). The extents of the points drawn, as a (min_x, min_y,
+        #    max_x, max_y) 4-tuple, are maintained as operations are added.
+        #    The pen start position is included only when extents are read,
+        #    so it can still be changed after construction.---
+        self._ops = array('b')
+        self._xs = array('d')
+        self._ys = array('d')
+        self._extents = None
 
     def __getitem__(self, idx):
-        return self._drawing_operations.__getitem__(idx)
+        if isinstance(idx, slice):
+            return [self._operation(i) for i in range(len(self))[idx]]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('drawing operation index out of range')
+        return self._operation(idx)
 
     def __iter__(self):
-        return self._drawing_operations.__iter__()
+        for idx in range(len(self)):
+            yield self._operation(idx)
 
     def __len__(self):
-        return self._drawing_operations.__len__()
+        return len(self._ops)
 
     @classmethod
     def new(cls, shapes, start_x, start_y, x_scale, y_scale):
@@ -54,19 +73,31 @@ class FreeformBuilder(Sequence):
             x_scale, y_scale
         )
 
-    def add_line_segments(self, vertices, close=True):
+    def add_line_segments(self, vertices, close=True, tolerance=None):
         """Add a straight line segment to each point in *vertices*.
 
-        *vertices* must be an iterable of (x, y) pairs (2-tuples). Each x and
-        y value is rounded to the nearest integer before use. The optional
-        *close* parameter determines whether the resulting contour is
-        *closed* or left *open*.
+        *vertices* must be an iterable of (x, y) pairs (2-tuples), or a
+        two-dimensional NumPy array having one (x, y) row per point. Each x
+        and y value is rounded to the nearest integer before use. The
+        optional *close* parameter determines whether the resulting contour
+        is *closed* or left *open*.
+
+        When *tolerance* is provided, the line through *vertices* is first
+        simplified using the Ramer-Douglas-Peucker algorithm, omitting
+        vertices that lie within *tolerance* (in local units) of the
+        simplified line. The first and last vertices are always kept.
 
         Returns this |FreeformBuilder| object so it can be used in chained
         calls.
         """
-        for x, y in vertices:
-            self._add_line_segment(x, y)
+        if getattr(vertices, 'ndim', None) == 2:
+            vertices = vertices.tolist()
+        points = [(int(round(x)), int(round(y))) for x, y in vertices]
+        if tolerance:
+            points = _simplify(points, tolerance)
+        self._add_operations(
+            _LINE_TO, [x for x, _ in points], [y for _, y in points]
+        )
         if close:
             self._add_close()
         return self
@@ -83,8 +114,7 @@ class FreeformBuilder(Sequence):
         """
         sp = self._add_freeform_sp(origin_x, origin_y)
         path = self._start_path(sp)
-        for drawing_operation in self:
-            drawing_operation.apply_operation_to(path)
+        path.add_operations(self._iter_path_operations())
         return self._shapes._shape_factory(sp)
 
     def move_to(self, x, y):
@@ -93,7 +123,9 @@ class FreeformBuilder(Sequence):
         Returns this |FreeformBuilder| object so it can be used in chained
         calls.
         """
-        self._drawing_operations.append(_MoveTo.new(self, x, y))
+        self._add_operations(
+            _MOVE_TO, [int(round(x))], [int(round(y))]
+        )
         return self
 
     @property
@@ -104,11 +136,7 @@ class FreeformBuilder(Sequence):
         shape, in local coordinates. Note that the bounding box of the shape
         need not start at the local origin.
         """
-        min_x = self._start_x
-        for drawing_operation in self:
-            if hasattr(drawing_operation, 'x'):
-                min_x = min(min_x, drawing_operation.x)
-        return min_x
+        return self._min_x
 
     @property
     def shape_offset_y(self):
@@ -118,15 +146,13 @@ class FreeformBuilder(Sequence):
         shape, in local coordinates. Note that the bounding box of the shape
         need not start at the local origin.
         """
-        min_y = self._start_y
-        for drawing_operation in self:
-            if hasattr(drawing_operation, 'y'):
-                min_y = min(min_y, drawing_operation.y)
-        return min_y
+        return self._min_y
 
     def _add_close(self):
-        """Add a close |_Close| operation to the drawing sequence."""
-        self._drawing_operations.append(_Close.new())
+        """Add a close operation to the drawing sequence."""
+        self._ops.append(_CLOSE)
+        self._xs.append(0)
+        self._ys.append(0)
 
     def _add_freeform_sp(self, origin_x, origin_y):
         """Add a freeform `p:sp` element having no drawing elements.
@@ -135,41 +161,46 @@ class FreeformBuilder(Sequence):
         represent the location of the local coordinates origin on the slide.
         """
         spTree = self._shapes._spTree
+        id_ = self._shapes._next_shape_id
         return spTree.add_freeform_sp(
+            id_, 'Freeform %d' % (id_-1),
             origin_x + self._left,
             origin_y + self._top,
             self._width,
             self._height
         )
 
-    def _add_line_segment(self, x, y):
-        """Add a |_LineSegment| operation to the drawing sequence."""
-        self._drawing_operations.append(_LineSegment.new(self, x, y))
+    def _add_operations(self, op, xs, ys):
+        """Add an *op* operation to the drawing sequence for each point.
 
-    @lazyproperty
-    def _drawing_operations(self):
-        """Return the sequence of drawing operation objects for freeform."""
-        return []
+        *xs* and *ys* are sequences of integer x and y values of the same
+        length, in local coordinates. The shape extents are updated to
+        include the added points.
+        """
+        if not xs:
+            return
+        self._ops.extend(array('b', [op]) * len(xs))
+        self._xs.extend(xs)
+        self._ys.extend(ys)
+        extents = (min(xs), min(ys), max(xs), max(ys))
+        if self._extents is not None:
+            extents = (
+                min(self._extents[0], extents[0]),
+                min(self._extents[1], extents[1]),
+                max(self._extents[2], extents[2]),
+                max(self._extents[3], extents[3]),
+            )
+        self._extents = extents
 
     @property
     def _dx(self):
         """Return integer width of this shape's path in local units."""
-        min_x = max_x = self._start_x
-        for drawing_operation in self:
-            if hasattr(drawing_operation, 'x'):
-                min_x = min(min_x, drawing_operation.x)
-                max_x = max(max_x, drawing_operation.x)
-        return max_x - min_x
+        return self._max_x - self._min_x
 
     @property
     def _dy(self):
         """Return integer height of this shape's path in local units."""
-        min_y = max_y = self._start_y
-        for drawing_operation in self:
-            if hasattr(drawing_operation, 'y'):
-                min_y = min(min_y, drawing_operation.y)
-                max_y = max(max_y, drawing_operation.y)
-        return max_y - min_y
+        return self._max_y - self._min_y
 
     @property
     def _height(self):
@@ -190,6 +221,18 @@ class FreeformBuilder(Sequence):
         """
         return int(round(self.shape_offset_x * self._x_scale))
 
+    def _iter_path_operations(self):
+        """Generate a `(tag, x, y)` 3-tuple for each drawing operation.
+
+        *tag* is the tag of the path element implementing the operation,
+        like 'a:lnTo', and *x* and *y* locate the operation in shape
+        coordinates.
+        """
+        tags = {_MOVE_TO: 'a:moveTo', _LINE_TO: 'a:lnTo', _CLOSE: 'a:close'}
+        offset_x, offset_y = self.shape_offset_x, self.shape_offset_y
+        for op, x, y in zip(self._ops, self._xs, self._ys):
+            yield tags[op], int(x) - offset_x, int(y) - offset_y
+
     def _local_to_shape(self, local_x, local_y):
         """Translate local coordinates point to shape coordinates.
 
@@ -202,6 +245,42 @@ class FreeformBuilder(Sequence):
             local_y - self.shape_offset_y
         )
 
+    @property
+    def _max_x(self):
+        """Return rightmost x of the pen start position and points drawn."""
+        if self._extents is None:
+            return self._start_x
+        return max(self._start_x, self._extents[2])
+
+    @property
+    def _max_y(self):
+        """Return bottommost y of the pen start position and points drawn."""
+        if self._extents is None:
+            return self._start_y
+        return max(self._start_y, self._extents[3])
+
+    @property
+    def _min_x(self):
+        """Return leftmost x of the pen start position and points drawn."""
+        if self._extents is None:
+            return self._start_x
+        return min(self._start_x, self._extents[0])
+
+    @property
+    def _min_y(self):
+        """Return topmost y of the pen start position and points drawn."""
+        if self._extents is None:
+            return self._start_y
+        return min(self._start_y, self._extents[1])
+
+    def _operation(self, idx):
+        """Return drawing operation object for the operation at *idx*."""
+        op = self._ops[idx]
+        if op == _CLOSE:
+            return _Close()
+        cls = _MoveTo if op == _MOVE_TO else _LineSegment
+        return cls(self, int(self._xs[idx]), int(self._ys[idx]))
+
     def _start_path(self, sp):
         """Return a newly created `a:path` element added to *sp*.
 
@@ -236,6 +315,45 @@ class FreeformBuilder(Sequence):
         return int(round(self._dx * self._x_scale))
 
 
+def _simplify(points, tolerance):
+    """Return list of the points in *points* that survive simplification.
+
+    The Ramer-Douglas-Peucker algorithm is used, keeping the point farthest
+    from the line between the first and last points when it lies more than
+    *tolerance* from that line, and repeating on each of the two lines
+    thereby formed. *points* is a sequence of (x, y) pairs.
+    """
+    if len(points) < 3:
+        return list(points)
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        x0, y0 = points[first]
+        dx, dy = points[last][0] - x0, points[last][1] - y0
+        length = (dx * dx + dy * dy) ** 0.5
+
+        # ---compare cross products against the scaled tolerance rather
+        #    than dividing by the line length for each point---
+        max_distance, max_idx = tolerance * (length or 1.0), None
+        for idx in range(first + 1, last):
+            x, y = points[idx][0] - x0, points[idx][1] - y0
+            distance = (
+                abs(dy * x - dx * y) if length else (x * x + y * y) ** 0.5
+            )
+            if distance > max_distance:
+                max_distance, max_idx = distance, idx
+
+        if max_idx is not None:
+            keep[max_idx] = True
+            stack.append((first, max_idx))
+            stack.append((max_idx, last))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
 class _BaseDrawingOperation(object):
     """Base class for freeform drawing operations.
 
@@ -249,13 +367,6 @@ class _BaseDrawingOperation(object):
         self._x = x
         self._y = y
 
-    def apply_operation_to(self, path):
-        """Add the XML element(s) implementing this operation to *path*.
-
-        Must be implemented by each subclass.
-        """
-        raise NotImplementedError('must be implemented by each subclass')
-
     @property
     def x(self):
         """Return the horizontal (x) target location of this operation.
@@ -276,52 +387,10 @@ class _BaseDrawingOperation(object):
 class _Close(object):
     """Specifies adding a `<a:close/>` element to the current contour."""
 
-    @classmethod
-    def new(cls):
-        """Return a new _Close object."""
-        return cls()
-
-    def apply_operation_to(self, path):
-        """Add `a:close` element to *path*."""
-        return path.add_close()
-
 
 class _LineSegment(_BaseDrawingOperation):
     """Specifies a straight line segment ending at the specified point."""
 
-    @classmethod
-    def new(cls, freeform_builder, x, y):
-        """Return a new _LineSegment object ending at point *(x, y)*.
-
-        Both *x* and *y* are rounded to the nearest integer before use.
-        """
-        return cls(freeform_builder, int(round(x)), int(round(y)))
-
-    def apply_operation_to(self, path):
-        """Add `a:lnTo` element to *path* for this line segment.
-
-        Returns the `a:lnTo` element newly added to the path.
-        """
-        return path.add_lnTo(
-            self._x - self._freeform_builder.shape_offset_x,
-            self._y - self._freeform_builder.shape_offset_y
-        )
-
 
 class _MoveTo(_BaseDrawingOperation):
     """Specifies a new pen position."""
-
-    @classmethod
-    def new(cls, freeform_builder, x, y):
-        """Return a new _MoveTo object for move to point *(x, y)*.
-
-        Both *x* and *y* are rounded to the nearest integer before use.
-        """
-        return cls(freeform_builder, int(round(x)), int(round(y)))
-
-    def apply_operation_to(self, path):
-        """Add `a:moveTo` element to *path* for this line segment."""
-        return path.add_moveTo(
-            self._x - self._freeform_builder.shape_offset_x,
-            self._y - self._freeform_builder.shape_offset_y
-        )
@@ -6,8 +6,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from collections import Sequence
+from weakref import WeakValueDictionary
+
 from pptx.compat import BytesIO
-from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE, PP_PLACEHOLDER
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.oxml.ns import qn
@@ -26,6 +29,8 @@ from pptx.shapes.placeholder import (
     NotesSlidePlaceholder, PicturePlaceholder, PlaceholderGraphicFrame,
     PlaceholderPicture, SlidePlaceholder, TablePlaceholder
 )
+from pptx.shapes.spatial import SpatialIndex, absolute_geometry
+from pptx.shapes.table import _cell_texts
 from pptx.shared import ParentedElementProxy
 from pptx.util import lazyproperty
 
@@ -63,25 +68,27 @@ class _BaseShapes(ParentedElementProxy):
     def __init__(self, spTree, parent):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
-        self._cached_max_shape_id = None
+        self._index = _ShapeIndex(
+            spTree, self._iter_member_elms, self._drop_stale_shapes
+        )
+        self._shapes = WeakValueDictionary()
 
     def __getitem__(self, idx):
         """
         Return shape at *idx* in sequence, e.g. ``shapes[2]``.
         """
-        shape_elms = list(self._iter_member_elms())
         try:
-            shape_elm = shape_elms[idx]
+            shape_elm = self._index.elm_at(idx)
         except IndexError:
             raise IndexError('shape index out of range')
-        return self._shape_factory(shape_elm)
+        return self._shape(shape_elm)
 
     def __iter__(self):
         """
         Generate a reference to each shape in the collection, in sequence.
         """
         for shape_elm in self._iter_member_elms():
-            yield self._shape_factory(shape_elm)
+            yield self._shape(shape_elm)
 
     def __len__(self):
         """
@@ -89,8 +96,7 @@ class _BaseShapes(ParentedElementProxy):
         1 to the total, without regard to the number of shapes contained in
         the group.
         """
-        shape_elms = list(self._iter_member_elms())
-        return len(shape_elms)
+        return len(self._index)
 
     def clone_placeholder(self, placeholder):
         """
@@ -104,6 +110,30 @@ class _BaseShapes(ParentedElementProxy):
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
 
+    def get_by_id(self, shape_id, default=None):
+        """Return the shape in this collection having *shape_id*.
+
+        *default* is returned if no shape in the collection has that id.
+        Lookup uses an index of the collection that is built on first use,
+        so repeated lookups do not scan the shape tree.
+        """
+        shape_elm = self._index.elm_with_id(shape_id)
+        if shape_elm is None:
+            return default
+        return self._shape(shape_elm)
+
+    def get_by_name(self, name, default=None):
+        """Return the first shape in this collection named *name*.
+
+        *default* is returned if no shape in the collection has that name.
+        Like :meth:`get_by_id`, this lookup does not scan the shape tree
+        once the index of the collection has been built.
+        """
+        shape_elm = self._index.elm_named(name)
+        if shape_elm is None:
+            return default
+        return self._shape(shape_elm)
+
     def ph_basename(self, ph_type):
         """
         Return the base name for a placeholder of *ph_type* in this shape
@@ -131,34 +161,20 @@ class _BaseShapes(ParentedElementProxy):
 
     @property
     def turbo_add_enabled(self):
-        """True if "turbo-add" mode is enabled. Read/Write.
-
-        EXPERIMENTAL: This feature can radically improve performance when
-        adding large numbers (hundreds of shapes) to a slide. It works by
-        caching the last shape ID used and incrementing that value to assign
-        the next shape id. This avoids repeatedly searching all shape ids in
-        the slide each time a new ID is required.
-
-        Performance is not noticeably improved for a slide with a relatively
-        small number of shapes, but because the search time rises with the
-        square of the shape count, this option can be useful for optimizing
-        generation of a slide composed of many shapes.
+        """Unconditionally |True|. Assignment is accepted and ignored.
 
-        Shape-id collisions can occur (causing a repair error on load) if
-        more than one |Slide| object is used to interact with the same slide
-        in the presentation. Note that the |Slides| collection creates a new
-        |Slide| object each time a slide is accessed
-        (e.g. `slide = prs.slides[0]`, so you must be careful to limit use to
-        a single |Slide| object.
+        DEPRECATED: Shape ids are now always allocated by the part containing
+        the shapes, which scans for the maximum id in use only once and then
+        assigns ids sequentially. This gives the performance formerly
+        available only in "turbo-add" mode, without the risk of duplicate ids
+        when more than one |Slide| object is used to add shapes to the same
+        slide. This property remains only for backward compatibility.
         """
-        return self._cached_max_shape_id is not None
+        return True
 
     @turbo_add_enabled.setter
     def turbo_add_enabled(self, value):
-        enable = bool(value)
-        self._cached_max_shape_id = (
-            self._spTree.max_shape_id if enable else None
-        )
+        pass
 
     @staticmethod
     def _is_member_elm(shape_elm):
@@ -184,7 +200,7 @@ class _BaseShapes(ParentedElementProxy):
         placeholder root name suffixed with id-1, e.g.
         _next_ph_name(ST_PlaceholderType.TBL, 4, 'horz') ==>
         'Table Placeholder 3'. The number is incremented as necessary to make
-        the name unique within the collection. If *orient* is ``'vert'``, the
+        the name unique within the part. If *orient* is ``'vert'``, the
         placeholder name is prefixed with ``'Vertical '``.
         """
         basename = self.ph_basename(ph_type)
@@ -193,16 +209,8 @@ class _BaseShapes(ParentedElementProxy):
         if orient == ST_Direction.VERT:
             basename = 'Vertical %s' % basename
 
-        # increment numpart as necessary to make name unique
-        numpart = id - 1
-        names = self._spTree.xpath('//p:cNvPr/@name')
-        while True:
-            name = '%s %d' % (basename, numpart)
-            if name not in names:
-                break
-            numpart += 1
-
-        return name
+        # part increments numpart as necessary to make name unique
+        return self.part.next_shape_name(basename, id - 1)
 
     @property
     def _next_shape_id(self):
@@ -210,14 +218,33 @@ class _BaseShapes(ParentedElementProxy):
 
         The returned id is 1 greater than the maximum shape id used so far.
         In practice, the minimum id is 2 because the spTree element is always
-        assigned id="1".
+        assigned id="1". Ids are allocated by the containing part so they are
+        unique across all shape collections on the same slide.
         """
-        # ---presence of cached-max-shape-id indicates turbo mode is on---
-        if self._cached_max_shape_id is not None:
-            self._cached_max_shape_id += 1
-            return self._cached_max_shape_id
+        return self.part.next_shape_id()
+
+    def _shape(self, shape_elm):
+        """Return the shape object for member shape element *shape_elm*.
 
-        return self._spTree.max_shape_id + 1
+        The shape object last returned for *shape_elm* is returned again for
+        as long as it remains referenced, for example by a list of the shapes
+        from an earlier iteration, rather than constructing another.
+        """
+        shape = self._shapes.get(shape_elm)
+        if shape is None:
+            shape = self._shapes[shape_elm] = self._shape_factory(shape_elm)
+        return shape
+
+    def _drop_stale_shapes(self, member_elms):
+        """Forget the shape objects held for elements not in *member_elms*.
+
+        Called whenever the index is rebuilt, so shape objects for shapes
+        since removed from the shape tree are not held indefinitely.
+        """
+        members = set(member_elms)
+        stale_elms = [e for e in list(self._shapes.keys()) if e not in members]
+        for shape_elm in stale_elms:
+            self._shapes.pop(shape_elm, None)
 
     def _shape_factory(self, shape_elm):
         """
@@ -275,11 +302,12 @@ class _BaseGroupShapes(_BaseShapes):
         it contains; its position and extents are recalculated each time
         a shape is added to it.
         """
-        grpSp = self._element.add_grpSp()
+        id_ = self._next_shape_id
+        grpSp = self._element.add_grpSp(id_, 'Group %d' % (id_-1))
         for shape in shapes:
             grpSp.insert_element_before(shape._element, 'p:extLst')
         if shapes:
-            grpSp.recalculate_extents()
+            self.part.recalculate_group_extents(grpSp)
         return self._shape_factory(grpSp)
 
     def add_picture(self, image_file, left, top, width=None, height=None):
@@ -312,6 +340,75 @@ class _BaseGroupShapes(_BaseShapes):
         self._recalculate_extents()
         return self._shape_factory(sp)
 
+    def add_shapes_bulk(self, kind, lefts, tops, widths, heights,
+                        texts=None, names=None, autoshape_type=None):
+        """Return a sequence of shapes newly appended to this shape tree.
+
+        One shape is added for each item in the parallel sequences *lefts*,
+        *tops*, *widths*, and *heights*, which can be lists, tuples, NumPy
+        arrays or any other sized iterable of numeric EMU values. Each value
+        is converted using `int()`. *kind* is either
+        `MSO_SHAPE_TYPE.TEXT_BOX` or `MSO_SHAPE_TYPE.AUTO_SHAPE`; for an auto
+        shape, *autoshape_type* is a member of :ref:`MsoAutoShapeType` and
+        defaults to `MSO_SHAPE.RECTANGLE`. The optional *texts* sequence
+        provides the text of each shape, with |None| leaving a shape empty.
+        A value that is not a string, such as a number, is converted to text
+        as for a cell value in :meth:`add_table_from_data`. *names*
+        overrides the default name of each shape. All sequences
+        must be of the same length.
+
+        The result is the same as adding each shape individually but much
+        faster when adding hundreds or thousands of shapes. Shape ids are
+        allocated as a block, each element is copied from a single prototype,
+        and the elements are inserted together. Shape objects in the returned
+        sequence are only constructed when accessed.
+        """
+        count = len(lefts)
+        columns = [lefts, tops, widths, heights] + [
+            column for column in (texts, names) if column is not None
+        ]
+        if any(len(column) != count for column in columns):
+            raise ValueError('all sequences must be the same length')
+
+        if kind == MSO_SHAPE_TYPE.TEXT_BOX:
+            basename = 'TextBox'
+        elif kind == MSO_SHAPE_TYPE.AUTO_SHAPE:
+            if autoshape_type is None:
+                autoshape_type = MSO_SHAPE.RECTANGLE
+            autoshape_type = AutoShapeType(autoshape_type)
+            basename = autoshape_type.basename
+        else:
+            raise ValueError(
+                'kind must be MSO_SHAPE_TYPE.TEXT_BOX or AUTO_SHAPE, got %s'
+                % kind
+            )
+
+        ids = self.part.next_shape_ids(count)
+        if names is None:
+            names = ['%s %d' % (basename, id_-1) for id_ in ids]
+        else:
+            for name in names:
+                self.part.register_shape_name(name)
+        xs, ys, cxs, cys = (
+            [int(value) for value in column]
+            for column in (lefts, tops, widths, heights)
+        )
+
+        if kind == MSO_SHAPE_TYPE.TEXT_BOX:
+            sps = self._grpSp.add_textboxes(ids, names, xs, ys, cxs, cys)
+        else:
+            sps = self._grpSp.add_autoshapes(
+                ids, names, autoshape_type.prst, xs, ys, cxs, cys
+            )
+
+        if texts is not None:
+            for sp, text in zip(sps, _cell_texts([texts], None)[0]):
+                if text:
+                    sp.txBody.p_lst[0].append_text(text)
+
+        self._recalculate_extents()
+        return _BulkShapes(sps, self)
+
     def add_textbox(self, left, top, width, height):
         """Return newly added text box shape appended to this shape tree.
 
@@ -322,6 +419,26 @@ class _BaseGroupShapes(_BaseShapes):
         self._recalculate_extents()
         return self._shape_factory(sp)
 
+    def batch(self):
+        """Return a context manager that defers group extent recalculation.
+
+        Ordinarily, adding a shape to a group shape recalculates the position
+        and size of that group and of each group containing it, which becomes
+        costly when many shapes are added to nested groups. Within the
+        `with` block, recalculation is deferred and then performed once for
+        each affected group when the block exits::
+
+            with group_shape.shapes.batch():
+                for x in range(0, Inches(10), Inches(1)):
+                    group_shape.shapes.add_textbox(x, 0, Inches(1), Inches(1))
+
+        Deferral applies to all groups on the slide, not only this
+        collection, so `slide.shapes.batch()` can be used when populating
+        several groups. The position and size of a group are not up to date
+        while the block is in progress.
+        """
+        return self.part.deferred_group_extents()
+
     def build_freeform(self, start_x=0, start_y=0, scale=1.0):
         """Return |FreeformBuilder| object to specify a freeform shape.
 
@@ -353,8 +470,10 @@ class _BaseGroupShapes(_BaseShapes):
 
         Raises |ValueError| if *shape* is not in the collection.
         """
-        shape_elms = list(self._element.iter_shape_elms())
-        return shape_elms.index(shape.element)
+        idx = self._index.index_of(shape.element)
+        if idx is None:
+            raise ValueError('shape not in collection')
+        return idx
 
     def _add_chart_graphicFrame(self, rId, x, y, cx, cy):
         """Return new `p:graphicFrame` element appended to this shape tree.
@@ -439,6 +558,30 @@ class _BaseGroupShapes(_BaseShapes):
         pass
 
 
+class _BulkShapes(Sequence):
+    """Sequence of the shapes added by :meth:`.add_shapes_bulk`.
+
+    A shape object is constructed only when its item is accessed, and is the
+    same object the shape collection itself provides for that shape.
+    """
+
+    def __init__(self, shape_elms, shapes):
+        super(_BulkShapes, self).__init__()
+        self._shape_elms = shape_elms
+        self._shapes = shapes
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [
+                self._shapes._shape(shape_elm)
+                for shape_elm in self._shape_elms[idx]
+            ]
+        return self._shapes._shape(self._shape_elms[idx])
+
+    def __len__(self):
+        return len(self._shape_elms)
+
+
 class GroupShapes(_BaseGroupShapes):
     """The sequence of child shapes belonging to a group shape.
 
@@ -452,7 +595,7 @@ class GroupShapes(_BaseGroupShapes):
         This would typically be called when a contained shape is added,
         removed, or its position or size updated.
         """
-        self._grpSp.recalculate_extents()
+        self.part.recalculate_group_extents(self._grpSp)
 
 
 class SlideShapes(_BaseGroupShapes):
@@ -462,6 +605,18 @@ class SlideShapes(_BaseGroupShapes):
     shape is topmost. Supports indexed access, len(), index(), and iteration.
     """
 
+    def absolute_geometry(self):
+        """Return the slide-coordinate geometry of every shape on this slide.
+
+        Each shape, including those within groups, is described by a
+        `(shape_id, x, y, cx, cy, rotation)` row, computed in a single pass
+        over the shape tree that combines the transform of each group once.
+        The result is a NumPy array of shape `(n, 6)` when NumPy is
+        installed and a flat `array.array` of doubles otherwise. See
+        :func:`pptx.shapes.spatial.absolute_geometry` for details.
+        """
+        return absolute_geometry(self)
+
     def add_movie(self, movie_file, left, top, width, height,
                   poster_frame_image=None, mime_type=CT.VIDEO):
         """Return newly added movie shape displaying video in *movie_file*.
@@ -488,6 +643,7 @@ class SlideShapes(_BaseGroupShapes):
             poster_frame_image, mime_type
         )
         self._spTree.append(movie_pic)
+        self.part.register_shape_name(movie_pic.shape_name)
         self._add_video_timing(movie_pic)
         return self._shape_factory(movie_pic)
 
@@ -506,6 +662,26 @@ class SlideShapes(_BaseGroupShapes):
         graphic_frame = self._shape_factory(graphicFrame)
         return graphic_frame
 
+    def add_table_from_data(self, data, left, top, width, height,
+                            number_format=None):
+        """
+        Add a |GraphicFrame| object containing a table holding the values in
+        *data*, having a row and column for each row and column of *data*.
+
+        *data* can be any of the two-dimensional forms accepted by
+        :meth:`.Table.fill`, such as a list of lists, a NumPy array or
+        a pandas DataFrame, and *number_format* is used as described there.
+        The table is positioned and sized as for :meth:`add_table`.
+        """
+        texts = _cell_texts(data, number_format)
+        rows = len(texts)
+        cols = max(len(row) for row in texts) if texts else 0
+        if rows == 0 or cols == 0:
+            raise ValueError('data must have at least one row and column')
+        graphic_frame = self.add_table(rows, cols, left, top, width, height)
+        graphic_frame.table.fill(texts)
+        return graphic_frame
+
     def clone_layout_placeholders(self, slide_layout):
         """
         Add placeholder shapes based on those in *slide_layout*. Z-order of
@@ -523,6 +699,18 @@ class SlideShapes(_BaseGroupShapes):
         """
         return self.parent.placeholders
 
+    def spatial_index(self):
+        """Return a |SpatialIndex| of the shapes on this slide.
+
+        The index supports region queries and finding overlapping,
+        off-slide, and nearest shapes, after reading the position and size
+        of every shape in a single pass. Shapes within groups are included,
+        positioned in slide coordinates. The index is rebuilt when shapes
+        are added to or removed from the slide; obtain a new one after
+        moving or resizing shapes.
+        """
+        return SpatialIndex(self)
+
     @property
     def title(self):
         """
@@ -629,6 +817,15 @@ class BasePlaceholders(_BaseShapes):
     constructed using |BaseShapeFactory|. Subclasses should override
     :method:`_shape_factory` to use custom placeholder classes.
     """
+
+    def __init__(self, spTree, parent):
+        super(BasePlaceholders, self).__init__(spTree, parent)
+        # ---hold placeholder shape objects rather than weakly referencing
+        #    them. Each is looked up on every read of an inherited position
+        #    or size of a placeholder based on it, and would otherwise be
+        #    reconstructed each time. A layout or master has few---
+        self._shapes = {}
+
     @staticmethod
     def _is_member_elm(shape_elm):
         """
@@ -647,10 +844,10 @@ class LayoutPlaceholders(BasePlaceholders):
         Return the first placeholder shape with matching *idx* value, or
         *default* if not found.
         """
-        for placeholder in self:
-            if placeholder.element.ph_idx == idx:
-                return placeholder
-        return default
+        ph_elm = self._index.ph_elm_with_idx(idx)
+        if ph_elm is None:
+            return default
+        return self._shape(ph_elm)
 
     def _shape_factory(self, shape_elm):
         """
@@ -671,10 +868,10 @@ class MasterPlaceholders(BasePlaceholders):
         or *default* if no such placeholder shape is present in the
         collection.
         """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
-        return default
+        ph_elm = self._index.ph_elm_of_type(ph_type)
+        if ph_elm is None:
+            return default
+        return self._shape(ph_elm)
 
     def _shape_factory(self, shape_elm):
         """
@@ -703,7 +900,12 @@ class SlidePlaceholders(ParentedElementProxy):
     placeholders it contains.
     """
 
-    __slots__ = ()
+    __slots__ = ('_index', '_placeholders')
+
+    def __init__(self, spTree, parent):
+        super(SlidePlaceholders, self).__init__(spTree, parent)
+        self._index = _ShapeIndex(spTree, spTree.iter_ph_elms)
+        self._placeholders = WeakValueDictionary()
 
     def __getitem__(self, idx):
         """
@@ -712,10 +914,12 @@ class SlidePlaceholders(ParentedElementProxy):
         |KeyError| if no placeholder with that idx value is in the
         collection.
         """
-        for e in self._element.iter_ph_elms():
-            if e.ph_idx == idx:
-                return SlideShapeFactory(e, self)
-        raise KeyError('no placeholder on this slide with idx == %d' % idx)
+        ph_elm = self._index.ph_elm_with_idx(idx)
+        if ph_elm is None:
+            raise KeyError(
+                'no placeholder on this slide with idx == %d' % idx
+            )
+        return self._placeholder(ph_elm)
 
     def __iter__(self):
         """
@@ -724,13 +928,169 @@ class SlidePlaceholders(ParentedElementProxy):
         ph_elms = sorted(
             [e for e in self._element.iter_ph_elms()], key=lambda e: e.ph_idx
         )
-        return (SlideShapeFactory(e, self) for e in ph_elms)
+        return (self._placeholder(e) for e in ph_elms)
 
     def __len__(self):
         """
         Return count of placeholder shapes.
         """
-        return len(list(self._element.iter_ph_elms()))
+        return len(self._index)
+
+    def _placeholder(self, ph_elm):
+        """Return the placeholder shape object for *ph_elm*.
+
+        Like :meth:`_BaseShapes._shape`, the placeholder object last returned
+        for *ph_elm* is reused while it remains referenced.
+        """
+        placeholder = self._placeholders.get(ph_elm)
+        if placeholder is None:
+            placeholder = SlideShapeFactory(ph_elm, self)
+            self._placeholders[ph_elm] = placeholder
+        return placeholder
+
+
+class _ShapeIndex(object):
+    """Lookup tables for the member shape elements of a shape tree.
+
+    The tables are built in a single pass over the shape tree on first use
+    and are rebuilt whenever the version of the shape tree element changes,
+    as it does when a shape is added, removed or renamed. Each lookup is
+    otherwise a dict or list access. An element found is checked to still
+    be a child of the shape tree, and to still have the key it was found
+    by, before it is returned. The tables are rebuilt when that check fails,
+    so a shape removed or renamed by changing the XML directly is not
+    misreported, but a lookup that simply finds nothing does not rebuild
+    them. *iter_member_elms* is a callable that generates the member shape
+    elements of *spTree* in document order. When provided, *on_rebuild* is
+    called with the list of member elements each time the tables are
+    rebuilt.
+    """
+
+    def __init__(self, spTree, iter_member_elms, on_rebuild=None):
+        super(_ShapeIndex, self).__init__()
+        self._spTree = spTree
+        self._iter_member_elms = iter_member_elms
+        self._on_rebuild = on_rebuild
+        self._version = None
+
+    def __len__(self):
+        """Number of member shape elements."""
+        if self._spTree.version != self._version:
+            self._rebuild()
+        return len(self._elms)
+
+    def elm_at(self, idx):
+        """Return member shape element at *idx*.
+
+        Raises |IndexError| if *idx* is out of range.
+        """
+        def find():
+            shape_elm = self._elms[idx]
+            return shape_elm if self._is_child(shape_elm) else _STALE
+        return self._find(find)
+
+    def elm_named(self, name):
+        """Return first member shape element named *name*, or |None|."""
+        def find():
+            shape_elm = self._name_tables()[1].get(name)
+            return self._checked(shape_elm, lambda e: e.shape_name == name)
+        return self._find(find)
+
+    def elm_with_id(self, shape_id):
+        """Return member shape element having *shape_id*, or |None|."""
+        def find():
+            shape_elm = self._name_tables()[0].get(shape_id)
+            return self._checked(shape_elm, lambda e: e.shape_id == shape_id)
+        return self._find(find)
+
+    def index_of(self, shape_elm):
+        """Return index of member *shape_elm*, or |None| if not a member."""
+        def find():
+            idx = self._idxs.get(shape_elm)
+            if idx is None:
+                return None
+            return idx if self._is_child(shape_elm) else _STALE
+        return self._find(find)
+
+    def ph_elm_of_type(self, ph_type):
+        """Return first placeholder element of *ph_type*, or |None|."""
+        def find():
+            ph_elm = self._ph_tables()[1].get(ph_type)
+            return self._checked(ph_elm, lambda e: e.ph_type == ph_type)
+        return self._find(find)
+
+    def ph_elm_with_idx(self, idx):
+        """Return first placeholder element having *idx*, or |None|."""
+        def find():
+            ph_elm = self._ph_tables()[0].get(idx)
+            return self._checked(ph_elm, lambda e: e.ph_idx == idx)
+        return self._find(find)
+
+    def _checked(self, shape_elm, has_key):
+        """Return *shape_elm* found in a table, |None|, or |_STALE|.
+
+        |_STALE| is returned when *shape_elm* is no longer a child of the
+        shape tree or *has_key* returns False for it, meaning the table
+        entry no longer matches the XML.
+        """
+        if shape_elm is None:
+            return None
+        if not self._is_child(shape_elm) or not has_key(shape_elm):
+            return _STALE
+        return shape_elm
+
+    def _find(self, find):
+        """Return result of calling *find*, rebuilding tables as necessary.
+
+        The tables are rebuilt before calling *find* if the shape tree
+        version has changed. They are also rebuilt if *find* returns
+        |_STALE|, and *find* is called again.
+        """
+        if self._spTree.version != self._version:
+            self._rebuild()
+        found = find()
+        if found is _STALE:
+            self._rebuild()
+            found = find()
+        return None if found is _STALE else found
+
+    def _is_child(self, shape_elm):
+        """True if *shape_elm* is still a child of the shape tree."""
+        return shape_elm.getparent() is self._spTree
+
+    def _name_tables(self):
+        """Return `(by_id, by_name)` 2-tuple of dicts, built on first use."""
+        if self._by_id is None:
+            by_id, by_name = {}, {}
+            for shape_elm in self._elms:
+                by_id.setdefault(shape_elm.shape_id, shape_elm)
+                by_name.setdefault(shape_elm.shape_name, shape_elm)
+            self._by_id, self._by_name = by_id, by_name
+        return self._by_id, self._by_name
+
+    def _ph_tables(self):
+        """Return `(by_ph_idx, by_ph_type)` 2-tuple of dicts, built on first
+        use."""
+        if self._by_ph_idx is None:
+            by_ph_idx, by_ph_type = {}, {}
+            for shape_elm in self._elms:
+                if not shape_elm.has_ph_elm:
+                    continue
+                by_ph_idx.setdefault(shape_elm.ph_idx, shape_elm)
+                by_ph_type.setdefault(shape_elm.ph_type, shape_elm)
+            self._by_ph_idx, self._by_ph_type = by_ph_idx, by_ph_type
+        return self._by_ph_idx, self._by_ph_type
+
+    def _rebuild(self):
+        """Build the positional tables from the current shape tree XML."""
+        elms = list(self._iter_member_elms())
+        self._version = self._spTree.version
+        self._elms = elms
+        self._idxs = dict((e, idx) for idx, e in enumerate(elms))
+        self._by_id = self._by_name = None
+        self._by_ph_idx = self._by_ph_type = None
+        if self._on_rebuild is not None:
+            self._on_rebuild(elms)
 
 
 def BaseShapeFactory(shape_elm, parent):
@@ -738,21 +1098,9 @@ def BaseShapeFactory(shape_elm, parent):
     Return an instance of the appropriate shape proxy class for *shape_elm*.
     """
     tag = shape_elm.tag
-
-    if tag == qn('p:pic'):
-        videoFiles = shape_elm.xpath('./p:nvPicPr/p:nvPr/a:videoFile')
-        if videoFiles:
-            return Movie(shape_elm, parent)
-        return Picture(shape_elm, parent)
-
-    shape_cls = {
-        qn('p:cxnSp'):        Connector,
-        qn('p:grpSp'):        GroupShape,
-        qn('p:sp'):           Shape,
-        qn('p:graphicFrame'): GraphicFrame,
-    }.get(tag, BaseShape)
-
-    return shape_cls(shape_elm, parent)
+    if tag == _PIC_TAG and shape_elm.find(_VIDEO_FILE_PATH) is not None:
+        return Movie(shape_elm, parent)
+    return _SHAPE_CLASSES.get(tag, BaseShape)(shape_elm, parent)
 
 
 def _LayoutShapeFactory(shape_elm, parent):
@@ -760,8 +1108,7 @@ def _LayoutShapeFactory(shape_elm, parent):
     Return an instance of the appropriate shape proxy class for *shape_elm*
     on a slide layout.
     """
-    tag_name = shape_elm.tag
-    if tag_name == qn('p:sp') and shape_elm.has_ph_elm:
+    if shape_elm.tag == _SP_TAG and shape_elm.has_ph_elm:
         return LayoutPlaceholder(shape_elm, parent)
     return BaseShapeFactory(shape_elm, parent)
 
@@ -771,8 +1118,7 @@ def _MasterShapeFactory(shape_elm, parent):
     Return an instance of the appropriate shape proxy class for *shape_elm*
     on a slide master.
     """
-    tag_name = shape_elm.tag
-    if tag_name == qn('p:sp') and shape_elm.has_ph_elm:
+    if shape_elm.tag == _SP_TAG and shape_elm.has_ph_elm:
         return MasterPlaceholder(shape_elm, parent)
     return BaseShapeFactory(shape_elm, parent)
 
@@ -782,8 +1128,7 @@ def _NotesSlideShapeFactory(shape_elm, parent):
     Return an instance of the appropriate shape proxy class for *shape_elm*
     on a notes slide.
     """
-    tag_name = shape_elm.tag
-    if tag_name == qn('p:sp') and shape_elm.has_ph_elm:
+    if shape_elm.tag == _SP_TAG and shape_elm.has_ph_elm:
         return NotesSlidePlaceholder(shape_elm, parent)
     return BaseShapeFactory(shape_elm, parent)
 
@@ -793,19 +1138,13 @@ def _SlidePlaceholderFactory(shape_elm, parent):
     Return a placeholder shape of the appropriate type for *shape_elm*.
     """
     tag = shape_elm.tag
-    if tag == qn('p:sp'):
-        Constructor = {
-            PP_PLACEHOLDER.BITMAP:  PicturePlaceholder,
-            PP_PLACEHOLDER.CHART:   ChartPlaceholder,
-            PP_PLACEHOLDER.PICTURE: PicturePlaceholder,
-            PP_PLACEHOLDER.TABLE:   TablePlaceholder,
-        }.get(shape_elm.ph_type, SlidePlaceholder)
-    elif tag == qn('p:graphicFrame'):
-        Constructor = PlaceholderGraphicFrame
-    elif tag == qn('p:pic'):
-        Constructor = PlaceholderPicture
-    else:
-        Constructor = BaseShapeFactory
+    Constructor = _SLIDE_PLACEHOLDER_CLASSES.get(
+        (tag, shape_elm.ph_type) if tag == _SP_TAG else (tag, None)
+    )
+    if Constructor is None:
+        Constructor = _SLIDE_PLACEHOLDER_CLASSES.get(
+            (tag, None), BaseShapeFactory
+        )
     return Constructor(shape_elm, parent)
 
 
@@ -819,6 +1158,38 @@ def SlideShapeFactory(shape_elm, parent):
     return BaseShapeFactory(shape_elm, parent)
 
 
+# ---Clark-notation tags and paths used by the shape factories, computed
+#    once rather than on each call---
+_PIC_TAG, _SP_TAG = qn('p:pic'), qn('p:sp')
+_VIDEO_FILE_PATH = '/'.join((qn('p:nvPicPr'), qn('p:nvPr'), qn('a:videoFile')))
+
+# ---shape class for each shape element tag, a `p:pic` having a video file
+#    being a |Movie| instead---
+_SHAPE_CLASSES = {
+    qn('p:cxnSp'):        Connector,
+    qn('p:graphicFrame'): GraphicFrame,
+    qn('p:grpSp'):        GroupShape,
+    qn('p:pic'):          Picture,
+    qn('p:sp'):           Shape,
+}
+
+# ---slide placeholder class for each (tag, placeholder type) pair, where
+#    the placeholder type is None for the default of a tag---
+_SLIDE_PLACEHOLDER_CLASSES = {
+    (qn('p:sp'), PP_PLACEHOLDER.BITMAP):  PicturePlaceholder,
+    (qn('p:sp'), PP_PLACEHOLDER.CHART):   ChartPlaceholder,
+    (qn('p:sp'), PP_PLACEHOLDER.PICTURE): PicturePlaceholder,
+    (qn('p:sp'), PP_PLACEHOLDER.TABLE):   TablePlaceholder,
+    (qn('p:sp'), None):                   SlidePlaceholder,
+    (qn('p:graphicFrame'), None):         PlaceholderGraphicFrame,
+    (qn('p:pic'), None):                  PlaceholderPicture,
+}
+
+# ---returned by a lookup in |_ShapeIndex| whose table entry no longer
+#    matches the XML---
+_STALE = object()
+
+
 class _MoviePicElementCreator(object):
     """Functional service object for creating a new movie p:pic element.
 
@@ -0,0 +1,376 @@
+# encoding: utf-8
+
+"""Slide-coordinate geometry of shapes and a spatial index over them."""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+from array import array
+from itertools import count
+from math import ceil, cos, radians, sin, sqrt
+
+from pptx.oxml.ns import qn
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def absolute_geometry(shapes):
+    """Return the slide-coordinate geometry of each shape in *shapes*.
+
+    *shapes* is a |SlideShapes| object. Each shape, including group shapes
+    and the shapes they contain, is described by a `(shape_id, x, y, cx, cy,
+    rotation)` row, in document order with a group shape preceding its
+    members. Position and size are in EMU and rotation is in clockwise
+    degrees, with the offset, scaling and rotation of containing groups
+    applied. *x* and *y* locate the top-left corner of the shape before its
+    rotation is applied, in the same way as :attr:`.BaseShape.left` and
+    :attr:`.BaseShape.top`. Flipping is not taken into account, and shapes
+    having no position or size are omitted.
+
+    When NumPy is installed the result is a float64 array of shape `(n, 6)`.
+    Otherwise it is an `array.array` of doubles holding the rows end to
+    end, six values per shape.
+    """
+    values = array('d')
+    cNvPr_tag = qn('p:cNvPr')
+    for shape_elm, _, geometry in _iter_geometry(shapes, _ABS_IDENTITY):
+        # ---the first `p:cNvPr` in a shape element is its own---
+        cNvPr = next(shape_elm.iter(cNvPr_tag))
+        values.append(int(cNvPr.get('id')))
+        values.extend(geometry)
+    if numpy is None:
+        return values
+    return numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, 6)
+
+
+class SpatialIndex(object):
+    """Bounding boxes of the shapes on a slide, arranged for fast lookup.
+
+    Obtain one using :meth:`.SlideShapes.spatial_index`. Each shape other
+    than a group shape is indexed by its bounding box in slide coordinates
+    (EMU), the smallest upright rectangle enclosing the shape as placed by
+    :func:`absolute_geometry`, with the offset, scaling and rotation of any
+    containing groups applied. A group shape is not itself indexed, but the
+    shapes it contains are. Shapes having no position or size, such as a
+    placeholder whose layout placeholder is absent, are not indexed.
+
+    The index is built in a single pass over the shape tree on first use
+    and is rebuilt whenever the number of children of the shape tree
+    changes, as it does when a shape is added or removed. A shape moved or
+    resized in place, or a shape added to or removed from a group, is not
+    detected, so obtain a new index after making such changes.
+
+    Shapes are returned as shape objects, in document order, and are only
+    constructed when a query returns them.
+    """
+
+    def __init__(self, shapes):
+        super(SpatialIndex, self).__init__()
+        self._shapes = shapes
+        self._child_count = None
+
+    def __len__(self):
+        self._refresh()
+        return len(self._shape_refs)
+
+    def nearest(self, point):
+        """Return the shape nearest to *point*, an `(x, y)` pair in EMU.
+
+        Distance is measured to the nearest edge of the shape's bounding box
+        and is zero for a point within it. The first in document order is
+        returned when more than one shape is nearest. Returns |None| if the
+        index is empty.
+        """
+        self._refresh()
+        x, y = point
+        idx = self._grid.nearest(x, y, self._distance)
+        return None if idx is None else self._shape(idx)
+
+    def out_of_bounds(self, slide_width, slide_height):
+        """Return list of shapes extending beyond the slide.
+
+        A shape is included when any part of its bounding box lies outside
+        the rectangle from (0, 0) to (*slide_width*, *slide_height*).
+        """
+        self._refresh()
+        lefts, tops = self._lefts, self._tops
+        rights, bottoms = self._rights, self._bottoms
+        return [
+            self._shape(idx) for idx in range(len(self))
+            if lefts[idx] < 0 or tops[idx] < 0 or rights[idx] > slide_width
+            or bottoms[idx] > slide_height
+        ]
+
+    def overlaps(self):
+        """Return list of `(shape, other_shape)` pairs that overlap.
+
+        Two shapes overlap when their bounding boxes share some area; boxes
+        that only touch along an edge do not overlap. Each pair appears
+        once, with its shapes in document order, and pairs are sorted in
+        document order.
+        """
+        self._refresh()
+        lefts, tops = self._lefts, self._tops
+        rights, bottoms = self._rights, self._bottoms
+
+        # ---sweep along x, keeping the boxes whose x-range is still open---
+        pairs, active = [], []
+        for idx in sorted(range(len(self)), key=lambda i: lefts[i]):
+            left = lefts[idx]
+            active = [a for a in active if rights[a] > left]
+            for a in active:
+                if tops[a] < bottoms[idx] and tops[idx] < bottoms[a]:
+                    pairs.append((a, idx) if a < idx else (idx, a))
+            active.append(idx)
+
+        return [(self._shape(a), self._shape(b)) for a, b in sorted(pairs)]
+
+    def query(self, rect):
+        """Return list of shapes whose bounding box intersects *rect*.
+
+        *rect* is a `(left, top, width, height)` 4-tuple in EMU. A shape
+        that only touches the edge of *rect* is included.
+        """
+        self._refresh()
+        left, top, width, height = rect
+        right, bottom = left + width, top + height
+        lefts, tops = self._lefts, self._tops
+        rights, bottoms = self._rights, self._bottoms
+        return [
+            self._shape(idx)
+            for idx in sorted(self._grid.candidates(left, top, right, bottom))
+            if lefts[idx] <= right and left <= rights[idx]
+            and tops[idx] <= bottom and top <= bottoms[idx]
+        ]
+
+    def _distance(self, idx, x, y):
+        """Distance from (*x*, *y*) to the bounding box of entry *idx*."""
+        dx = max(self._lefts[idx] - x, 0, x - self._rights[idx])
+        dy = max(self._tops[idx] - y, 0, y - self._bottoms[idx])
+        return sqrt(dx * dx + dy * dy)
+
+    def _refresh(self):
+        """Build the index if the shape tree has changed since last built."""
+        spTree = self._shapes._spTree
+        if len(spTree) == self._child_count:
+            return
+        entries = list(_iter_entries(self._shapes))
+        self._child_count = len(spTree)
+        self._shape_refs = [
+            (shape_elm, parent) for shape_elm, parent, _ in entries
+        ]
+        self._lefts = array('d', (box[0] for _, _, box in entries))
+        self._tops = array('d', (box[1] for _, _, box in entries))
+        self._rights = array('d', (box[2] for _, _, box in entries))
+        self._bottoms = array('d', (box[3] for _, _, box in entries))
+        self._grid = _Grid(
+            self._lefts, self._tops, self._rights, self._bottoms
+        )
+
+    def _shape(self, idx):
+        """Return shape object for entry *idx*."""
+        shape_elm, parent = self._shape_refs[idx]
+        return parent._shape(shape_elm)
+
+
+class _Grid(object):
+    """Uniform grid of cells, each listing the boxes that overlap it.
+
+    The grid covers the bounding box of all the boxes and has about as many
+    cells as boxes, so each cell lists only a few.
+    """
+
+    def __init__(self, lefts, tops, rights, bottoms):
+        super(_Grid, self).__init__()
+        self._cells = {}
+        if not lefts:
+            return
+
+        self._x0, self._y0 = min(lefts), min(tops)
+        width = max(max(rights) - self._x0, 1)
+        height = max(max(bottoms) - self._y0, 1)
+        cols = max(int(round(sqrt(len(lefts) * width / height))), 1)
+        rows = max(int(ceil(len(lefts) / cols)), 1)
+        self._cols, self._rows = cols, rows
+        self._cell_w, self._cell_h = width / cols, height / rows
+
+        cells = self._cells
+        for idx in range(len(lefts)):
+            cols_, rows_ = self._span(
+                lefts[idx], tops[idx], rights[idx], bottoms[idx]
+            )
+            for col in cols_:
+                for row in rows_:
+                    cells.setdefault((col, row), []).append(idx)
+
+    def candidates(self, left, top, right, bottom):
+        """Return set of indices of boxes in cells overlapping the box."""
+        found = set()
+        if not self._cells:
+            return found
+        cols, rows = self._span(left, top, right, bottom)
+        for col in cols:
+            for row in rows:
+                found.update(self._cells.get((col, row), ()))
+        return found
+
+    def nearest(self, x, y, distance):
+        """Return index of the box nearest (*x*, *y*), or |None| if empty.
+
+        *distance* is a callable `(idx, x, y)` returning the distance from
+        the point to the box at *idx*. Cells are searched in rings of
+        increasing size around the cell containing the point, stopping once
+        no unsearched cell can hold a nearer box.
+        """
+        if not self._cells:
+            return None
+        col0, row0 = self._col(x), self._row(y)
+        best, best_distance = None, None
+        for ring in count():
+            if ring > max(self._cols, self._rows):
+                break
+            for cell in self._ring(col0, row0, ring):
+                for idx in self._cells.get(cell, ()):
+                    d = distance(idx, x, y)
+                    if best is None or (d, idx) < (best_distance, best):
+                        best, best_distance = idx, d
+            bound = ring * min(self._cell_w, self._cell_h)
+            if best is not None and best_distance < bound:
+                break
+        return best
+
+    def _col(self, x):
+        col = int((x - self._x0) // self._cell_w)
+        return min(max(col, 0), self._cols - 1)
+
+    def _ring(self, col0, row0, ring):
+        """Generate the `(col, row)` cells at Chebyshev distance *ring*."""
+        for col in range(col0 - ring, col0 + ring + 1):
+            for row in range(row0 - ring, row0 + ring + 1):
+                if max(abs(col - col0), abs(row - row0)) == ring:
+                    yield col, row
+
+    def _row(self, y):
+        row = int((y - self._y0) // self._cell_h)
+        return min(max(row, 0), self._rows - 1)
+
+    def _span(self, left, top, right, bottom):
+        """Return `(cols, rows)` 2-tuple of ranges covering the box."""
+        return (
+            range(self._col(left), self._col(right) + 1),
+            range(self._row(top), self._row(bottom) + 1),
+        )
+
+
+# ---maps child coordinates to slide coordinates as (a, b, c, d, e, f, sx,
+#    sy, rot), such that slide_x = a * x + b * y + e and slide_y = c * x +
+#    d * y + f, where sx and sy are the accumulated scaling of extents and
+#    rot the accumulated rotation in degrees---
+_ABS_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0)
+
+
+def _abs_child_transform(grpSp, transform):
+    """Return absolute transform for shapes in *grpSp*.
+
+    *transform* is the transform that applies to *grpSp* itself. The offset
+    and scaling of *grpSp* are applied, then its rotation, which turns its
+    members about the center of the group. A group without a complete
+    transform is treated as not moving its children.
+    """
+    xfrm = grpSp.xfrm
+    if xfrm is None:
+        return transform
+    off, ext, chOff, chExt = xfrm.off, xfrm.ext, xfrm.chOff, xfrm.chExt
+    if off is None or ext is None or chOff is None or chExt is None:
+        return transform
+
+    gsx = ext.cx / chExt.cx if chExt.cx else 1.0
+    gsy = ext.cy / chExt.cy if chExt.cy else 1.0
+    rot = xfrm.rot
+    theta = radians(rot)
+    cos_, sin_ = cos(theta), sin(theta)
+
+    # ---group-local transform is scale-and-offset followed by rotation
+    #    about the group center---
+    l00, l01, l10, l11 = cos_ * gsx, -sin_ * gsy, sin_ * gsx, cos_ * gsy
+    center_x, center_y = off.x + ext.cx / 2, off.y + ext.cy / 2
+    ux = off.x - gsx * chOff.x - center_x
+    uy = off.y - gsy * chOff.y - center_y
+    tx = cos_ * ux - sin_ * uy + center_x
+    ty = sin_ * ux + cos_ * uy + center_y
+
+    a, b, c, d, e, f, sx, sy, acc_rot = transform
+    return (
+        a * l00 + b * l10, a * l01 + b * l11,
+        c * l00 + d * l10, c * l01 + d * l11,
+        a * tx + b * ty + e, c * tx + d * ty + f,
+        sx * gsx, sy * gsy, acc_rot + rot,
+    )
+
+
+def _iter_entries(shapes):
+    """Generate `(shape_elm, parent, box)` for each shape in *shapes*.
+
+    *box* is the `(left, top, right, bottom)` upright bounding box of the
+    shape in slide coordinates, enclosing the shape as rotated. *parent* is
+    the shape collection to construct its shape object with. Group shapes
+    are not produced, but the shapes they contain are.
+    """
+    grpSp_tag = qn('p:grpSp')
+    for shape_elm, parent, geometry in _iter_geometry(shapes, _ABS_IDENTITY):
+        if shape_elm.tag == grpSp_tag:
+            continue
+        x, y, width, height, rotation = geometry
+        theta = radians(rotation)
+        cos_, sin_ = abs(cos(theta)), abs(sin(theta))
+        half_w = (width * cos_ + height * sin_) / 2
+        half_h = (width * sin_ + height * cos_) / 2
+        center_x, center_y = x + width / 2, y + height / 2
+        yield shape_elm, parent, (
+            center_x - half_w, center_y - half_h,
+            center_x + half_w, center_y + half_h,
+        )
+
+
+def _iter_geometry(shapes, transform):
+    """Generate `(shape_elm, parent, geometry)` for each shape in *shapes*.
+
+    *geometry* is the `(x, y, width, height, rotation)` of the shape in
+    slide coordinates, as described for :func:`absolute_geometry`, and
+    *parent* is the shape collection to construct its shape object with.
+    Group shapes are recursed into after they are produced. Shapes having
+    no position or size are skipped.
+    """
+    grpSp_tag = qn('p:grpSp')
+    a, b, c, d, e, f, sx, sy, acc_rot = transform
+    for shape_elm in shapes._spTree.iter_shape_elms():
+        xfrm = shape_elm.xfrm
+        off = None if xfrm is None else xfrm.off
+        ext = None if xfrm is None else xfrm.ext
+        if off is not None and ext is not None:
+            x, y, cx, cy = off.x, off.y, ext.cx, ext.cy
+        elif shape_elm.has_ph_elm:
+            shape = shapes._shape(shape_elm)
+            x, y, cx, cy = shape.left, shape.top, shape.width, shape.height
+        else:
+            x = None
+
+        if x is not None and None not in (y, cx, cy):
+            center_x, center_y = x + cx / 2, y + cy / 2
+            width, height = cx * sx, cy * sy
+            yield shape_elm, shapes, (
+                a * center_x + b * center_y + e - width / 2,
+                c * center_x + d * center_y + f - height / 2,
+                width, height,
+                (acc_rot + (0.0 if xfrm is None else xfrm.rot)) % 360,
+            )
+
+        if shape_elm.tag == grpSp_tag:
+            group_shapes = shapes._shape(shape_elm).shapes
+            child_transform = _abs_child_transform(shape_elm, transform)
+            for entry in _iter_geometry(group_shapes, child_transform):
+                yield entry
@@ -6,12 +6,23 @@ Table-related objects such as Table and Cell.
 
 from __future__ import absolute_import, print_function
 
+from numbers import Number
+
 from . import Subshape
-from ..compat import is_integer, to_unicode
+from ..compat import is_integer, is_string, to_unicode, Unicode
+from ..dml.color import RGBColor
 from ..dml.fill import FillFormat
-from ..text.text import TextFrame
+from ..oxml import parse_xml
+from ..oxml.ns import nsdecls
+from ..text.layout import TextMeasurer
+from ..text.text import Font, TextFrame
 from ..util import lazyproperty
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class Table(object):
     """
@@ -23,6 +34,99 @@ class Table(object):
         self._tbl = tbl
         self._graphic_frame = graphic_frame
 
+    def autofit(self, font_file, point_size=18, min_row_height=0,
+                max_width=None):
+        """
+        Size the columns and rows of this table to suit the text it contains.
+
+        The text of each cell is measured once using the TrueType font in
+        *font_file*, at the largest font size explicitly applied to a run in
+        that cell or at *point_size* when the cell has none. Each column is
+        made wide enough to hold its longest line of text without wrapping.
+        When those widths total more than *max_width* (EMU), they are reduced
+        in proportion to fit within *max_width*, which defaults to the
+        current width of the table. Each row is then made tall enough for
+        the text of each of its cells, wrapped within the width of its
+        column, and at least *min_row_height* tall. Cell margins are taken
+        into account. A merged cell contributes only to the height of its
+        first row. When the columns a merged cell spans are together too
+        narrow for its text, the shortfall is shared equally among them. The
+        size of the graphic frame containing the table is updated to match.
+        """
+        tbl = self._tbl
+        gridCol_lst = tbl.tblGrid.gridCol_lst
+        if max_width is None:
+            max_width = sum(gridCol.w for gridCol in gridCol_lst)
+
+        # ---measure the text of each cell once, noting the natural width of
+        # ---each column along the way
+        measurers = {}
+        natural_widths = [0] * len(gridCol_lst)
+        spanning_widths = []
+        measured_rows = []
+        for tr in tbl.tr_lst:
+            measured_cells = []
+            for col_idx, tc in enumerate(tr.tc_lst):
+                span = tc.gridSpan
+                if not (tc.hMerge or tc.vMerge):
+                    size = _cell_point_size(tc, point_size)
+                    if size not in measurers:
+                        measurers[size] = TextMeasurer(font_file, size)
+                    measurer = measurers[size]
+                    lines = tc.text_lines
+                    measured_cells.append((tc, col_idx, span, measurer, lines))
+                    width = tc.marL + tc.marR + max(
+                        [measurer.line_width(line) for line in lines] or [0]
+                    )
+                    if span > 1:
+                        spanning_widths.append((span, col_idx, width))
+                    elif col_idx < len(natural_widths):
+                        natural_widths[col_idx] = max(
+                            natural_widths[col_idx], width
+                        )
+            measured_rows.append((tr, measured_cells))
+
+        # ---widen the columns spanned by a merged cell too narrow for its
+        # ---text, narrower spans first so wider ones see their effect
+        for span, col_idx, width in sorted(spanning_widths):
+            col_idxs = range(col_idx, min(col_idx + span, len(natural_widths)))
+            if not col_idxs:
+                continue
+            shortfall = width - sum(natural_widths[i] for i in col_idxs)
+            if shortfall <= 0:
+                continue
+            share, remainder = divmod(shortfall, len(col_idxs))
+            for n, i in enumerate(col_idxs):
+                natural_widths[i] += share + (1 if n < remainder else 0)
+
+        total_width = sum(natural_widths)
+        if total_width > max_width:
+            widths = [w * max_width // total_width for w in natural_widths]
+        else:
+            widths = natural_widths
+        for gridCol, width in zip(gridCol_lst, widths):
+            gridCol.w = width
+
+        for tr, measured_cells in measured_rows:
+            height = min_row_height
+            for tc, col_idx, span, measurer, lines in measured_cells:
+                if tc.rowSpan > 1:
+                    continue
+                text_width = (
+                    sum(widths[col_idx:col_idx + span]) - tc.marL - tc.marR
+                )
+                line_count = sum(
+                    measurer.line_count(line, text_width) for line in lines
+                )
+                height = max(
+                    height,
+                    line_count * measurer.line_height + tc.marT + tc.marB
+                )
+            tr.h = height
+
+        self._graphic_frame.width = sum(widths)
+        self._graphic_frame.height = sum(tr.h for tr in tbl.tr_lst)
+
     def cell(self, row_idx, col_idx):
         """
         Return table cell at *row_idx*, *col_idx* location. Indexes are
@@ -40,6 +144,31 @@ class Table(object):
         """
         return _ColumnCollection(self._tbl, self)
 
+    def fill(self, data, number_format=None, start=(0, 0)):
+        """
+        Replace the text of a block of cells with the values in *data*.
+
+        *data* is a two-dimensional sequence of rows, such as a list of lists,
+        a two-dimensional NumPy array, or an object like a pandas DataFrame
+        having a `to_numpy()` method. The first value is placed in the cell
+        at *start*, a `(row_idx, col_idx)` pair, and the block extends right
+        and down from there. Each cell receives a single paragraph containing
+        a single run, as when assigning to :attr:`_Cell.text`.
+
+        A string value is used as-is and |None| leaves the cell empty. When
+        *number_format* is provided it is used as a format specification,
+        like ``',.2f'``, for each numeric value; other values are converted
+        using :func:`str`. Raises |ValueError| if the block extends beyond
+        the table, in which case no cell is changed.
+
+        The cells of the block are located once and each run is written
+        directly, so this is much faster than assigning text cell by cell.
+        """
+        row_idx, col_idx = start
+        self._tbl.set_cell_texts(
+            _cell_texts(data, number_format), row_idx, col_idx
+        )
+
     @property
     def first_col(self):
         """
@@ -120,6 +249,33 @@ class Table(object):
         new_table_width = sum([col.width for col in self.columns])
         self._graphic_frame.width = new_table_width
 
+    def paginate(self, max_height, header_rows=0):
+        """
+        Return a list of `(start, end)` row index pairs that split the rows
+        of this table into pages no taller than *max_height* (EMU), based on
+        the current row heights, such as those set by :meth:`autofit`.
+
+        The first *header_rows* rows are taken to be repeated at the top of
+        each page, so their height counts against each page and they are not
+        included in any pair. Rows `start` up to but not including `end`
+        appear on each page, the first page on the slide holding this table
+        and each following page on a continuation slide. A single row taller
+        than the space available is placed on a page of its own.
+        """
+        heights = [tr.h for tr in self._tbl.tr_lst]
+        header_height = sum(heights[:header_rows])
+        pages = []
+        start, page_height = header_rows, header_height
+        for row_idx in range(header_rows, len(heights)):
+            height = heights[row_idx]
+            if row_idx > start and page_height + height > max_height:
+                pages.append((start, row_idx))
+                start, page_height = row_idx, header_height
+            page_height += height
+        if start < len(heights) or not pages:
+            pages.append((start, len(heights)))
+        return pages
+
     @property
     def part(self):
         """
@@ -127,6 +283,18 @@ class Table(object):
         """
         return self._graphic_frame.part
 
+    def range(self, first_row, first_col, last_row, last_col):
+        """
+        Return a |_CellRange| object for the rectangular block of cells
+        having the cell at *first_row*, *first_col* as its top-left corner
+        and the cell at *last_row*, *last_col* as its bottom-right corner,
+        inclusive. Raises |IndexError| if the block does not lie within the
+        table.
+        """
+        return _CellRange(
+            self._tbl, first_row, first_col, last_row, last_col
+        )
+
     @lazyproperty
     def rows(self):
         """
@@ -136,6 +304,38 @@ class Table(object):
         """
         return _RowCollection(self._tbl, self)
 
+    def to_array(self, fill_merged=False):
+        """
+        Return the text of each cell in this table as a two-dimensional
+        NumPy array of object dtype having one row for each row of the table
+        and one column for each of its columns. Values are as described for
+        :meth:`to_rows`, and a position having no ``<a:tc>`` element in the
+        table XML is |None|. When NumPy is not installed the list of rows
+        returned by :meth:`to_rows` is returned instead.
+        """
+        rows = self.to_rows(fill_merged)
+        if numpy is None:
+            return rows
+        array = numpy.empty(
+            (len(rows), len(self._tbl.tblGrid.gridCol_lst)), dtype=object
+        )
+        for row_idx, row in enumerate(rows):
+            array[row_idx, :len(row)] = row
+        return array
+
+    def to_rows(self, fill_merged=False):
+        """
+        Return the text of each cell in this table as a list of rows, each
+        a list of unicode strings, in the form of ``cell.text_frame.text``.
+
+        A cell covered by a merged cell is |None| unless *fill_merged* is
+        |True|, in which case it holds the text of the merged cell, so that
+        for example each row of a vertically merged group label carries
+        that label. The cell elements are read directly in a single pass,
+        without creating a |_Cell| object for each one.
+        """
+        return self._tbl.text_rows(fill_merged)
+
     @property
     def vert_banding(self):
         """
@@ -317,6 +517,94 @@ class _Row(Subshape):
         self._parent.notify_height_changed()
 
 
+class _CellRange(object):
+    """
+    A rectangular block of cells in a table, allowing formatting to be
+    applied to all of them at once. Not intended to be constructed
+    directly, use :meth:`Table.range` to get a cell range.
+    """
+    def __init__(self, tbl, first_row, first_col, last_row, last_col):
+        super(_CellRange, self).__init__()
+        row_count, col_count = len(tbl.tr_lst), len(tbl.tblGrid.gridCol_lst)
+        if not (0 <= first_row <= last_row < row_count and
+                0 <= first_col <= last_col < col_count):
+            raise IndexError(
+                'cell range (%d, %d)-(%d, %d) out of range' %
+                (first_row, first_col, last_row, last_col)
+            )
+        self._tbl = tbl
+        self._rows = (first_row, last_row + 1)
+        self._cols = (first_col, last_col + 1)
+
+    def apply(self, fill=None, font=None, align=None, margins=None,
+              anchor=None):
+        """
+        Apply formatting to each cell in this range. Each argument left as
+        |None| leaves that aspect of the formatting of the cells unchanged.
+
+        *fill* is an |RGBColor| value or a member of :ref:`MsoThemeColorIndex`
+        used as a solid fill color for each cell. *font* is a dict mapping
+        the name of a |Font| property, such as ``'bold'`` or ``'size'``, to
+        the value to assign it; the value for ``'color'`` is an |RGBColor|
+        value or theme color. The font is applied to each run in each cell,
+        so text should be added before it is formatted. *align* is
+        a member of :ref:`PpParagraphAlignment` applied to each paragraph.
+        *margins* is a single |Length| value used for all four cell margins
+        or a `(left, top, right, bottom)` sequence of them. *anchor* is
+        a member of :ref:`MsoVerticalAnchor`.
+
+        The requested formatting is built once and a copy of it is grafted
+        onto each cell, so this is much faster than formatting each cell
+        through its |_Cell| object.
+        """
+        tcPr = self._tcPr(fill, margins, anchor)
+        rPr = None if font is None else self._rPr(font)
+        first_row, end_row = self._rows
+        first_col, end_col = self._cols
+        for tr in self._tbl.tr_lst[first_row:end_row]:
+            for tc in tr.tc_lst[first_col:end_col]:
+                tc.apply_format(tcPr, rPr, align)
+
+    @staticmethod
+    def _rPr(font):
+        """
+        Return an ``<a:rPr>`` element having the character formatting
+        described by *font*, a dict of |Font| property values.
+        """
+        rPr = parse_xml('<a:rPr %s/>' % nsdecls('a'))
+        font_ = Font(rPr)
+        for name, value in font.items():
+            if name == 'color':
+                _set_color(font_.color, value)
+                continue
+            if not isinstance(getattr(Font, name, None), property):
+                raise ValueError("no font property named '%s'" % name)
+            setattr(font_, name, value)
+        return rPr
+
+    @staticmethod
+    def _tcPr(fill, margins, anchor):
+        """
+        Return an ``<a:tcPr>`` element having the cell formatting described
+        by *fill*, *margins* and *anchor*, or |None| when all three are
+        |None|.
+        """
+        if fill is None and margins is None and anchor is None:
+            return None
+        tcPr = parse_xml('<a:tcPr %s/>' % nsdecls('a'))
+        if fill is not None:
+            fill_format = FillFormat.from_fill_parent(tcPr)
+            fill_format.solid()
+            _set_color(fill_format.fore_color, fill)
+        if margins is not None:
+            if is_integer(margins):
+                margins = (margins,) * 4
+            tcPr.marL, tcPr.marT, tcPr.marR, tcPr.marB = margins
+        if anchor is not None:
+            tcPr.anchor = anchor
+        return tcPr
+
+
 class _CellCollection(Subshape):
     """
     "Horizontal" sequence of row cells
@@ -399,3 +687,51 @@ class _RowCollection(Subshape):
         Called by a row when its height changes. Pass along to parent.
         """
         self._parent.notify_height_changed()
+
+
+def _cell_point_size(tc, default):
+    """
+    Return the largest font size in points explicitly applied to a run in
+    *tc*, or *default* when no run in the cell has an explicit size.
+    """
+    sizes = tc.xpath('./a:txBody/a:p/a:r/a:rPr/@sz')
+    if not sizes:
+        return default
+    return (max(int(sz) for sz in sizes) + 50) // 100
+
+
+def _cell_texts(data, number_format):
+    """
+    Return list of rows of unicode cell text for the values in *data*.
+
+    *data* and *number_format* are as described for :meth:`Table.fill`.
+    Array-like *data* is converted to nested lists in a single step before
+    its values are formatted.
+    """
+    if hasattr(data, 'to_numpy'):
+        data = data.to_numpy()
+    if hasattr(data, 'tolist'):
+        data = data.tolist()
+
+    def text(value):
+        if is_string(value):
+            return to_unicode(value)
+        if value is None:
+            return ''
+        if number_format is not None and isinstance(value, Number) and (
+                not isinstance(value, bool)):
+            return Unicode(format(value, number_format))
+        return Unicode(value)
+
+    return [[text(value) for value in row] for row in data]
+
+
+def _set_color(color_format, color):
+    """
+    Set *color_format* to *color*, either an |RGBColor| value or a member of
+    the MSO_THEME_COLOR enumeration.
+    """
+    if isinstance(color, RGBColor):
+        color_format.rgb = color
+    else:
+        color_format.theme_color = color
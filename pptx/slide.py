@@ -288,6 +288,45 @@ class Slides(ParentedElementProxy):
         self._sldIdLst.add_sldId(rId)
         return slide
 
+    def add_slides(self, slide_layout, count):
+        """
+        Return a list of *count* newly added slides, each inheriting layout
+        from *slide_layout*, in the order they were appended. The result is
+        the same as calling :meth:`add_slide` *count* times, but much faster
+        when *count* is large. The placeholders of *slide_layout* are cloned
+        once, onto the first new slide, and each following slide receives
+        a copy of that slide's XML. Partnames, relationship ids and slide
+        ids are allocated for the whole batch at once.
+        """
+        if count < 1:
+            return []
+        slide = self.add_slide(slide_layout)
+        pairs = self.part.add_slides(slide_layout, slide._element, count - 1)
+        self._sldIdLst.add_sldIds([rId for rId, _ in pairs])
+        return [slide] + [new_slide for _, new_slide in pairs]
+
+    def duplicate(self, slide, index=None, copy_notes=True):
+        """
+        Return a newly added slide that is a copy of *slide*, appended to
+        this collection or, when *index* is provided, inserted at that
+        zero-based position.
+
+        The copy shares images, media and the slide layout of *slide*, so no
+        binary content is duplicated. Each chart on the slide is copied
+        along with its embedded workbook, so the charts of the copy can be
+        changed without affecting the original. The notes slide of *slide*,
+        if any, is copied when *copy_notes* is |True|.
+        """
+        rId, new_slide = self.part.duplicate_slide(slide.part, copy_notes)
+        sldId = self._sldIdLst.add_sldId(rId)
+        if index is not None:
+            self._sldIdLst.insert(index, sldId)
+            self.part.reset_slide_lookup()
+            self.part.rename_slide_parts(
+                [sldId.rId for sldId in self._sldIdLst]
+            )
+        return new_slide
+
     def get(self, slide_id, default=None):
         """
         Return the slide identified by integer *slide_id* in this
@@ -303,10 +342,35 @@ class Slides(ParentedElementProxy):
         Map *slide* to an integer representing its zero-based position in
         this slide collection. Raises |ValueError| on *slide* not present.
         """
-        for idx, this_slide in enumerate(self):
-            if this_slide == slide:
-                return idx
-        raise ValueError('%s is not in slide collection' % slide)
+        try:
+            return self.part.slide_index(slide.part)
+        except ValueError:
+            raise ValueError('%s is not in slide collection' % slide)
+
+    def move(self, slide, new_index):
+        """
+        Move *slide* to zero-based position *new_index* in this collection,
+        shifting the slides between its old and new positions by one.
+        Only the slide list entry of *slide* is moved; slide parts are not
+        renamed. Raises |ValueError| if *slide* is not in this collection
+        and |IndexError| if *new_index* is out of range.
+        """
+        if not 0 <= new_index < len(self._sldIdLst):
+            raise IndexError('slide index out of range')
+        sldId = self._sldIdLst[self.index(slide)]
+        self._sldIdLst.remove(sldId)
+        self._sldIdLst.insert(new_index, sldId)
+        self.part.reset_slide_lookup()
+
+    def remove(self, slide):
+        """
+        Remove *slide* from this presentation, along with any hyperlink to it
+        from another slide. Its notes slide and charts, and any image or
+        media used only by it, are no longer saved with the presentation.
+        Slides following it move up one position. Raises |ValueError| if
+        *slide* is not in this collection.
+        """
+        self.part.remove_slide(slide.part)
 
 
 class SlideLayout(_BaseSlide):
@@ -8,6 +8,8 @@ from __future__ import absolute_import, print_function
 
 from PIL import ImageFont
 
+from ..util import lazyproperty
+
 
 class TextFitter(tuple):
     """
@@ -113,6 +115,72 @@ class TextFitter(tuple):
         return lines
 
 
+class TextMeasurer(object):
+    """
+    Measures lines of text rendered at *point_size* in the font defined in
+    *font_file*, both unwrapped and word-wrapped within a given width. The
+    rendered width of each distinct word is measured only once by a given
+    measurer, so measuring a large body of text, such as the cells of
+    a table, costs little more than splitting it into words.
+    """
+    def __init__(self, font_file, point_size):
+        super(TextMeasurer, self).__init__()
+        self._font_file = font_file
+        self._point_size = point_size
+        self._widths = {}
+
+    def line_count(self, line, width):
+        """
+        Return the number of lines *line* occupies when wrapped at word
+        boundaries to fit within *width* (EMU). A word wider than *width*
+        occupies a line of its own. A line with no words occupies one line.
+        """
+        words = line.split()
+        if not words:
+            return 1
+        space_width = self._word_width(' ')
+        count = 1
+        x = self._word_width(words[0])
+        for word in words[1:]:
+            word_width = self._word_width(word)
+            if x + space_width + word_width <= width:
+                x += space_width + word_width
+            else:
+                count += 1
+                x = word_width
+        return count
+
+    @lazyproperty
+    def line_height(self):
+        """
+        Height in EMU of a single line of text.
+        """
+        return _rendered_size('Ty', self._point_size, self._font_file)[1]
+
+    def line_width(self, line):
+        """
+        Return the width in EMU of *line* when rendered on a single line.
+        """
+        words = line.split()
+        if not words:
+            return 0
+        return (
+            sum(self._word_width(word) for word in words) +
+            self._word_width(' ') * (len(words) - 1)
+        )
+
+    def _word_width(self, word):
+        """
+        Return the rendered width of *word*, measuring it only on first use.
+        """
+        widths = self._widths
+        if word not in widths:
+            widths[word] = _rendered_size(
+                word, self._point_size, self._font_file
+            )[0]
+        return widths[word]
+
+
 class _BinarySearchTree(object):
     """
     A node in a binary search tree. Uniform for root, subtree root, and leaf
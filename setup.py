@@ -43,7 +43,7 @@ PACKAGES = find_packages(exclude=['tests', 'tests.*'])
 PACKAGE_DATA = {'pptx': ['templates/*']}
 
 INSTALL_REQUIRES = [
-    'lxml>=3.1.0',
+    'lxml>=3.5.0',
     'Pillow>=3.3.2',
     'XlsxWriter>=0.5.7',
 ]
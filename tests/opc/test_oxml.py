@@ -8,13 +8,17 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from lxml import etree
+
+from pptx.compat import BytesIO
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.oxml import (
     CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types,
-    oxml_tostring, serialize_part_xml
+    minify_part_xml, oxml_tostring, serialize_part_xml, write_part_xml
 )
 from pptx.oxml import parse_xml
 
+from ..unitutil.cxml import element, xml
 from .unitdata.rels import (
     a_Default, an_Override, a_Relationship, a_Relationships, a_Types
 )
@@ -132,6 +136,61 @@ class DescribeCT_Types(object):
         assert types.xml == expected_types_xml
 
 
+class DescribeMinifyPartXml(object):
+
+    def it_hoists_and_removes_redundant_namespace_declarations(self):
+        part_elm = parse_xml(
+            '<f:foo xmlns:f="http://foo" xmlns:u="http://unused"><f:bar xmlns:'
+            'f="http://foo" xmlns:b="http://bar"><b:baz/></f:bar><b:baz xmlns:'
+            'b="http://bar" xmlns:x="http://x"/></f:foo>'
+        )
+        minify_part_xml(part_elm)
+        assert oxml_tostring(part_elm) == (
+            b'<f:foo xmlns:f="http://foo" xmlns:u="http://unused" xmlns:b="ht'
+            b'tp://bar"><f:bar><b:baz/></f:bar><b:baz/></f:foo>'
+        )
+
+    def it_keeps_prefixes_named_by_markup_compatibility_attributes(self):
+        part_elm = parse_xml(
+            '<f:foo xmlns:f="http://foo" xmlns:mc="http://schemas.openxmlforma'
+            'ts.org/markup-compatibility/2006"><mc:AlternateContent xmlns:q="'
+            'http://q"><mc:Choice Requires="q"><f:bar/></mc:Choice></mc:Alter'
+            'nateContent><f:baz xmlns:i="http://i" mc:Ignorable="i"/></f:foo>'
+        )
+        minify_part_xml(part_elm)
+        xml = oxml_tostring(part_elm)
+        assert b'xmlns:q="http://q"' in xml
+        assert b'xmlns:i="http://i"' in xml
+
+    def it_leaves_a_conflicting_prefix_declaration_in_place(self):
+        part_elm = parse_xml(
+            '<f:foo xmlns:f="http://foo"><f:bar xmlns:f="http://bar"/></f:foo>'
+        )
+        minify_part_xml(part_elm)
+        assert oxml_tostring(part_elm) == (
+            b'<f:foo xmlns:f="http://foo"><f:bar xmlns:f="http://bar"/></f:fo'
+            b'o>'
+        )
+
+    def it_strips_ignorable_whitespace(self):
+        part_elm = etree.fromstring(
+            '<f:foo xmlns:f="http://foo">\n  <f:bar>\n    <f:t>  </f:t>\n  <'
+            '/f:bar>\n  <f:baz xml:space="preserve">\n  <f:t/>\n  </f:baz>\n'
+            '</f:foo>\n'
+        )
+        minify_part_xml(part_elm)
+        assert oxml_tostring(part_elm) == (
+            b'<f:foo xmlns:f="http://foo"><f:bar><f:t>  </f:t></f:bar><f:baz '
+            b'xml:space="preserve">\n  <f:t/>\n  </f:baz></f:foo>'
+        )
+
+    def it_strips_whitespace_in_elements_having_a_text_property(self):
+        cxml = 'a:p/(a:r/(a:rPr,a:t),a:br/a:rPr,a:fld/(a:rPr,a:t"\t"))'
+        part_elm = element(cxml)
+        minify_part_xml(part_elm)
+        assert part_elm.xml == xml(cxml)
+
+
 class DescribeSerializePartXml(object):
 
     def it_produces_properly_formatted_xml_for_an_opc_part(
@@ -150,6 +209,12 @@ class DescribeSerializePartXml(object):
         # len of 134 if it's unicode and 137 if it's bytes
         assert len(xml) == 137
 
+    def it_can_write_the_same_xml_to_a_file(
+            self, part_elm, expected_part_xml):
+        file = BytesIO()
+        write_part_xml(part_elm, file)
+        assert file.getvalue() == expected_part_xml
+
     # fixtures -----------------------------------
 
     @pytest.fixture
@@ -15,6 +15,7 @@ from pptx.opc.package import (
     Unmarshaller, XmlPart
 )
 from pptx.opc.pkgreader import PackageReader
+from pptx.oxml import parse_xml
 from pptx.oxml.xmlchemy import BaseOxmlElement
 from pptx.package import Package
 
@@ -37,9 +38,20 @@ class DescribeOpcPackage(object):
         # verify -----------------------
         PackageReader_.from_file.assert_called_once_with(pkg_file)
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
-                                                        PartFactory_)
+                                                        PartFactory_, None)
         assert isinstance(pkg, OpcPackage)
 
+    def it_can_open_a_pkg_file_with_a_part_filter(
+            self, PackageReader_, PartFactory_, Unmarshaller_):
+        pkg_file, part_filter = Mock(name='pkg_file'), Mock(name='filter')
+        pkg_reader = PackageReader_.from_file.return_value
+
+        pkg = OpcPackage.open(pkg_file, part_filter)
+
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            pkg_reader, pkg, PartFactory_, part_filter
+        )
+
     def it_initializes_its_rels_collection_on_first_reference(
             self, RelationshipCollection_):
         pkg = OpcPackage()
@@ -105,6 +117,20 @@ class DescribeOpcPackage(object):
             pkg_file_, pkg._rels, parts_
         )
 
+    def it_can_minify_its_parts_when_saving(
+            self, pkg_file_, PackageWriter_, parts, parts_):
+        part_, part_2_ = parts_
+        part_.partname, part_2_.partname = 'foo', 'bar'
+        part_.content_type = part_2_.content_type = 'text/xml'
+        part_.load_size, part_2_.load_size = 100, None
+        PackageWriter_.write.return_value = {'foo': 60, 'bar': 40}
+
+        savings = OpcPackage().save(pkg_file_, minify=True)
+
+        for part in parts_:
+            part.minify.assert_called_once_with()
+        assert savings == {'text/xml': 40}
+
     def it_can_be_notified_after_unmarshalling_is_complete(self, pkg):
         pkg.after_unmarshal()
 
@@ -323,6 +349,17 @@ class DescribePart(object):
         part.blob = new_blob
         assert part.blob == new_blob
 
+    def it_leaves_its_blob_unchanged_on_minify(self, blob_fixture):
+        part, load_blob = blob_fixture
+        part.minify()
+        assert part.blob is load_blob
+
+    def it_can_write_its_blob_to_a_file(self, blob_fixture):
+        part, load_blob = blob_fixture
+        file_ = Mock(name='file')
+        part.write_blob(file_)
+        file_.write.assert_called_once_with(load_blob)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -559,6 +596,7 @@ class DescribeXmlPart(object):
             partname_, content_type_, element_, package_
         )
         assert isinstance(part, XmlPart)
+        assert part.load_size == len(blob_)
 
     def it_can_serialize_to_xml(self, blob_fixture):
         xml_part, element_, serialize_part_xml_ = blob_fixture
@@ -566,6 +604,24 @@ class DescribeXmlPart(object):
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    def it_can_minify_its_xml(self):
+        xml_part = XmlPart(None, None, parse_xml(
+            '<f:foo xmlns:f="http://foo"><f:bar xmlns:f="http://foo"/></f:foo>'
+        ), None)
+        xml_part.minify()
+        assert xml_part.blob == (
+            b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+            b'<f:foo xmlns:f="http://foo"><f:bar/></f:foo>'
+        )
+
+    def it_can_write_its_xml_to_a_file(self, request, element_):
+        write_part_xml_ = function_mock(
+            request, 'pptx.opc.package.write_part_xml'
+        )
+        xml_part, file_ = XmlPart(None, None, element_, None), Mock()
+        xml_part.write_blob(file_)
+        write_part_xml_.assert_called_once_with(element_, file_)
+
     def it_knows_its_the_part_for_its_child_objects(self, part_fixture):
         xml_part = part_fixture
         assert xml_part.part is xml_part
@@ -760,6 +816,29 @@ class DescribeRelationshipCollection(object):
         assert rels[rId] == rel
         assert rel == _Relationship_.return_value
 
+    def it_can_add_relationships_to_many_parts(self):
+        rels = RelationshipCollection('/ppt')
+        rels.add_relationship('reltype', 'part_1', 'rId1')
+        rels.add_relationship('reltype', 'part_3', 'rId3')
+
+        rIds = rels.add_relationships('foo', ['part_a', 'part_b', 'part_c'])
+
+        assert rIds == ['rId2', 'rId4', 'rId5']
+        assert [rels[rId].target_part for rId in rIds] == [
+            'part_a', 'part_b', 'part_c'
+        ]
+        assert all(rels[rId].reltype == 'foo' for rId in rIds)
+
+    def it_can_remove_a_relationship(self):
+        rels = RelationshipCollection('/ppt')
+        rels.add_relationship('reltype', 'part_1', 'rId1')
+        rels.add_relationship('reltype', 'part_2', 'rId2')
+
+        del rels['rId1']
+
+        assert list(rels.keys()) == ['rId2']
+        assert rels.related_parts == {'rId2': 'part_2'}
+
     def it_can_add_an_external_relationship(self, add_ext_rel_fixture_):
         rels, reltype, url = add_ext_rel_fixture_
         rId = rels.get_or_add_ext_rel(reltype, url)
@@ -863,7 +942,7 @@ class DescribeUnmarshaller(object):
         Unmarshaller.unmarshal(pkg_reader_, pkg_, part_factory_)
         # verify -----------------------
         _unmarshal_parts.assert_called_once_with(
-            pkg_reader_, pkg_, part_factory_
+            pkg_reader_, pkg_, part_factory_, None
         )
         _unmarshal_relationships.assert_called_once_with(
             pkg_reader_, pkg_, parts_dict_
@@ -892,6 +971,30 @@ class DescribeUnmarshaller(object):
         )
         assert parts == parts_dict_
 
+    def it_loads_parts_rejected_by_the_filter_as_plain_parts(
+            self, request, pkg_reader_, pkg_, part_factory_, partnames_,
+            content_types_, blobs_):
+        partname_, partname_2_ = partnames_
+        content_type_, content_type_2_ = content_types_
+        blob_, blob_2_ = blobs_
+        part_ = instance_mock(request, Part)
+        Part_load_ = method_mock(
+            request, Part, 'load', autospec=False, return_value=part_
+        )
+        part_filter = {content_type_: True, content_type_2_: False}.get
+
+        parts = Unmarshaller._unmarshal_parts(
+            pkg_reader_, pkg_, part_factory_, part_filter
+        )
+
+        part_factory_.assert_called_once_with(
+            partname_, content_type_, blob_, pkg_
+        )
+        Part_load_.assert_called_once_with(
+            partname_2_, content_type_2_, blob_2_, pkg_
+        )
+        assert parts[partname_2_] is part_
+
     def it_can_unmarshal_relationships(self):
         # test data --------------------
         reltype = 'http://reltype'
@@ -14,12 +14,13 @@ except ImportError:
 import hashlib
 import pytest
 
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 from pptx.exceptions import PackageNotFoundError
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipMemberBuffer,
+    _ZipPkgReader, _ZipPkgWriter
 )
 
 from ..unitutil.file import absjoin, test_file_dir
@@ -47,6 +48,12 @@ class DescribeDirPkgReader(object):
         sha1 = hashlib.sha1(blob).hexdigest()
         assert sha1 == '51b78f4dabc0af2419d4e044ab73028c4bef53aa'
 
+    def it_can_open_the_file_for_a_pack_uri(self, dir_reader):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        with dir_reader.open(pack_uri) as f:
+            blob = f.read()
+        assert blob == dir_reader.blob_for(pack_uri)
+
     def it_can_get_the_content_types_xml(self, dir_reader):
         sha1 = hashlib.sha1(dir_reader.content_types_xml).hexdigest()
         assert sha1 == 'a68cf138be3c4eb81e47e2550166f9949423c7df'
@@ -109,6 +116,12 @@ class DescribeZipPkgReader(object):
         sha1 = hashlib.sha1(blob).hexdigest()
         assert sha1 == 'efa7bee0ac72464903a67a6744c1169035d52a54'
 
+    def it_can_open_the_member_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        with phys_reader.open(pack_uri) as f:
+            blob = f.read()
+        assert blob == phys_reader.blob_for(pack_uri)
+
     def it_has_the_content_types_xml(self, phys_reader):
         sha1 = hashlib.sha1(phys_reader.content_types_xml).hexdigest()
         assert sha1 == 'ab762ac84414fce18893e18c3f53700c01db56c3'
@@ -174,6 +187,38 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_stream_a_member(self, pkg_file):
+        pack_uri = PackURI('/part/name.xml')
+        pkg_writer = PhysPkgWriter(pkg_file)
+
+        with pkg_writer.open(pack_uri) as stream:
+            stream.write(b'<Blobbity')
+            stream.write(b'FooBlob/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        zinfo = zipf.getinfo(pack_uri.membername)
+        retrieved_blob = zipf.read(pack_uri.membername)
+        zipf.close()
+        assert retrieved_blob == b'<BlobbityFooBlob/>'
+        assert zinfo.compress_type == ZIP_DEFLATED
+
+    def it_buffers_a_member_when_streaming_is_not_supported(self, pkg_file):
+        pack_uri = PackURI('/part/name.xml')
+        zipf = ZipFile(pkg_file, 'w')
+        zinfo = ZipInfo(pack_uri.membername)
+
+        stream = _ZipMemberBuffer(zipf, zinfo)
+        stream.write(b'<BlobbityFooBlob/>')
+        stream.close()
+        stream.close()
+        zipf.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.namelist() == [pack_uri.membername]
+        assert zipf.read(pack_uri.membername) == b'<BlobbityFooBlob/>'
+        zipf.close()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -26,7 +26,7 @@ class DescribePackageWriter(object):
         parts = Mock(name='parts')
         phys_writer = PhysPkgWriter_.return_value
         # exercise ---------------------
-        PackageWriter.write(pkg_file, pkg_rels, parts)
+        sizes = PackageWriter.write(pkg_file, pkg_rels, parts)
         # verify -----------------------
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
@@ -36,6 +36,7 @@ class DescribePackageWriter(object):
         PhysPkgWriter_.assert_called_once_with(pkg_file)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
+        assert sizes is _write_methods._write_parts.return_value
 
     def it_can_write_a_content_types_stream(
             self, xml_for, serialize_part_xml_):
@@ -63,20 +64,25 @@ class DescribePackageWriter(object):
 
     def it_can_write_a_list_of_parts(self):
         # mockery ----------------------
-        phys_writer = Mock(name='phys_writer')
+        phys_writer = MagicMock(name='phys_writer')
+        stream = phys_writer.open.return_value.__enter__.return_value
         rels = MagicMock(name='rels')
         rels.__len__.return_value = 1
         part1 = Mock(name='part1', _rels=rels)
         part2 = Mock(name='part2', _rels=[])
+        part1.write_blob.side_effect = lambda file: file.write(b'foo')
+        part2.write_blob.side_effect = lambda file: file.write(b'')
         # exercise ---------------------
-        PackageWriter._write_parts(phys_writer, [part1, part2])
+        sizes = PackageWriter._write_parts(phys_writer, [part1, part2])
         # verify -----------------------
-        expected_calls = [
-            call(part1.partname, part1.blob),
+        assert phys_writer.open.call_args_list == [
+            call(part1.partname), call(part2.partname)
+        ]
+        assert stream.write.call_args_list == [call(b'foo'), call(b'')]
+        assert phys_writer.write.mock_calls == [
             call(part1.partname.rels_uri, part1._rels.xml),
-            call(part2.partname, part2.blob),
         ]
-        assert phys_writer.write.mock_calls == expected_calls
+        assert sizes == {part1.partname: 3, part2.partname: 0}
 
     # fixtures ---------------------------------------------
 
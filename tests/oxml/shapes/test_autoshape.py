@@ -14,7 +14,27 @@ from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.shared import ST_Direction, ST_PlaceholderSize
 
 from ..unitdata.shape import a_gd, a_prstGeom, an_avLst
-from ...unitutil.cxml import element
+from ...unitutil.cxml import element, xml
+
+
+class DescribeCT_Path2D(object):
+
+    def it_can_add_drawing_operations_in_one_step(self):
+        path = element('a:path/a:moveTo/a:pt{x=0,y=0}')
+
+        path.add_operations(
+            (('a:lnTo', 10, 20), ('a:close', 0, 0), ('a:moveTo', 5, -5))
+        )
+
+        assert path.xml == xml(
+            'a:path/(a:moveTo/a:pt{x=0,y=0},a:lnTo/a:pt{x=10,y=20},a:close,'
+            'a:moveTo/a:pt{x=5,y=-5})'
+        )
+
+    def it_adds_nothing_when_there_are_no_operations(self):
+        path = element('a:path')
+        path.add_operations(())
+        assert path.xml == xml('a:path')
 
 
 class DescribeCT_PresetGeometry2D(object):
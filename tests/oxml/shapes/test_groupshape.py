@@ -8,6 +8,7 @@ from __future__ import (
 
 import pytest
 
+from pptx.oxml.ns import qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.groupshape import CT_GroupShape
@@ -40,7 +41,7 @@ class DescribeCT_GroupShape(object):
     def it_can_add_a_grpSp_element(self, add_grpSp_fixture):
         spTree, expected_grpSp_xml, expected_xml = add_grpSp_fixture
 
-        grpSp = spTree.add_grpSp()
+        grpSp = spTree.add_grpSp(1, 'Group 0')
 
         assert grpSp.xml == expected_grpSp_xml
         assert spTree.xml == expected_xml
@@ -86,6 +87,47 @@ class DescribeCT_GroupShape(object):
         insert_element_before_.assert_called_once_with(sp_, 'p:extLst')
         assert sp is sp_
 
+    def it_can_add_textbox_sp_elements_in_bulk(self):
+        spTree = element('p:spTree/(p:nvGrpSpPr,p:grpSpPr,p:sp,p:extLst)')
+        sps = spTree.add_textboxes(
+            (5, 6), ('TextBox 4', 'Foo'), (1, 2), (3, 4), (10, 20), (30, 40)
+        )
+        assert [sp.tag for sp in spTree][2:] == [
+            qn('p:sp'), qn('p:sp'), qn('p:sp'), qn('p:extLst')
+        ]
+        assert spTree[3:5] == sps
+        expected_sp = CT_Shape.new_textbox_sp(6, 'Foo', 2, 4, 20, 40)
+        assert sps[1].xml == expected_sp.xml
+
+    def it_can_add_autoshape_sp_elements_in_bulk(self):
+        spTree = element('p:spTree/(p:nvGrpSpPr,p:grpSpPr)')
+        sps = spTree.add_autoshapes(
+            (2, 3), ('Oval 1', 'Oval 2'), 'ellipse', (1, 2), (3, 4), (5, 6),
+            (7, 8)
+        )
+        assert spTree[2:] == sps
+        assert [sp.xml for sp in sps] == [
+            CT_Shape.new_autoshape_sp(2, 'Oval 1', 'ellipse', 1, 3, 5, 7).xml,
+            CT_Shape.new_autoshape_sp(3, 'Oval 2', 'ellipse', 2, 4, 6, 8).xml,
+        ]
+
+    def it_increments_its_version_on_each_change_to_its_children(self):
+        spTree = element('p:spTree/(p:nvGrpSpPr,p:grpSpPr)')
+        sp = element('p:sp')
+        versions = [spTree.version]
+        for change in (
+            lambda: spTree.append(sp),
+            lambda: spTree.remove(sp),
+            lambda: spTree.insert(0, sp),
+            lambda: spTree.extend([element('p:sp')]),
+            lambda: spTree.insert_element_before(element('p:sp'), 'p:extLst'),
+            lambda: spTree.increment_version(),
+        ):
+            change()
+            versions.append(spTree.version)
+        assert versions == sorted(set(versions))
+        assert versions[0] == 0
+
     def it_can_recalculate_its_pos_and_size(self, recalc_fixture):
         xSp, expected_xml, parent_sp, calls = recalc_fixture
 
@@ -94,6 +136,15 @@ class DescribeCT_GroupShape(object):
         assert xSp.xml == expected_xml
         assert parent_sp.recalculate_extents.call_args_list == calls
 
+    def it_can_recalculate_only_its_own_pos_and_size(self, getparent_):
+        grpSp = element(
+            'p:grpSp/(p:grpSpPr/a:xfrm,p:sp/p:spPr/a:xfrm/(a:off{x=1,y=2},a:'
+            'ext{cx=3,cy=4}))'
+        )
+        grpSp.recalculate_extents(recursive=False)
+        assert (grpSp.x, grpSp.y, grpSp.cx, grpSp.cy) == (1, 2, 3, 4)
+        assert getparent_.call_count == 0
+
     def it_calculates_its_child_extents_to_help(self, child_exts_fixture):
         xSp, expected_values = child_exts_fixture
         x, y, cx, cy = xSp._child_extents
@@ -6,9 +6,13 @@ Test suite for pptx.oxml.table module.
 
 from __future__ import absolute_import, print_function
 
+import pytest
+
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.table import CT_Table
 
+from ...unitutil.cxml import element, xml
+
 
 class DescribeCT_Table(object):
 
@@ -40,3 +44,80 @@ class DescribeCT_Table(object):
         )
         tbl = CT_Table.new_tbl(2, 3, 334, 445)
         assert tbl.xml == expected_xml
+
+    def it_can_set_the_text_of_a_block_of_cells(self):
+        tbl = element(
+            'a:tbl/(a:tr/(a:tc,a:tc,a:tc),a:tr/(a:tc,a:tc,a:tc/a:txBody/(a:bod'
+            'yPr,a:p/(a:pPr{algn=r},a:r/a:t"old",a:endParaRPr),a:p)))'
+        )
+
+        tbl.set_cell_texts([['a', ''], ['b', 'c\nd']], 0, 1)
+
+        assert tbl.xml == xml(
+            'a:tbl/(a:tr/(a:tc,a:tc/a:txBody/(a:bodyPr,a:p/a:r/a:t"a"),a:tc/a'
+            ':txBody/(a:bodyPr,a:p)),a:tr/(a:tc,a:tc/a:txBody/(a:bodyPr,a:p/a'
+            ':r/a:t"b"),a:tc/a:txBody/(a:bodyPr,a:p/(a:pPr{algn=r},a:r/a:t"c"'
+            ',a:br,a:r/a:t"d",a:endParaRPr))))'
+        )
+
+    def but_it_raises_when_the_block_does_not_fit(self, fit_raise_fixture):
+        tbl, texts, row_offset, col_offset = fit_raise_fixture
+        with pytest.raises(ValueError):
+            tbl.set_cell_texts(texts, row_offset, col_offset)
+        assert tbl.xml == xml('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
+
+    def it_can_gather_the_text_of_its_cells(self, text_rows_fixture):
+        tbl, fill_merged, expected_value = text_rows_fixture
+        assert tbl.text_rows(fill_merged) == expected_value
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ([['a'], ['b'], ['c']], 0, 0),
+        ([['a', 'b', 'c']],     0, 0),
+        ([['a'], ['b']],        1, 0),
+        ([['a', 'b']],          0, 1),
+        ([['a']],               -1, 0),
+    ])
+    def fit_raise_fixture(self, request):
+        texts, row_offset, col_offset = request.param
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
+        return tbl, texts, row_offset, col_offset
+
+    @pytest.fixture(params=[
+        (False, [['a', None, 'b'], [None, None, 'c\nd']]),
+        (True,  [['a', 'a', 'b'], ['a', 'a', 'c\nd']]),
+    ])
+    def text_rows_fixture(self, request):
+        fill_merged, expected_value = request.param
+        tbl = element(
+            'a:tbl/(a:tr/(a:tc{gridSpan=2,rowSpan=2}/a:txBody/a:p/a:r/a:t"a"'
+            ',a:tc{hMerge=1},a:tc/a:txBody/a:p/a:r/a:t"b"),a:tr/(a:tc{gridSpa'
+            'n=2,vMerge=1},a:tc{hMerge=1,vMerge=1},a:tc/a:txBody/(a:p/a:r/a:t'
+            '"c",a:p/a:r/a:t"d")))'
+        )
+        return tbl, fill_merged, expected_value
+
+
+class DescribeCT_TableCell(object):
+
+    def it_knows_the_lines_of_text_it_contains(self, lines_fixture):
+        tc, expected_value = lines_fixture
+        assert tc.text_lines == expected_value
+
+    def it_knows_the_text_it_contains(self, lines_fixture):
+        tc, expected_lines = lines_fixture
+        assert tc.cell_text == '\n'.join(expected_lines)
+        assert tc.text is None
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('a:tc',                                  []),
+        ('a:tc/a:txBody/a:p',                     ['']),
+        ('a:tc/a:txBody/(a:p/(a:r/a:t"foo",a:br,a:r/a:t"bar"),a:p/a:r/a:t"b'
+         'az")',                                  ['foo', 'bar', 'baz']),
+    ])
+    def lines_fixture(self, request):
+        tc_cxml, expected_value = request.param
+        return element(tc_cxml), expected_value
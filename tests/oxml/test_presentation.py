@@ -18,6 +18,31 @@ class DescribeCT_SlideIdList(object):
         sldIdLst.add_sldId('rId1')
         assert sldIdLst.xml == expected_xml
 
+    def it_can_add_many_sldId_elements(self):
+        sldIdLst = element('p:sldIdLst/p:sldId{r:id=rId4,id=300}')
+
+        sldIds = sldIdLst.add_sldIds(['rId1', 'rId2'])
+
+        assert sldIdLst.xml == xml(
+            'p:sldIdLst/(p:sldId{r:id=rId4,id=300},p:sldId{r:id=rId1,id=301}'
+            ',p:sldId{r:id=rId2,id=302})'
+        )
+        assert sldIds == sldIdLst.sldId_lst[1:]
+
+    def it_increments_its_version_on_each_change_to_its_children(self):
+        sldIdLst = element('p:sldIdLst/p:sldId{r:id=rId1,id=256}')
+        sldId = sldIdLst[0]
+        versions = [sldIdLst.version]
+        for change in (
+            lambda: sldIdLst.add_sldId('rId2'),
+            lambda: sldIdLst.remove(sldId),
+            lambda: sldIdLst.insert(1, sldId),
+            lambda: sldIdLst.add_sldIds(['rId3', 'rId4']),
+        ):
+            change()
+            versions.append(sldIdLst.version)
+        assert versions == sorted(set(versions))
+
     def it_knows_the_next_available_slide_id(self, next_id_fixture):
         sldIdLst, expected_id = next_id_fixture
         assert sldIdLst._next_id == expected_id
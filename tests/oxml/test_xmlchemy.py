@@ -8,6 +8,8 @@ provided by the metaclass-built test classes at the end of the file.
 
 from __future__ import absolute_import, print_function
 
+import threading
+
 import pytest
 
 from pptx.exc import InvalidXmlError
@@ -16,7 +18,8 @@ from pptx.oxml.ns import qn
 from pptx.oxml.simpletypes import BaseIntType
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, OneAndOnlyOne, OneOrMore, OptionalAttribute,
-    RequiredAttribute, ZeroOrMore, ZeroOrOne, ZeroOrOneChoice
+    RequiredAttribute, trusted_values, ZeroOrMore, ZeroOrOne,
+    ZeroOrOneChoice
 )
 
 from ..unitdata import BaseBuilder
@@ -239,6 +242,14 @@ class DescribeOptionalAttribute(object):
             "ST_IntegerType type-converted value of "
         )
 
+    def it_skips_validation_on_assign_when_values_are_trusted(self):
+        parent = a_parent().with_nsdecls().element
+        with trusted_values():
+            parent.optAttr = 99
+        assert parent.xml == a_parent().with_nsdecls().with_optAttr(99).xml()
+        with pytest.raises(ValueError):
+            parent.optAttr = 99
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -283,6 +294,34 @@ class DescribeRequiredAttribute(object):
         with pytest.raises(expected_exception):
             parent.reqAttr = value
 
+    def it_skips_validation_on_assign_when_values_are_trusted(self):
+        parent = a_parent().with_nsdecls().with_reqAttr(1).element
+        with trusted_values():
+            with trusted_values():
+                parent.reqAttr = 43
+            parent.reqAttr = -4
+        assert parent.reqAttr == -4
+        with pytest.raises(ValueError):
+            parent.reqAttr = 43
+
+    def it_trusts_values_only_on_the_thread_that_enabled_it(self):
+        parent = a_parent().with_nsdecls().with_reqAttr(1).element
+        errors = []
+
+        def assign_invalid_value():
+            try:
+                parent.reqAttr = 43
+            except ValueError as e:
+                errors.append(e)
+
+        with trusted_values():
+            thread = threading.Thread(target=assign_invalid_value)
+            thread.start()
+            thread.join()
+
+        assert len(errors) == 1
+        assert parent.reqAttr == 1
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
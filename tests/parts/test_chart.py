@@ -9,9 +9,11 @@ from __future__ import absolute_import, print_function
 import pytest
 
 from pptx.chart.chart import Chart
+from pptx.compat import BytesIO
 from pptx.chart.data import ChartData
 from pptx.enum.base import EnumValue
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
 from pptx.opc.package import OpcPackage
 from pptx.opc.packuri import PackURI
 from pptx.oxml.chart.chart import CT_ChartSpace
@@ -20,29 +22,77 @@ from pptx.parts.embeddedpackage import EmbeddedXlsxPart
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.mock import (
-    class_mock, instance_mock, method_mock, property_mock
+    class_mock, instance_mock, loose_mock, property_mock
 )
 
 
 class DescribeChartPart(object):
 
     def it_can_construct_from_chart_type_and_data(self, new_fixture):
-        chart_type_, chart_data_, package_ = new_fixture[:3]
-        partname_template, load_, partname_ = new_fixture[3:6]
-        content_type, chart_blob_, chart_part_, xlsx_blob_ = new_fixture[6:]
+        chart_type_, chart_data_, package_, EmbeddedXlsxPart_ = new_fixture[:4]
+        xlsx_blob_, xlsx_part_, expected_blob = new_fixture[4:]
 
         chart_part = ChartPart.new(chart_type_, chart_data_, package_)
 
+        package_.next_partname.assert_called_once_with(
+            '/ppt/charts/chart%d.xml'
+        )
+        EmbeddedXlsxPart_.new.assert_called_once_with(xlsx_blob_, package_)
         chart_data_.xml_bytes.assert_called_once_with(chart_type_)
-        package_.next_partname.assert_called_once_with(partname_template)
-        load_.assert_called_once_with(
-            partname_, content_type, chart_blob_, package_
+        assert isinstance(chart_part, ChartPart)
+        assert chart_part.partname == '/ppt/charts/chart1.xml'
+        assert chart_part.content_type == CT.DML_CHART
+        assert chart_part.related_parts['rId1'] is xlsx_part_
+        assert chart_part.blob == expected_blob
+
+    def it_can_clone_itself(self, request, package_):
+        package_.next_partname.return_value = PackURI(
+            '/ppt/charts/chart2.xml'
+        )
+        EmbeddedXlsxPart_ = class_mock(
+            request, 'pptx.parts.chart.EmbeddedXlsxPart'
+        )
+        xlsx_part_, style_part_ = loose_mock(request), loose_mock(request)
+        chart_part = ChartPart(
+            PackURI('/ppt/charts/chart1.xml'), CT.DML_CHART, None, package_,
+            blob=b'<c:chartSpace/>'
+        )
+        chart_part.rels.add_relationship(RT.PACKAGE, xlsx_part_, 'rId1')
+        chart_part.rels.add_relationship('foo/style', style_part_, 'rId2')
+
+        clone = chart_part.clone()
+
+        package_.next_partname.assert_called_once_with(
+            '/ppt/charts/chart%d.xml'
         )
-        chart_workbook_ = chart_part_.chart_workbook
-        chart_workbook_.update_from_xlsx_blob.assert_called_once_with(
-            xlsx_blob_
+        EmbeddedXlsxPart_.new.assert_called_once_with(
+            xlsx_part_.blob, package_
         )
-        assert chart_part is chart_part_
+        assert isinstance(clone, ChartPart)
+        assert clone.partname == '/ppt/charts/chart2.xml'
+        assert clone.content_type == CT.DML_CHART
+        assert clone.blob == b'<c:chartSpace/>'
+        assert clone.related_parts == {
+            'rId1': EmbeddedXlsxPart_.new.return_value, 'rId2': style_part_
+        }
+
+    def it_parses_its_generated_xml_only_when_needed(self, lazy_fixture):
+        chart_part, chart_blob = lazy_fixture
+        stream = BytesIO()
+
+        chart_part.write_blob(stream)
+
+        assert stream.getvalue() == chart_blob
+        assert chart_part._chartSpace is None
+        assert chart_part._element.xlsx_part_rId == 'rId1'
+        assert chart_part._blob is None
+        assert chart_part.blob == serialize_part_xml(chart_part._element)
+
+    def it_leaves_its_generated_xml_unparsed_on_minify(self, lazy_fixture):
+        chart_part, chart_blob = lazy_fixture
+        chart_part.minify()
+        assert chart_part._chartSpace is None
+        assert chart_part.blob == chart_blob
 
     def it_provides_access_to_the_chart_object(self, chart_fixture):
         chart_part, chart_, Chart_ = chart_fixture
@@ -65,15 +115,31 @@ class DescribeChartPart(object):
         chart_part = ChartPart(None, None, chartSpace_)
         return chart_part, chart_, Chart_
 
+    @pytest.fixture
+    def lazy_fixture(self):
+        chart_blob = (
+            '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
+            'gml/2006/chart" xmlns:r="http://schemas.openxmlformats.org/offi'
+            'ceDocument/2006/relationships"><c:chart/><c:externalData r:id="'
+            'rId1"/></c:chartSpace>'
+        ).encode('utf-8')
+        chart_part = ChartPart(None, None, None, None, chart_blob)
+        return chart_part, chart_blob
+
     @pytest.fixture
     def new_fixture(
-            self, chart_type_, chart_data_, package_, load_, partname_,
-            chart_blob_, chart_part_, xlsx_blob_):
-        partname_template = '/ppt/charts/chart%d.xml'
-        content_type = CT.DML_CHART
+            self, chart_type_, chart_data_, package_, EmbeddedXlsxPart_,
+            xlsx_blob_, xlsx_part_):
+        expected_blob = (
+            '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
+            'gml/2006/chart" xmlns:r="http://schemas.openxmlformats.org/offi'
+            'ceDocument/2006/relationships">\n  <c:chart/>\n<c:externalData'
+            ' r:id="rId1"><c:autoUpdate val="0"/></c:externalData></c:chartS'
+            'pace>\n'
+        ).encode('utf-8')
         return (
-            chart_type_, chart_data_, package_, partname_template, load_,
-            partname_, content_type, chart_blob_, chart_part_, xlsx_blob_
+            chart_type_, chart_data_, package_, EmbeddedXlsxPart_,
+            xlsx_blob_, xlsx_part_, expected_blob
         )
 
     @pytest.fixture
@@ -105,22 +171,17 @@ class DescribeChartPart(object):
         return instance_mock(request, Chart)
 
     @pytest.fixture
-    def chart_blob_(self, request):
-        return instance_mock(request, bytes)
-
-    @pytest.fixture
-    def chart_data_(self, request, chart_blob_, xlsx_blob_):
+    def chart_data_(self, request, xlsx_blob_):
         chart_data_ = instance_mock(request, ChartData)
-        chart_data_.xml_bytes.return_value = chart_blob_
+        chart_data_.xml_bytes.return_value = (
+            '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
+            'gml/2006/chart" xmlns:r="http://schemas.openxmlformats.org/offi'
+            'ceDocument/2006/relationships">\n  <c:chart/>\n</c:chartSpace>'
+            '\n'
+        ).encode('utf-8')
         chart_data_.xlsx_blob = xlsx_blob_
         return chart_data_
 
-    @pytest.fixture
-    def chart_part_(self, request, chart_workbook_):
-        chart_part_ = instance_mock(request, ChartPart)
-        chart_part_.chart_workbook = chart_workbook_
-        return chart_part_
-
     @pytest.fixture
     def chart_type_(self, request):
         return instance_mock(request, EnumValue)
@@ -130,25 +191,29 @@ class DescribeChartPart(object):
         return instance_mock(request, ChartWorkbook)
 
     @pytest.fixture
-    def load_(self, request, chart_part_):
-        return method_mock(
-            request, ChartPart, 'load', return_value=chart_part_
+    def EmbeddedXlsxPart_(self, request, xlsx_part_):
+        EmbeddedXlsxPart_ = class_mock(
+            request, 'pptx.parts.chart.EmbeddedXlsxPart'
         )
+        EmbeddedXlsxPart_.new.return_value = xlsx_part_
+        return EmbeddedXlsxPart_
 
     @pytest.fixture
-    def package_(self, request, partname_):
+    def package_(self, request):
         package_ = instance_mock(request, OpcPackage)
-        package_.next_partname.return_value = partname_
+        package_.next_partname.return_value = PackURI(
+            '/ppt/charts/chart1.xml'
+        )
         return package_
 
-    @pytest.fixture
-    def partname_(self, request):
-        return instance_mock(request, PackURI)
-
     @pytest.fixture
     def xlsx_blob_(self, request):
         return instance_mock(request, bytes)
 
+    @pytest.fixture
+    def xlsx_part_(self, request):
+        return instance_mock(request, EmbeddedXlsxPart)
+
 
 class DescribeChartWorkbook(object):
 
@@ -8,18 +8,20 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
-from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.package import Package
 from pptx.parts.coreprops import CorePropertiesPart
-from pptx.parts.presentation import PresentationPart
+from pptx.parts.presentation import PresentationPart, _SlideLookup
 from pptx.parts.slide import NotesMasterPart, SlidePart
 from pptx.presentation import Presentation
 from pptx.slide import NotesMaster, Slide, SlideLayout, SlideMaster
 
 from ..unitutil.cxml import element
 from ..unitutil.mock import (
-    call, class_mock, instance_mock, method_mock, property_mock
+    call, class_mock, instance_mock, loose_mock, method_mock, property_mock
 )
 
 
@@ -91,8 +93,9 @@ class DescribePresentationPart(object):
 
     def it_can_save_the_package_to_a_file(self, save_fixture):
         prs_part, file_, package_ = save_fixture
-        prs_part.save(file_)
-        package_.save.assert_called_once_with(file_)
+        savings = prs_part.save(file_, minify=True)
+        package_.save.assert_called_once_with(file_, True)
+        assert savings is package_.save.return_value
 
     def it_can_add_a_new_slide(self, add_slide_fixture):
         prs_part, slide_layout_, SlidePart_, partname = add_slide_fixture[:4]
@@ -110,6 +113,108 @@ class DescribePresentationPart(object):
         assert rId is rId_
         assert slide is slide_
 
+    def it_can_add_many_new_slides(self, request, package_, slide_layout_,
+                                   SlidePart_):
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None,
+            element('p:presentation/p:sldIdLst/p:sldId'), package_
+        )
+        sld = element('p:sld/p:cSld')
+        slide_parts_ = [
+            loose_mock(request, name='slide_part_%d' % n) for n in range(2)
+        ]
+        SlidePart_.new.side_effect = slide_parts_
+
+        pairs = prs_part.add_slides(slide_layout_, sld, 2)
+
+        calls = SlidePart_.new.call_args_list
+        assert [c[0][0] for c in calls] == [
+            '/ppt/slides/slide2.xml', '/ppt/slides/slide3.xml'
+        ]
+        for c in calls:
+            partname, package, slide_layout_part, new_sld = c[0]
+            assert package is package_
+            assert slide_layout_part is slide_layout_.part
+            assert new_sld is not sld
+            assert new_sld.xml == sld.xml
+        assert pairs == [
+            ('rId1', slide_parts_[0].slide), ('rId2', slide_parts_[1].slide)
+        ]
+        assert prs_part.related_parts['rId2'] is slide_parts_[1]
+
+    def it_can_duplicate_a_slide(self, request, package_):
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None,
+            element('p:presentation/p:sldIdLst/p:sldId'), package_
+        )
+        sld = element('p:sld/p:cSld')
+        slide_part = SlidePart(
+            PackURI('/ppt/slides/slide1.xml'), CT.PML_SLIDE, sld, package_
+        )
+        copy_relationships_ = method_mock(
+            request, SlidePart, 'copy_relationships', autospec=True
+        )
+
+        rId, slide = prs_part.duplicate_slide(slide_part, False)
+
+        new_slide_part = prs_part.related_parts[rId]
+        copy_relationships_.assert_called_once_with(
+            new_slide_part, slide_part, False
+        )
+        assert new_slide_part.partname == '/ppt/slides/slide2.xml'
+        assert new_slide_part.content_type == CT.PML_SLIDE
+        assert new_slide_part._element is not sld
+        assert new_slide_part._element.xml == sld.xml
+        assert slide is new_slide_part.slide
+
+    def it_can_remove_a_slide(self, request):
+        p14 = 'http://schemas.microsoft.com/office/powerpoint/2010/main'
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None, parse_xml(
+                '<p:presentation %s><p:sldIdLst>'
+                '<p:sldId id="256" r:id="rId2"/>'
+                '<p:sldId id="257" r:id="rId3"/>'
+                '<p:sldId id="258" r:id="rId4"/>'
+                '</p:sldIdLst><p:custShowLst><p:custShow name="C" id="0">'
+                '<p:sldLst><p:sld r:id="rId3"/><p:sld r:id="rId4"/>'
+                '</p:sldLst></p:custShow></p:custShowLst>'
+                '<p:extLst><p:ext uri="{sections}">'
+                '<p14:sectionLst xmlns:p14="%s"><p14:section name="A">'
+                '<p14:sldIdLst><p14:sldId id="256"/><p14:sldId id="257"/>'
+                '</p14:sldIdLst></p14:section></p14:sectionLst>'
+                '</p:ext></p:extLst></p:presentation>' %
+                (nsdecls('p', 'r'), p14)
+            ), None
+        )
+        slide_parts_ = [loose_mock(request) for _ in range(3)]
+        for idx, slide_part_ in enumerate(slide_parts_):
+            prs_part.rels.add_relationship(
+                RT.SLIDE, slide_part_, 'rId%d' % (idx + 2)
+            )
+        rename_slide_parts_ = method_mock(
+            request, PresentationPart, 'rename_slide_parts', autospec=True
+        )
+
+        prs_part.remove_slide(slide_parts_[1])
+
+        assert prs_part._element.xpath('//@id') == [
+            '256', '258', '0', '256'
+        ]
+        assert prs_part._element.xpath('//p:sld/@r:id') == ['rId4']
+        assert 'rId3' not in prs_part.related_parts
+        slide_parts_[0].drop_rels_to.assert_called_once_with(slide_parts_[1])
+        slide_parts_[2].drop_rels_to.assert_called_once_with(slide_parts_[1])
+        rename_slide_parts_.assert_called_once_with(prs_part, ['rId2', 'rId4'])
+
+    def but_it_raises_when_the_slide_is_not_present(self, request):
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None,
+            element('p:presentation/p:sldIdLst/p:sldId{r:id=rId1}'), None
+        )
+        prs_part.rels.add_relationship(RT.SLIDE, loose_mock(request), 'rId1')
+        with pytest.raises(ValueError):
+            prs_part.remove_slide(loose_mock(request))
+
     def it_finds_the_slide_id_of_a_slide_part(self, slide_id_fixture):
         prs_part, slide_part_, expected_value = slide_id_fixture
         _slide_id = prs_part.slide_id(slide_part_)
@@ -120,6 +225,59 @@ class DescribePresentationPart(object):
         with pytest.raises(ValueError):
             prs_part.slide_id(slide_part_)
 
+    def it_finds_the_index_of_a_slide_part(self, slide_id_fixture):
+        prs_part, slide_part_ = slide_id_fixture[:2]
+        assert prs_part.slide_index(slide_part_) == 1
+
+    def it_raises_on_slide_index_not_found(self, slide_id_raises_fixture):
+        prs_part, slide_part_ = slide_id_raises_fixture
+        with pytest.raises(ValueError):
+            prs_part.slide_index(slide_part_)
+
+    def it_keeps_its_slide_lookup_current(self, request):
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None, element(
+                'p:presentation/p:sldIdLst/(p:sldId{r:id=rId1,id=256},p:sldI'
+                'd{r:id=rId2,id=257})'
+            ), None
+        )
+        slide_parts_ = [loose_mock(request), loose_mock(request)]
+        for idx, slide_part_ in enumerate(slide_parts_):
+            prs_part.rels.add_relationship(
+                RT.SLIDE, slide_part_, 'rId%d' % (idx + 1)
+            )
+        sldIdLst = prs_part._element.sldIdLst
+        assert prs_part.slide_index(slide_parts_[1]) == 1
+
+        sldIdLst.insert(0, sldIdLst[1])
+        assert prs_part.slide_index(slide_parts_[1]) == 0
+        assert prs_part.slide_id(slide_parts_[0]) == 256
+
+        sldIdLst.add_sldId('rId1')
+        sldIdLst.remove(sldIdLst[1])
+        assert prs_part.slide_id(slide_parts_[0]) == 258
+        assert prs_part.get_slide(256) is None
+        assert prs_part.get_slide(258) is slide_parts_[0].slide
+
+        sldIdLst.remove(sldIdLst[0])
+        assert prs_part.slide_index(slide_parts_[0]) == 0
+
+    def it_does_not_rebuild_its_slide_lookup_on_a_hit(self, request):
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None, element(
+                'p:presentation/p:sldIdLst/p:sldId{r:id=rId1,id=256}'
+            ), None
+        )
+        slide_part_ = loose_mock(request)
+        prs_part.rels.add_relationship(RT.SLIDE, slide_part_, 'rId1')
+        assert prs_part.slide_index(slide_part_) == 0
+        _build_ = method_mock(request, _SlideLookup, '_build')
+
+        assert prs_part.slide_index(slide_part_) == 0
+        assert prs_part.slide_id(slide_part_) == 256
+
+        assert _build_.call_count == 0
+
     def it_finds_a_slide_by_slide_id(self, get_slide_fixture):
         prs_part, slide_id, expected_value = get_slide_fixture
         slide = prs_part.get_slide(slide_id)
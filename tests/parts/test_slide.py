@@ -16,6 +16,7 @@ from pptx.media import Video
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
+from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from pptx.oxml.theme import CT_OfficeStyleSheet
 from pptx.package import Package
@@ -31,11 +32,11 @@ from pptx.slide import (
     NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
 )
 
-from ..unitutil.cxml import element
+from ..unitutil.cxml import element, xml
 from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
-    call, class_mock, initializer_mock, instance_mock, method_mock,
-    property_mock
+    call, class_mock, initializer_mock, instance_mock, loose_mock,
+    method_mock, property_mock
 )
 
 
@@ -61,8 +62,106 @@ class DescribeBaseSlidePart(object):
         assert image_part is image_part_
         assert rId is rId_
 
+    def it_allocates_the_next_shape_id(self, next_id_fixture):
+        base_slide, expected_value = next_id_fixture
+        assert base_slide.next_shape_id() == expected_value
+
+    def it_allocates_a_block_of_shape_ids(self):
+        sld = element('p:sld/p:cSld/p:spTree/p:nvGrpSpPr/p:cNvPr{id=6}')
+        base_slide = BaseSlidePart(None, None, sld, None)
+        assert list(base_slide.next_shape_ids(3)) == [7, 8, 9]
+        assert list(base_slide.next_shape_ids(0)) == []
+        assert base_slide.next_shape_id() == 10
+
+    def it_allocates_shape_ids_without_rescanning(self):
+        sld = element('p:sld/p:cSld/p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}')
+        base_slide = BaseSlidePart(None, None, sld, None)
+        assert base_slide.next_shape_id() == 2
+        sld.spTree.nvGrpSpPr.cNvPr.id = 41
+        assert base_slide.next_shape_id() == 3
+        assert base_slide.next_shape_id() == 4
+
+    def it_allocates_the_next_shape_name(self, next_name_fixture):
+        base_slide, basename, numpart, expected_value = next_name_fixture
+        assert base_slide.next_shape_name(basename, numpart) == expected_value
+
+    def it_reserves_each_shape_name_it_allocates(self):
+        sld = element('p:sld/p:cSld/p:spTree/p:cNvPr{name=Title 2}')
+        base_slide = BaseSlidePart(None, None, sld, None)
+        assert base_slide.next_shape_name('Title', 1) == 'Title 1'
+        assert base_slide.next_shape_name('Title', 1) == 'Title 3'
+        assert base_slide.next_shape_name('Title', 2) == 'Title 4'
+        assert base_slide.next_shape_name('Title', 9) == 'Title 9'
+
+    def it_keeps_shape_names_up_to_date_incrementally(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:nvGrpSpPr/p:cNvPr{name=tree},p:sp/p:nvS'
+            'pPr/p:cNvPr{name=Title 2},p:sp/p:nvSpPr/p:cNvPr{name=Title 2})'
+        )
+        spTree = sld.spTree
+        base_slide = BaseSlidePart(None, None, sld, None)
+        assert base_slide.next_shape_name('Title', 2) == 'Title 3'
+
+        spTree.append(element('p:sp/p:nvSpPr/p:cNvPr{name=Title 7}'))
+        base_slide.register_shape_name('Title 7')
+        assert base_slide.next_shape_name('Title', 7) == 'Title 8'
+
+        base_slide.unregister_shape_name('Title 2')
+        assert base_slide.next_shape_name('Title', 2) == 'Title 4'
+        base_slide.unregister_shape_name('Title 2')
+        assert base_slide.next_shape_name('Title', 2) == 'Title 2'
+        base_slide.unregister_shape_name('Title 99')
+
+    def it_recalculates_group_extents_immediately_by_default(self, grpSp_):
+        base_slide = BaseSlidePart(None, None, None, None)
+        base_slide.recalculate_group_extents(grpSp_)
+        grpSp_.recalculate_extents.assert_called_once_with()
+
+    def it_can_defer_group_extents_recalculation(self, defer_fixture):
+        base_slide, outer, inner, recalculate_extents_ = defer_fixture
+
+        with base_slide.deferred_group_extents():
+            with base_slide.deferred_group_extents():
+                base_slide.recalculate_group_extents(inner)
+                base_slide.recalculate_group_extents(inner)
+            base_slide.recalculate_group_extents(outer)
+            assert recalculate_extents_.call_args_list == []
+
+        assert recalculate_extents_.call_args_list == [
+            call(inner, recursive=False), call(outer, recursive=False)
+        ]
+        base_slide.recalculate_group_extents(inner)
+        assert recalculate_extents_.call_args_list[-1] == call(inner)
+
+    def it_recalculates_deferred_group_extents_bottom_up(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/p:grpSp/(p:grpSpPr/a:xfrm,p:grpSp/(p:grpSp'
+            'Pr/a:xfrm,p:sp/p:spPr/a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4})))'
+        )
+        outer = sld.spTree.xpath('p:grpSp')[0]
+        inner = outer.xpath('p:grpSp')[0]
+        base_slide = BaseSlidePart(None, None, sld, None)
+
+        with base_slide.deferred_group_extents():
+            base_slide.recalculate_group_extents(inner)
+            assert (outer.x, outer.cx, inner.x, inner.cx) == (None,) * 4
+
+        assert (inner.x, inner.y, inner.cx, inner.cy) == (1, 2, 3, 4)
+        assert (outer.x, outer.y, outer.cx, outer.cy) == (1, 2, 3, 4)
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture
+    def defer_fixture(self, request):
+        sld = element('p:sld/p:cSld/p:spTree/p:grpSp/p:grpSp')
+        outer = sld.spTree.xpath('p:grpSp')[0]
+        inner = outer.xpath('p:grpSp')[0]
+        base_slide = BaseSlidePart(None, None, sld, None)
+        recalculate_extents_ = method_mock(
+            request, CT_GroupShape, 'recalculate_extents', autospec=True
+        )
+        return base_slide, outer, inner, recalculate_extents_
+
     @pytest.fixture
     def get_image_fixture(self, related_parts_prop_, image_part_, image_):
         slide = BaseSlidePart(None, None, None, None)
@@ -80,6 +179,40 @@ class DescribeBaseSlidePart(object):
         relate_to_.return_value = rId
         return slide, image_file, image_part_, rId
 
+    @pytest.fixture(params=[
+        ('p:spTree/p:nvSpPr',                                 1),
+        ('p:spTree/p:nvSpPr/p:cNvPr{id=0}',                   1),
+        ('p:spTree/p:nvSpPr/p:cNvPr{id=1}',                   2),
+        ('p:spTree/p:nvSpPr/p:cNvPr{id=2}',                   3),
+        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})',   4),
+        ('p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})', 3),
+        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})', 3),
+        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:'
+         'cNvPr{id=1},p:cNvPr{id=4})',                        5),
+    ])
+    def next_id_fixture(self, request):
+        spTree_cxml, expected_value = request.param
+        sld = element('p:sld/p:cSld/%s' % spTree_cxml)
+        base_slide = BaseSlidePart(None, None, sld, None)
+        return base_slide, expected_value
+
+    @pytest.fixture(params=[
+        ('p:spTree',                                  'Title', 1, 'Title 1'),
+        ('p:spTree/p:cNvPr{name=Title 1}',            'Title', 1, 'Title 2'),
+        ('p:spTree/p:cNvPr{name=Title 1}',            'Title', 2, 'Title 2'),
+        ('p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Title 2})',
+         'Title', 1, 'Title 3'),
+        ('p:spTree/p:cNvPr{name=Vertical Title 4}',   'Title', 4, 'Title 4'),
+        ('p:spTree/p:cNvPr{name=Vertical Title 4}',
+         'Vertical Title', 4, 'Vertical Title 5'),
+        ('p:spTree/p:grpSp/p:cNvPr{name=Title 3}',    'Title', 3, 'Title 4'),
+    ])
+    def next_name_fixture(self, request):
+        spTree_cxml, basename, numpart, expected_value = request.param
+        sld = element('p:sld/p:cSld/%s' % spTree_cxml)
+        base_slide = BaseSlidePart(None, None, sld, None)
+        return base_slide, basename, numpart, expected_value
+
     @pytest.fixture
     def name_fixture(self):
         sld_cxml, expected_value = 'p:sld/p:cSld{name=Foobar}', 'Foobar'
@@ -89,6 +222,10 @@ class DescribeBaseSlidePart(object):
 
     # fixture components ---------------------------------------------
 
+    @pytest.fixture
+    def grpSp_(self, request):
+        return instance_mock(request, CT_GroupShape)
+
     @pytest.fixture
     def image_(self, request):
         return instance_mock(request, Image)
@@ -269,6 +406,36 @@ class DescribeNotesMasterPart(object):
 
 class DescribeNotesSlidePart(object):
 
+    def it_can_clone_itself(self, request, package_):
+        package_.next_partname.return_value = PackURI(
+            '/ppt/notesSlides/notesSlide2.xml'
+        )
+        notes = element('p:notes/p:cSld')
+        notes_slide_part = NotesSlidePart(
+            PackURI('/ppt/notesSlides/notesSlide1.xml'), CT.PML_NOTES_SLIDE,
+            notes, package_
+        )
+        notes_master_part_, slide_part_, new_slide_part_ = (
+            loose_mock(request), loose_mock(request), loose_mock(request)
+        )
+        notes_slide_part.rels.add_relationship(
+            RT.NOTES_MASTER, notes_master_part_, 'rId1'
+        )
+        notes_slide_part.rels.add_relationship(RT.SLIDE, slide_part_, 'rId2')
+
+        clone = notes_slide_part.clone(new_slide_part_)
+
+        package_.next_partname.assert_called_once_with(
+            '/ppt/notesSlides/notesSlide%d.xml'
+        )
+        assert isinstance(clone, NotesSlidePart)
+        assert clone.partname == '/ppt/notesSlides/notesSlide2.xml'
+        assert clone._element is not notes
+        assert clone._element.xml == notes.xml
+        assert clone.related_parts == {
+            'rId1': notes_master_part_, 'rId2': new_slide_part_
+        }
+
     def it_can_create_a_notes_slide_part(self, new_fixture):
         package_, slide_part_, notes_master_part_ = new_fixture[:3]
         notes_slide_, notes_master_, notes_slide_part_ = new_fixture[3:]
@@ -427,6 +594,50 @@ class DescribeNotesSlidePart(object):
 
 class DescribeSlidePart(object):
 
+    def it_can_drop_its_relationships_to_a_part(self, request):
+        slide_part = SlidePart(
+            PackURI('/ppt/slides/slide1.xml'), CT.PML_SLIDE, element(
+                'p:sld/p:cSld/p:spTree/p:sp/(p:nvSpPr/p:cNvPr/a:hlinkClick{r:'
+                'id=rId2},p:txBody/a:p/a:r/a:rPr/a:hlinkClick{r:id=rId3})'
+            ), None
+        )
+        target_part_, other_part_ = loose_mock(request), loose_mock(request)
+        slide_part.rels.add_relationship(RT.SLIDE_LAYOUT, other_part_, 'rId1')
+        slide_part.rels.add_relationship(RT.SLIDE, target_part_, 'rId2')
+        slide_part.rels.add_relationship(RT.SLIDE, other_part_, 'rId3')
+
+        slide_part.drop_rels_to(target_part_)
+
+        assert slide_part.related_parts == {
+            'rId1': other_part_, 'rId3': other_part_
+        }
+        assert slide_part._element.xml == xml(
+            'p:sld/p:cSld/p:spTree/p:sp/(p:nvSpPr/p:cNvPr,p:txBody/a:p/a:r/a:'
+            'rPr/a:hlinkClick{r:id=rId3})'
+        )
+
+    def it_drops_the_relationships_of_its_notes_slide_too(self, request):
+        slide_part = SlidePart(
+            PackURI('/ppt/slides/slide1.xml'), CT.PML_SLIDE, element('p:sld'),
+            None
+        )
+        notes_slide_part_, part_ = loose_mock(request), loose_mock(request)
+        slide_part.rels.add_relationship(
+            RT.NOTES_SLIDE, notes_slide_part_, 'rId1'
+        )
+
+        slide_part.drop_rels_to(part_)
+
+        notes_slide_part_.drop_rels_to.assert_called_once_with(part_)
+
+    def it_can_copy_the_relationships_of_another_slide(self, copy_fixture):
+        slide_part, source_part, copy_notes, expected_parts = copy_fixture
+
+        slide_part.copy_relationships(source_part, copy_notes)
+
+        assert slide_part.related_parts == expected_parts
+        assert slide_part.target_ref('rId5') == 'http://foo'
+
     def it_knows_its_slide_id(self, slide_id_fixture):
         slide_part, presentation_part_, slide_id = slide_id_fixture
         _slide_id = slide_part.slide_id
@@ -542,6 +753,37 @@ class DescribeSlidePart(object):
         NotesSlidePart_.new.return_value = notes_slide_part_
         return slide_part, NotesSlidePart_, package_, notes_slide_part_
 
+    @pytest.fixture(params=[True, False])
+    def copy_fixture(self, request):
+        copy_notes = request.param
+        layout_part_, image_part_, chart_part_, notes_slide_part_ = (
+            loose_mock(request), loose_mock(request), loose_mock(request),
+            loose_mock(request)
+        )
+        source_part = SlidePart(
+            PackURI('/ppt/slides/slide1.xml'), CT.PML_SLIDE, None, None
+        )
+        for reltype, target, rId in (
+                (RT.SLIDE_LAYOUT, layout_part_,      'rId1'),
+                (RT.IMAGE,        image_part_,       'rId2'),
+                (RT.CHART,        chart_part_,       'rId3'),
+                (RT.NOTES_SLIDE,  notes_slide_part_, 'rId4')):
+            source_part.rels.add_relationship(reltype, target, rId)
+        source_part.rels.add_relationship(
+            RT.HYPERLINK, 'http://foo', 'rId5', True
+        )
+        slide_part = SlidePart(
+            PackURI('/ppt/slides/slide2.xml'), CT.PML_SLIDE, None, None
+        )
+        expected_parts = {
+            'rId1': layout_part_,
+            'rId2': image_part_,
+            'rId3': chart_part_.clone.return_value,
+        }
+        if copy_notes:
+            expected_parts['rId4'] = notes_slide_part_.clone.return_value
+        return slide_part, source_part, copy_notes, expected_parts
+
     @pytest.fixture
     def goa_video_fixture(self, package_, video_, relate_to_, media_part_):
         slide_part = SlidePart(None, None, None, package_)
@@ -48,8 +48,25 @@ class DescribeBaseShape(object):
 
     def it_can_change_its_name(self, name_set_fixture):
         shape, new_value, expected_xml = name_set_fixture
+        old_value = shape.name
         shape.name = new_value
         assert shape._element.xml == expected_xml
+        shape.part.unregister_shape_name.assert_called_once_with(old_value)
+        shape.part.register_shape_name.assert_called_once_with(new_value)
+
+    def it_can_change_its_name_when_not_in_a_part(self, shapes_):
+        shapes_.part = None
+        for parent in (None, shapes_):
+            sp = element('p:sp/p:nvSpPr/p:cNvPr{name=foo}')
+            shape = BaseShape(sp, parent)
+            shape.name = 'bar'
+            assert shape.name == 'bar'
+
+    def it_notes_a_change_of_name_on_its_shape_tree(self, shapes_):
+        spTree = element('p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=foo}')
+        shape = BaseShape(spTree[0], shapes_)
+        shape.name = 'bar'
+        assert spTree.version == 1
 
     def it_has_a_position(self, position_get_fixture):
         shape, expected_left, expected_top = position_get_fixture
@@ -209,9 +226,9 @@ class DescribeBaseShape(object):
         ('p:pic/p:nvPicPr/p:cNvPr{id=5,name=far}',     Picture,   'Shape5',
          'p:pic/p:nvPicPr/p:cNvPr{id=5,name=Shape5}'),
     ])
-    def name_set_fixture(self, request):
+    def name_set_fixture(self, request, shapes_):
         xSp_cxml, ShapeCls, new_value, expected_xSp_cxml = request.param
-        shape = ShapeCls(element(xSp_cxml), None)
+        shape = ShapeCls(element(xSp_cxml), shapes_)
         expected_xml = xml(expected_xSp_cxml)
         return shape, new_value, expected_xml
 
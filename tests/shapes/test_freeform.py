@@ -10,14 +10,15 @@ import pytest
 
 from pptx.shapes.autoshape import Shape
 from pptx.shapes.freeform import (
-    _BaseDrawingOperation, _Close, FreeformBuilder, _LineSegment, _MoveTo
+    _BaseDrawingOperation, _Close, FreeformBuilder, _LINE_TO, _LineSegment,
+    _MoveTo, _simplify
 )
 from pptx.shapes.shapetree import SlideShapes
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
 from ..unitutil.mock import (
-    call, initializer_mock, instance_mock, method_mock, property_mock
+    initializer_mock, instance_mock, loose_mock, method_mock, property_mock
 )
 
 
@@ -37,26 +38,44 @@ class DescribeFreeformBuilder(object):
         assert isinstance(builder, FreeformBuilder)
 
     def it_can_add_straight_line_segments(self, add_segs_fixture):
-        builder, vertices, close, add_calls, close_calls = add_segs_fixture
+        builder, vertices, close, tolerance, expected_ops = add_segs_fixture
 
-        return_value = builder.add_line_segments(vertices, close)
+        return_value = builder.add_line_segments(vertices, close, tolerance)
 
-        assert builder._add_line_segment.call_args_list == add_calls
-        assert builder._add_close.call_args_list == close_calls
+        assert _ops(builder) == expected_ops
         assert return_value is builder
 
-    def it_can_move_the_pen_location(self, move_to_fixture):
-        builder, x, y, _MoveTo_new_, move_to_ = move_to_fixture
+    def it_accepts_a_numpy_array_of_vertices(self, request):
+        vertices_ = loose_mock(request, ndim=2)
+        vertices_.tolist.return_value = [[1.4, 2.6], [3, 4]]
+        builder = FreeformBuilder(None, 0, 0, None, None)
 
-        return_value = builder.move_to(x, y)
+        builder.add_line_segments(vertices_, close=False)
 
-        _MoveTo_new_.assert_called_once_with(builder, x, y)
-        assert builder._drawing_operations[-1] is move_to_
+        assert _ops(builder) == [('lnTo', 1, 3), ('lnTo', 3, 4)]
+
+    def it_can_move_the_pen_location(self):
+        builder = FreeformBuilder(None, 0, 0, None, None)
+
+        return_value = builder.move_to(41.6, -24.2)
+
+        assert _ops(builder) == [('moveTo', 42, -24)]
         assert return_value is builder
 
+    def it_provides_access_to_its_drawing_operations(self):
+        builder = FreeformBuilder(None, 0, 0, None, None)
+        builder.move_to(1, 2).add_line_segments(((3, 4),))
+
+        assert len(builder) == 3
+        assert isinstance(builder[0], _MoveTo)
+        assert (builder[1].x, builder[1].y) == (3, 4)
+        assert isinstance(builder[-1], _Close)
+        assert [type(op) for op in builder[1:]] == [_LineSegment, _Close]
+        with pytest.raises(IndexError):
+            builder[3]
+
     def it_can_build_the_specified_freeform_shape(self, convert_fixture):
-        builder, origin_x, origin_y, sp = convert_fixture[:4]
-        apply_operation_to_, calls, shape_ = convert_fixture[4:]
+        builder, origin_x, origin_y, sp, shape_, expected_xml = convert_fixture
 
         shape = builder.convert_to_shape(origin_x, origin_y)
 
@@ -64,7 +83,7 @@ class DescribeFreeformBuilder(object):
             builder, origin_x, origin_y
         )
         builder._start_path.assert_called_once_with(builder, sp)
-        assert apply_operation_to_.call_args_list == calls
+        assert sp.xml == expected_xml
         builder._shapes._shape_factory.assert_called_once_with(sp)
         assert shape is shape_
 
@@ -73,6 +92,13 @@ class DescribeFreeformBuilder(object):
         x_offset = builder.shape_offset_x
         assert x_offset == expected_value
 
+    def it_includes_the_pen_start_position_as_set_when_read(self):
+        builder = FreeformBuilder(None, 0, 0, None, None)
+        builder.add_line_segments(((10, 20), (30, 40)))
+        builder._start_x, builder._start_y = 50, 5
+        assert (builder._min_x, builder._min_y) == (10, 5)
+        assert (builder._max_x, builder._max_y) == (50, 40)
+
     def it_knows_the_shape_y_offset(self, shape_offset_y_fixture):
         builder, expected_value = shape_offset_y_fixture
         y_offset = builder.shape_offset_y
@@ -86,21 +112,22 @@ class DescribeFreeformBuilder(object):
         assert spTree.xml == expected_xml
         assert sp is spTree.xpath('p:sp')[0]
 
-    def it_adds_a_line_segment_to_help(self, add_seg_fixture):
-        builder, x, y, _LineSegment_new_, line_segment_ = add_seg_fixture
+    def it_adds_drawing_operations_to_help(self):
+        builder = FreeformBuilder(None, 10, 20, None, None)
 
-        builder._add_line_segment(x, y)
+        builder._add_operations(_LINE_TO, [5, 30], [25, -5])
 
-        _LineSegment_new_.assert_called_once_with(builder, x, y)
-        assert builder._drawing_operations == [line_segment_]
+        assert _ops(builder) == [('lnTo', 5, 25), ('lnTo', 30, -5)]
+        assert (builder.shape_offset_x, builder.shape_offset_y) == (5, -5)
+        assert (builder._dx, builder._dy) == (25, 30)
 
-    def it_closes_a_contour_to_help(self, add_close_fixture):
-        builder, _Close_new_, close_ = add_close_fixture
+    def it_closes_a_contour_to_help(self):
+        builder = FreeformBuilder(None, 0, 0, None, None)
 
         builder._add_close()
 
-        _Close_new_.assert_called_once_with()
-        assert builder._drawing_operations == [close_]
+        assert _ops(builder) == [('close', 0, 0)]
+        assert (builder._dx, builder._dy) == (0, 0)
 
     def it_knows_the_freeform_left_extent_to_help(self, left_fixture):
         builder, expected_value = left_fixture
@@ -149,51 +176,35 @@ class DescribeFreeformBuilder(object):
 
     # fixtures -------------------------------------------------------
 
-    @pytest.fixture
-    def add_close_fixture(self, _Close_new_, close_):
-        _Close_new_.return_value = close_
-        builder = FreeformBuilder(None, None, None, None, None)
-        return builder, _Close_new_, close_
-
-    @pytest.fixture
-    def add_seg_fixture(self, _LineSegment_new_, line_segment_):
-        x, y = 4, 2
-        _LineSegment_new_.return_value = line_segment_
-
-        builder = FreeformBuilder(None, None, None, None, None)
-        return builder, x, y, _LineSegment_new_, line_segment_
-
     @pytest.fixture(params=[
-        (True,  [call()]),
-        (False, []),
+        (True,  None, [('lnTo', 1, 2), ('lnTo', 3, 4), ('lnTo', 5, 6),
+                       ('close', 0, 0)]),
+        (False, None, [('lnTo', 1, 2), ('lnTo', 3, 4), ('lnTo', 5, 6)]),
+        (False, 0.5,  [('lnTo', 1, 2), ('lnTo', 5, 6)]),
+        (False, 0.0,  [('lnTo', 1, 2), ('lnTo', 3, 4), ('lnTo', 5, 6)]),
     ])
-    def add_segs_fixture(self, request, _add_line_segment_, _add_close_):
-        close, close_calls = request.param
-        vertices = ((1, 2), (3, 4), (5, 6))
-        builder = FreeformBuilder(None, None, None, None, None)
-        add_calls = [call(1, 2), call(3, 4), call(5, 6)]
-        return builder, vertices, close, add_calls, close_calls
+    def add_segs_fixture(self, request):
+        close, tolerance, expected_ops = request.param
+        vertices = ((1.2, 2), (3, 3.7), (5, 6))
+        builder = FreeformBuilder(None, 0, 0, None, None)
+        return builder, vertices, close, tolerance, expected_ops
 
     @pytest.fixture
-    def convert_fixture(self, shapes_, apply_operation_to_,
-                        _add_freeform_sp_, _start_path_, shape_):
+    def convert_fixture(self, shapes_, _add_freeform_sp_, _start_path_,
+                        shape_):
         origin_x, origin_y = 42, 24
-        sp, path = element('p:sp'), element('a:path')
-        drawing_ops = (
-            _BaseDrawingOperation(None, None, None),
-            _BaseDrawingOperation(None, None, None),
-        )
+        sp = element('p:sp/p:spPr/a:custGeom/a:pathLst/a:path')
         shapes_._shape_factory.return_value = shape_
         _add_freeform_sp_.return_value = sp
-        _start_path_.return_value = path
+        _start_path_.return_value = sp.xpath('.//a:path')[0]
 
-        builder = FreeformBuilder(shapes_, None, None, None, None)
-        builder._drawing_operations.extend(drawing_ops)
-        calls = [call(drawing_ops[0], path), call(drawing_ops[1], path)]
-        return (
-            builder, origin_x, origin_y, sp, apply_operation_to_, calls,
-            shape_
+        builder = FreeformBuilder(shapes_, 10, 20, None, None)
+        builder.add_line_segments(((30, 20), (30, 40))).move_to(5, 20)
+        expected_xml = xml(
+            'p:sp/p:spPr/a:custGeom/a:pathLst/a:path/(a:lnTo/a:pt{x=25,y=0},'
+            'a:lnTo/a:pt{x=25,y=20},a:close,a:moveTo/a:pt{x=0,y=0})'
         )
+        return builder, origin_x, origin_y, sp, shape_, expected_xml
 
     @pytest.fixture(params=[
         (0,  (1, None, 2, 3),      3),
@@ -202,15 +213,8 @@ class DescribeFreeformBuilder(object):
     ])
     def dx_fixture(self, request):
         start_x, xs, expected_value = request.param
-        drawing_ops = []
-        for x in xs:
-            if x is None:
-                drawing_ops.append(_Close())
-            else:
-                drawing_ops.append(_BaseDrawingOperation(None, x, None))
-
-        builder = FreeformBuilder(None, start_x, None, None, None)
-        builder._drawing_operations.extend(drawing_ops)
+        builder = FreeformBuilder(None, start_x, 0, None, None)
+        _add_ops(builder, xs, [0] * len(xs))
         return builder, expected_value
 
     @pytest.fixture(params=[
@@ -220,15 +224,8 @@ class DescribeFreeformBuilder(object):
     ])
     def dy_fixture(self, request):
         start_y, ys, expected_value = request.param
-        drawing_ops = []
-        for y in ys:
-            if y is None:
-                drawing_ops.append(_Close())
-            else:
-                drawing_ops.append(_BaseDrawingOperation(None, None, y))
-
-        builder = FreeformBuilder(None, None, start_y, None, None)
-        builder._drawing_operations.extend(drawing_ops)
+        builder = FreeformBuilder(None, 0, start_y, None, None)
+        _add_ops(builder, [0] * len(ys), ys)
         return builder, expected_value
 
     @pytest.fixture(params=[
@@ -265,14 +262,6 @@ class DescribeFreeformBuilder(object):
         expected_value = (100, 300)
         return builder, local_x, local_y, expected_value
 
-    @pytest.fixture
-    def move_to_fixture(self, _MoveTo_new_, move_to_):
-        x, y = 42, 24
-        _MoveTo_new_.return_value = move_to_
-
-        builder = FreeformBuilder(None, None, None, None, None)
-        return builder, x, y, _MoveTo_new_, move_to_
-
     @pytest.fixture
     def new_fixture(self, shapes_, _init_):
         start_x, start_y, x_scale, y_scale = 99.56, 200.49, 4.2, 2.4
@@ -289,15 +278,8 @@ class DescribeFreeformBuilder(object):
     ])
     def shape_offset_x_fixture(self, request):
         start_x, xs, expected_value = request.param
-        drawing_ops = []
-        for x in xs:
-            if x is None:
-                drawing_ops.append(_Close())
-            else:
-                drawing_ops.append(_BaseDrawingOperation(None, x, None))
-
-        builder = FreeformBuilder(None, start_x, None, None, None)
-        builder._drawing_operations.extend(drawing_ops)
+        builder = FreeformBuilder(None, start_x, 0, None, None)
+        _add_ops(builder, xs, [0] * len(xs))
         return builder, expected_value
 
     @pytest.fixture(params=[
@@ -307,23 +289,17 @@ class DescribeFreeformBuilder(object):
     ])
     def shape_offset_y_fixture(self, request):
         start_y, ys, expected_value = request.param
-        drawing_ops = []
-        for y in ys:
-            if y is None:
-                drawing_ops.append(_Close())
-            else:
-                drawing_ops.append(_BaseDrawingOperation(None, None, y))
-
-        builder = FreeformBuilder(None, None, start_y, None, None)
-        builder._drawing_operations.extend(drawing_ops)
+        builder = FreeformBuilder(None, 0, start_y, None, None)
+        _add_ops(builder, [0] * len(ys), ys)
         return builder, expected_value
 
     @pytest.fixture
-    def sp_fixture(self, _left_prop_, _top_prop_, _width_prop_,
+    def sp_fixture(self, request, _left_prop_, _top_prop_, _width_prop_,
                    _height_prop_):
         origin_x, origin_y = 42, 24
         spTree = element('p:spTree')
         shapes = SlideShapes(spTree, None)
+        property_mock(request, SlideShapes, '_next_shape_id', return_value=1)
         _left_prop_.return_value, _top_prop_.return_value = 12, 34
         _width_prop_.return_value, _height_prop_.return_value = 56, 78
 
@@ -371,35 +347,12 @@ class DescribeFreeformBuilder(object):
 
     # fixture components -----------------------------------
 
-    @pytest.fixture
-    def _add_close_(self, request):
-        return method_mock(request, FreeformBuilder, '_add_close')
-
     @pytest.fixture
     def _add_freeform_sp_(self, request):
         return method_mock(
             request, FreeformBuilder, '_add_freeform_sp', autospec=True
         )
 
-    @pytest.fixture
-    def _add_line_segment_(self, request):
-        return method_mock(request, FreeformBuilder, '_add_line_segment')
-
-    @pytest.fixture
-    def apply_operation_to_(self, request):
-        return method_mock(
-            request, _BaseDrawingOperation, 'apply_operation_to',
-            autospec=True
-        )
-
-    @pytest.fixture
-    def close_(self, request):
-        return instance_mock(request, _Close)
-
-    @pytest.fixture
-    def _Close_new_(self, request):
-        return method_mock(request, _Close, 'new')
-
     @pytest.fixture
     def _dx_prop_(self, request):
         return property_mock(request, FreeformBuilder, '_dx')
@@ -420,26 +373,10 @@ class DescribeFreeformBuilder(object):
     def _left_prop_(self, request):
         return property_mock(request, FreeformBuilder, '_left')
 
-    @pytest.fixture
-    def line_segment_(self, request):
-        return instance_mock(request, _LineSegment)
-
-    @pytest.fixture
-    def _LineSegment_new_(self, request):
-        return method_mock(request, _LineSegment, 'new')
-
     @pytest.fixture
     def _local_to_shape_(self, request):
         return method_mock(request, FreeformBuilder, '_local_to_shape')
 
-    @pytest.fixture
-    def move_to_(self, request):
-        return instance_mock(request, _MoveTo)
-
-    @pytest.fixture
-    def _MoveTo_new_(self, request):
-        return method_mock(request, _MoveTo, 'new')
-
     @pytest.fixture
     def shape_(self, request):
         return instance_mock(request, Shape)
@@ -471,6 +408,28 @@ class DescribeFreeformBuilder(object):
         return property_mock(request, FreeformBuilder, '_width')
 
 
+class Describe_simplify(object):
+
+    def it_drops_points_within_tolerance_of_the_line(self, simplify_fixture):
+        points, tolerance, expected_value = simplify_fixture
+        assert _simplify(points, tolerance) == expected_value
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ([(0, 0), (5, 0)],                 1, [(0, 0), (5, 0)]),
+        ([(0, 0), (5, 1), (10, 0)],        1, [(0, 0), (10, 0)]),
+        ([(0, 0), (5, 2), (10, 0)],        1, [(0, 0), (5, 2), (10, 0)]),
+        ([(0, 0), (2, 1), (5, 9), (8, 1), (10, 0)], 2,
+         [(0, 0), (5, 9), (10, 0)]),
+        ([(0, 0), (3, 4), (0, 0)],         4, [(0, 0), (3, 4), (0, 0)]),
+        ([(0, 0), (3, 4), (0, 0)],         5, [(0, 0), (0, 0)]),
+    ])
+    def simplify_fixture(self, request):
+        points, tolerance, expected_value = request.param
+        return points, tolerance, expected_value
+
+
 class Describe_BaseDrawingOperation(object):
 
     def it_knows_its_x_coordinate(self, x_fixture):
@@ -500,131 +459,21 @@ class Describe_BaseDrawingOperation(object):
         return drawing_operation, expected_value
 
 
-class Describe_Close(object):
-
-    def it_provides_a_constructor(self, new_fixture):
-        _init_ = new_fixture
-
-        close = _Close.new()
+# helpers ------------------------------------------------------------
 
-        _init_.assert_called_once_with()
-        assert isinstance(close, _Close)
+def _add_ops(builder, xs, ys):
+    """Add a line segment to *builder* for each point, a close for None."""
+    for x, y in zip(xs, ys):
+        if x is None or y is None:
+            builder._add_close()
+        else:
+            builder._add_operations(_LINE_TO, [x], [y])
 
-    def it_can_add_close_a_contour(self, apply_fixture):
-        close, path, expected_xml = apply_fixture
 
-        close_elm = close.apply_operation_to(path)
-
-        assert path.xml == expected_xml
-        assert close_elm is path.xpath('a:close')[-1]
-
-    # fixtures -------------------------------------------------------
-
-    @pytest.fixture
-    def new_fixture(self, _init_):
-        return _init_
-
-    # fixture components -----------------------------------
-
-    @pytest.fixture
-    def apply_fixture(self):
-        path = element('a:path')
-        close = _Close()
-        expected_xml = xml('a:path/a:close')
-        return close, path, expected_xml
-
-    @pytest.fixture
-    def _init_(self, request):
-        return initializer_mock(request, _Close, autospec=True)
-
-
-class Describe_LineSegment(object):
-
-    def it_provides_a_constructor(self, new_fixture):
-        builder_, x, y, _init_, x_int, y_int = new_fixture
-
-        line_segment = _LineSegment.new(builder_, x, y)
-
-        _init_.assert_called_once_with(line_segment, builder_, x_int, y_int)
-        assert isinstance(line_segment, _LineSegment)
-
-    def it_can_add_its_line_segment_to_a_path(self, apply_fixture):
-        line_segment, path, expected_xml = apply_fixture
-
-        lnTo = line_segment.apply_operation_to(path)
-
-        assert path.xml == expected_xml
-        assert lnTo is path.xpath('a:lnTo')[-1]
-
-    # fixtures -------------------------------------------------------
-
-    @pytest.fixture
-    def apply_fixture(self, builder_):
-        x, y = 420, 240
-        path = element('a:path')
-        builder_.shape_offset_x, builder_.shape_offset_y = 100, 200
-
-        line_segment = _LineSegment(builder_, x, y)
-        expected_xml = xml('a:path/a:lnTo/a:pt{x=320,y=40}')
-        return line_segment, path, expected_xml
-
-    @pytest.fixture
-    def new_fixture(self, builder_, _init_):
-        x, y, x_int, y_int = 99.51, 200.49, 100, 200
-        return builder_, x, y, _init_, x_int, y_int
-
-    # fixture components -----------------------------------
-
-    @pytest.fixture
-    def builder_(self, request):
-        return instance_mock(request, FreeformBuilder)
-
-    @pytest.fixture
-    def _init_(self, request):
-        return initializer_mock(request, _LineSegment, autospec=True)
-
-
-class Describe_MoveTo(object):
-
-    def it_provides_a_constructor(self, new_fixture):
-        builder_, x, y, _init_, x_int, y_int = new_fixture
-
-        move_to = _MoveTo.new(builder_, x, y)
-
-        _init_.assert_called_once_with(move_to, builder_, x_int, y_int)
-        assert isinstance(move_to, _MoveTo)
-
-    def it_can_add_its_move_to_a_path(self, apply_fixture):
-        move_to, path, expected_xml = apply_fixture
-
-        moveTo = move_to.apply_operation_to(path)
-
-        assert path.xml == expected_xml
-        assert moveTo is path.xpath('a:moveTo')[-1]
-
-    # fixtures -------------------------------------------------------
-
-    @pytest.fixture
-    def apply_fixture(self, builder_):
-        x, y = 120, 340
-        path = element('a:path')
-        builder_.shape_offset_x, builder_.shape_offset_y = 100, 200
-
-        move_to = _MoveTo(builder_, x, y)
-        expected_xml = xml('a:path/a:moveTo/a:pt{x=20,y=140}')
-        return move_to, path, expected_xml
-
-    @pytest.fixture
-    def new_fixture(self, builder_, _init_):
-        x, y, x_int, y_int = 99.51, 200.49, 100, 200
-        return builder_, x, y, _init_, x_int, y_int
-
-    # fixture components -----------------------------------
-
-    @pytest.fixture
-    def builder_(self, request):
-        return instance_mock(request, FreeformBuilder)
-
-    @pytest.fixture
-    def _init_(self, request):
-        return initializer_mock(request, _MoveTo, autospec=True)
+def _ops(builder):
+    """Return list of `(kind, x, y)` for each operation in *builder*."""
+    kinds = {_Close: 'close', _LineSegment: 'lnTo', _MoveTo: 'moveTo'}
+    return [
+        (kinds[type(op)], getattr(op, 'x', 0), getattr(op, 'y', 0))
+        for op in builder
+    ]
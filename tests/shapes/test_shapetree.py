@@ -6,12 +6,14 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import weakref
+
 import pytest
 
 from pptx.compat import BytesIO
 from pptx.chart.data import ChartData
 from pptx.enum.shapes import (
-    MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, PP_PLACEHOLDER
+    MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, MSO_SHAPE_TYPE, PP_PLACEHOLDER
 )
 from pptx.oxml import parse_xml
 from pptx.oxml.shapes.autoshape import CT_Shape
@@ -29,16 +31,18 @@ from pptx.shapes.graphfrm import GraphicFrame
 from pptx.shapes.group import GroupShape
 from pptx.shapes.picture import Movie, Picture
 from pptx.shapes.placeholder import (
-    _BaseSlidePlaceholder, LayoutPlaceholder, MasterPlaceholder,
-    NotesSlidePlaceholder
+    _BaseSlidePlaceholder, ChartPlaceholder, LayoutPlaceholder,
+    MasterPlaceholder, NotesSlidePlaceholder, PicturePlaceholder,
+    PlaceholderGraphicFrame, PlaceholderPicture, SlidePlaceholder,
+    TablePlaceholder
 )
 from pptx.shapes.shapetree import (
     _BaseGroupShapes, BasePlaceholders, BaseShapeFactory, _BaseShapes,
     GroupShapes, LayoutPlaceholders, _LayoutShapeFactory, LayoutShapes,
     MasterPlaceholders, _MasterShapeFactory, MasterShapes,
     _MoviePicElementCreator, NotesSlidePlaceholders, _NotesSlideShapeFactory,
-    NotesSlideShapes, _SlidePlaceholderFactory, SlidePlaceholders,
-    SlideShapeFactory, SlideShapes
+    NotesSlideShapes, _ShapeIndex, _SlidePlaceholderFactory,
+    SlidePlaceholders, SlideShapeFactory, SlideShapes
 )
 from pptx.shapes.table import Table
 from pptx.slide import SlideLayout, SlideMaster
@@ -48,17 +52,18 @@ from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
 from ..unitutil.mock import (
     ANY, call, class_mock, function_mock, initializer_mock, instance_mock,
-    method_mock, property_mock
+    loose_mock, method_mock, property_mock
 )
 
 
 class DescribeBaseShapeFactory(object):
 
     def it_constructs_the_right_shape_for_an_element(self, factory_fixture):
-        shape_elm, parent_, ShapeClass_, shape_ = factory_fixture
+        shape_elm, parent_, ShapeCls = factory_fixture
         shape = BaseShapeFactory(shape_elm, parent_)
-        ShapeClass_.assert_called_once_with(shape_elm, parent_)
-        assert shape is shape_
+        assert type(shape) is ShapeCls
+        assert shape._element is shape_elm
+        assert shape._parent is parent_
 
     # fixtures -------------------------------------------------------
 
@@ -66,19 +71,16 @@ class DescribeBaseShapeFactory(object):
         ('p:sp', Shape),
         ('p:pic', Picture),
         ('p:pic/p:nvPicPr/p:nvPr/a:videoFile', Movie),
+        ('p:pic/p:nvPicPr/p:nvPr/a:audioFile', Picture),
         ('p:graphicFrame', GraphicFrame),
         ('p:grpSp', GroupShape),
         ('p:cxnSp', Connector),
+        ('p:contentPart', BaseShape),
     ])
     def factory_fixture(self, request, parent_):
         shape_cxml, ShapeCls = request.param
         shape_elm = element(shape_cxml)
-        shape_mock = instance_mock(request, ShapeCls)
-        ShapeClass_ = class_mock(
-            request, 'pptx.shapes.shapetree.%s' % ShapeCls.__name__,
-            return_value=shape_mock
-        )
-        return shape_elm, parent_, ShapeClass_, shape_mock
+        return shape_elm, parent_, ShapeCls
 
     # fixture components -----------------------------------
 
@@ -98,6 +100,21 @@ class Describe_BaseShapes(object):
         assert [s for s in shapes] == expected_shapes
         assert BaseShapeFactory_.call_args_list == calls
 
+    def it_reuses_the_shape_objects_it_provides(self):
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo},p:pic/p:nvPicPr/'
+            'p:cNvPr{id=3,name=Bar})'
+        )
+        shapes = _BaseShapes(spTree, None)
+
+        first_shapes = list(shapes)
+
+        assert list(shapes) == first_shapes
+        assert all(a is b for a, b in zip(shapes, first_shapes))
+        assert shapes[1] is first_shapes[1]
+        assert shapes.get_by_id(2) is first_shapes[0]
+        assert shapes.get_by_name('Bar') is first_shapes[1]
+
     def it_iterates_shape_elements_to_help__iter__(self, iter_elms_fixture):
         shapes, expected_elms = iter_elms_fixture
         assert [e for e in shapes._iter_member_elms()] == expected_elms
@@ -113,24 +130,33 @@ class Describe_BaseShapes(object):
         with pytest.raises(IndexError):
             shapes[2]
 
+    def it_can_get_a_shape_by_id(self, get_by_fixture):
+        shapes, sps, BaseShapeFactory_, shape_ = get_by_fixture
+        assert shapes.get_by_id(3) is shape_
+        BaseShapeFactory_.assert_called_once_with(sps[1], shapes)
+        assert shapes.get_by_id(9, 'foo') == 'foo'
+
+    def it_can_get_a_shape_by_name(self, get_by_fixture):
+        shapes, sps, BaseShapeFactory_, shape_ = get_by_fixture
+        assert shapes.get_by_name('Bar') is shape_
+        BaseShapeFactory_.assert_called_once_with(sps[1], shapes)
+        assert shapes.get_by_name('Baz') is None
+
     def it_can_clone_a_placeholder(self, clone_ph_fixture):
         shapes, placeholder_, expected_xml = clone_ph_fixture
         shapes.clone_placeholder(placeholder_)
         assert shapes._element.xml == expected_xml
 
-    def it_knows_if_turbo_add_is_enabled(self, turbo_fixture):
-        shapes, expected_value = turbo_fixture
-        turbo_add_enabled = shapes.turbo_add_enabled
-        assert turbo_add_enabled == expected_value
-
-    def it_can_change_turbo_add_enabled(self, turbo_set_fixture):
-        shapes, value, expected_value = turbo_set_fixture
-        shapes.turbo_add_enabled = value
-        assert shapes.turbo_add_enabled == expected_value
+    def it_always_has_turbo_add_enabled(self):
+        shapes = _BaseShapes(None, None)
+        shapes.turbo_add_enabled = False
+        assert shapes.turbo_add_enabled is True
 
-    def it_finds_the_next_shape_id_to_help(self, next_id_fixture):
-        shapes, expected_value = next_id_fixture
-        assert shapes._next_shape_id == expected_value
+    def it_gets_the_next_shape_id_from_its_part_to_help(self, next_id_fixture):
+        shapes, part_ = next_id_fixture
+        shape_id = shapes._next_shape_id
+        part_.next_shape_id.assert_called_once_with()
+        assert shape_id is part_.next_shape_id.return_value
 
     def it_finds_the_next_placeholder_name_to_help(self, ph_name_fixture):
         shapes, ph_type, sp_id, orient, expected_value = ph_name_fixture
@@ -139,8 +165,14 @@ class Describe_BaseShapes(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def clone_ph_fixture(self, placeholder_):
-        shapes = SlideShapes(element('p:spTree{a:b=c}'), None)
+    def clone_ph_fixture(self, request, placeholder_, _next_shape_id_prop_):
+        sld = element('p:sld/p:cSld/p:spTree{a:b=c}')
+        shapes = SlideShapes(sld.spTree, None)
+        property_mock(
+            request, _BaseShapes, 'part',
+            return_value=SlidePart(None, None, sld, None)
+        )
+        _next_shape_id_prop_.return_value = 1
         expected_xml = xml(
             'p:spTree{a:b=c}/p:sp/(p:nvSpPr/(p:cNvPr{id=1,name=Vertical Char'
             't Placeholder 0},p:cNvSpPr/a:spLocks{noGrp=1},p:nvPr/p:ph{type='
@@ -152,6 +184,17 @@ class Describe_BaseShapes(object):
         )
         return shapes, placeholder_, expected_xml
 
+    @pytest.fixture
+    def get_by_fixture(self, BaseShapeFactory_, shape_):
+        spTree = element(
+            'p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1,name=tree},p:sp/p:nvSpPr/p:cN'
+            'vPr{id=2,name=Foo},p:sp/p:nvSpPr/p:cNvPr{id=3,name=Bar},p:sp/p:n'
+            'vSpPr/p:cNvPr{id=4,name=Bar})'
+        )
+        shapes = _BaseShapes(spTree, None)
+        sps = spTree.xpath('p:sp')
+        return shapes, sps, BaseShapeFactory_, shape_
+
     @pytest.fixture
     def getitem_fixture(self, BaseShapeFactory_, shape_):
         spTree = element('p:spTree/(p:sp,p:sp)')
@@ -189,21 +232,12 @@ class Describe_BaseShapes(object):
         expected_count = 2
         return shapes, expected_count
 
-    @pytest.fixture(params=[
-        ('p:spTree/p:nvSpPr',                                 1),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=0}',                   1),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=1}',                   2),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=2}',                   3),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})',   4),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})', 3),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})', 3),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:'
-         'cNvPr{id=1},p:cNvPr{id=4})',                        5),
-    ])
+    @pytest.fixture
     def next_id_fixture(self, request):
-        spTree_cxml, expected_value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
-        return shapes, expected_value
+        part_ = instance_mock(request, SlidePart)
+        shapes = _BaseShapes(None, None)
+        property_mock(request, _BaseShapes, 'part', return_value=part_)
+        return shapes, part_
 
     @pytest.fixture(params=[
         (PP_PLACEHOLDER.OBJECT, 3, ST_Direction.HORZ,
@@ -217,37 +251,17 @@ class Describe_BaseShapes(object):
     ])
     def ph_name_fixture(self, request):
         ph_type, sp_id, orient, expected_name = request.param
-        spTree = element(
-            'p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table Placeholder '
-            '3})'
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table'
+            ' Placeholder 3})'
+        )
+        shapes = SlideShapes(sld.spTree, None)
+        property_mock(
+            request, _BaseShapes, 'part',
+            return_value=SlidePart(None, None, sld, None)
         )
-        shapes = SlideShapes(spTree, None)
         return shapes, ph_type, sp_id, orient, expected_name
 
-    @pytest.fixture(params=[
-        (None, False),
-        (42, True),
-    ])
-    def turbo_fixture(self, request):
-        cached_max_shape_id, expected_value = request.param
-        shapes = _BaseShapes(None, None)
-        if cached_max_shape_id:
-            shapes._cached_max_shape_id = cached_max_shape_id
-        return shapes, expected_value
-
-    @pytest.fixture(params=[
-        ('p:spTree/p:nvSpPr',                                 True),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=2}',                   True),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})',   False),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:'
-         'cNvPr{id=1},p:cNvPr{id=4})',                        True),
-    ])
-    def turbo_set_fixture(self, request):
-        spTree_cxml, value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
-        expected_value = value
-        return shapes, value, expected_value
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -257,6 +271,10 @@ class Describe_BaseShapes(object):
             return_value=shape_, autospec=True
         )
 
+    @pytest.fixture
+    def _next_shape_id_prop_(self, request):
+        return property_mock(request, _BaseShapes, '_next_shape_id')
+
     @pytest.fixture
     def placeholder_(self, request):
         return instance_mock(request, Shape)
@@ -313,12 +331,18 @@ class Describe_BaseGroupShapes(object):
         )
         assert builder is builder_
 
+    def it_can_defer_extents_recalculation(self, batch_fixture):
+        shapes, slide_part_, context_ = batch_fixture
+        context = shapes.batch()
+        slide_part_.deferred_group_extents.assert_called_once_with()
+        assert context is context_
+
     def it_can_add_a_group_shape(self, group_fixture):
         shapes, spTree, grpSp, group_shape_ = group_fixture
 
         group_shape = shapes.add_group_shape()
 
-        spTree.add_grpSp.assert_called_once_with(spTree)
+        spTree.add_grpSp.assert_called_once_with(spTree, 42, 'Group 41')
         shapes._shape_factory.assert_called_once_with(shapes, grpSp)
         assert group_shape is group_shape_
 
@@ -352,6 +376,80 @@ class Describe_BaseGroupShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, sp)
         assert shape is shape_
 
+    def it_can_add_shapes_in_bulk(self, bulk_fixture):
+        shapes, kwargs, expected_xml = bulk_fixture
+
+        bulk_shapes = shapes.add_shapes_bulk(**kwargs)
+
+        assert shapes._element.xml == expected_xml
+        shapes._recalculate_extents.assert_called_once_with(shapes)
+        assert len(bulk_shapes) == 2
+        assert bulk_shapes[1].shape_id == 43
+        assert [shape.name for shape in bulk_shapes[:]] == [
+            shape.name for shape in shapes
+        ]
+
+    def it_can_add_autoshapes_in_bulk(self, part_prop_, slide_part_):
+        shapes = _BaseGroupShapes(element('p:spTree'), None)
+        part_prop_.return_value = slide_part_
+        slide_part_.next_shape_ids.return_value = range(4, 6)
+
+        bulk_shapes = shapes.add_shapes_bulk(
+            MSO_SHAPE_TYPE.AUTO_SHAPE, (1, 2), (3, 4), (5, 6), (7, 8),
+            texts=('a\nb', 'c')
+        )
+
+        assert [(s.name, s.auto_shape_type, s.text) for s in bulk_shapes] == [
+            ('Rectangle 3', MSO_AUTO_SHAPE_TYPE.RECTANGLE, 'a\nb'),
+            ('Rectangle 4', MSO_AUTO_SHAPE_TYPE.RECTANGLE, 'c'),
+        ]
+
+    def it_converts_non_string_bulk_texts(self, part_prop_, slide_part_):
+        shapes = _BaseGroupShapes(element('p:spTree'), None)
+        part_prop_.return_value = slide_part_
+        slide_part_.next_shape_ids.return_value = range(4, 8)
+
+        bulk_shapes = shapes.add_shapes_bulk(
+            MSO_SHAPE_TYPE.TEXT_BOX, (1, 2, 3, 4), (1, 2, 3, 4),
+            (1, 2, 3, 4), (1, 2, 3, 4), texts=(42, 1.5, None, True)
+        )
+
+        assert [s.text for s in bulk_shapes] == ['42', '1.5', '', 'True']
+
+    def it_provides_the_same_shape_objects_for_bulk_shapes(
+            self, part_prop_, slide_part_):
+        shapes = _BaseGroupShapes(element('p:spTree'), None)
+        part_prop_.return_value = slide_part_
+        slide_part_.next_shape_ids.return_value = range(4, 6)
+
+        bulk_shapes = shapes.add_shapes_bulk(
+            MSO_SHAPE_TYPE.TEXT_BOX, (1, 2), (3, 4), (5, 6), (7, 8)
+        )
+
+        assert bulk_shapes[1] is shapes[1]
+        assert bulk_shapes[:] == [shapes[0], shapes[1]]
+        assert bulk_shapes[0] is shapes[0]
+
+    def it_registers_the_names_given_for_shapes_added_in_bulk(
+            self, part_prop_, slide_part_):
+        shapes = _BaseGroupShapes(element('p:spTree'), None)
+        part_prop_.return_value = slide_part_
+        slide_part_.next_shape_ids.return_value = range(4, 6)
+
+        shapes.add_shapes_bulk(
+            MSO_SHAPE_TYPE.TEXT_BOX, (1, 2), (3, 4), (5, 6), (7, 8),
+            names=('Title 9', 'Label')
+        )
+
+        assert slide_part_.register_shape_name.call_args_list == [
+            call('Title 9'), call('Label')
+        ]
+
+    def it_raises_on_bad_bulk_arguments(self, bulk_raises_fixture):
+        shapes, kwargs = bulk_raises_fixture
+        with pytest.raises(ValueError):
+            shapes.add_shapes_bulk(**kwargs)
+
     def it_can_add_a_textbox(self, textbox_fixture):
         shapes, x, y, cx, cy, sp, shape_ = textbox_fixture
 
@@ -438,8 +536,9 @@ class Describe_BaseGroupShapes(object):
         )
 
     @pytest.fixture
-    def add_cht_gr_frm_fixture(self):
+    def add_cht_gr_frm_fixture(self, _next_shape_id_prop_):
         shapes = _BaseGroupShapes(element('p:spTree'), None)
+        _next_shape_id_prop_.return_value = 1
         rId, x, y, cx, cy = 'rId42', 1, 2, 3, 4
         expected_xml = (
             '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentati'
@@ -468,9 +567,10 @@ class Describe_BaseGroupShapes(object):
         (9, 8, 2, 3,
          'p:spPr/(a:xfrm{flipH=1,flipV=1}/(a:off{x=2,y=3},a:ext{cx=7,cy=5})'),
     ])
-    def add_cxnSp_fixture(self, request):
+    def add_cxnSp_fixture(self, request, _next_shape_id_prop_):
         begin_x, begin_y, end_x, end_y, spPr_cxml = request.param
         shapes = _BaseGroupShapes(element('p:spTree'), None)
+        _next_shape_id_prop_.return_value = 1
         connector_type = MSO_CONNECTOR.STRAIGHT
         tmpl_cxml = (
             'p:cxnSp/(p:nvCxnSpPr/(p:cNvPr{id=1,name=Connector 0},p:cNvCxnSp'
@@ -592,15 +692,69 @@ class Describe_BaseGroupShapes(object):
             y_scale, builder_
         )
 
+    @pytest.fixture
+    def batch_fixture(self, part_prop_, slide_part_):
+        shapes = _BaseGroupShapes(None, None)
+        part_prop_.return_value = slide_part_
+        context_ = slide_part_.deferred_group_extents.return_value
+        return shapes, slide_part_, context_
+
+    @pytest.fixture(params=[
+        (MSO_SHAPE_TYPE.TEXT_BOX, None, None, None,
+         'p:spTree{a:b=c}/(p:sp/(p:nvSpPr/(p:cNvPr{id=42,name=TextBox 41},p:cN'
+         'vSpPr{txBox=1},p:nvPr),p:spPr/(a:xfrm/(a:off{x=1,y=3},a:ext{cx=5,cy='
+         '7}),a:prstGeom{prst=rect}/a:avLst,a:noFill),p:txBody/(a:bodyPr{wrap='
+         'none}/a:spAutoFit,a:lstStyle,a:p)),p:sp/(p:nvSpPr/(p:cNvPr{id=43,nam'
+         'e=TextBox 42},p:cNvSpPr{txBox=1},p:nvPr),p:spPr/(a:xfrm/(a:off{x=2,y'
+         '=4},a:ext{cx=6,cy=8}),a:prstGeom{prst=rect}/a:avLst,a:noFill),p:txBo'
+         'dy/(a:bodyPr{wrap=none}/a:spAutoFit,a:lstStyle,a:p)))'),
+        (MSO_SHAPE_TYPE.TEXT_BOX, ('Foo', None), ('A', 'B'), None,
+         'p:spTree{a:b=c}/(p:sp/(p:nvSpPr/(p:cNvPr{id=42,name=A},p:cNvSpPr{t'
+         'xBox=1},p:nvPr),p:spPr/(a:xfrm/(a:off{x=1,y=3},a:ext{cx=5,cy=7}),a:'
+         'prstGeom{prst=rect}/a:avLst,a:noFill),p:txBody/(a:bodyPr{wrap=none}'
+         '/a:spAutoFit,a:lstStyle,a:p/a:r/a:t"Foo")),p:sp/(p:nvSpPr/(p:cNvPr{'
+         'id=43,name=B},p:cNvSpPr{txBox=1},p:nvPr),p:spPr/(a:xfrm/(a:off{x=2,'
+         'y=4},a:ext{cx=6,cy=8}),a:prstGeom{prst=rect}/a:avLst,a:noFill),p:tx'
+         'Body/(a:bodyPr{wrap=none}/a:spAutoFit,a:lstStyle,a:p)))'),
+    ])
+    def bulk_fixture(self, request, part_prop_, slide_part_,
+                     _recalculate_extents_):
+        kind, texts, names, autoshape_type, expected_cxml = request.param
+        shapes = _BaseGroupShapes(element('p:spTree{a:b=c}'), None)
+        part_prop_.return_value = slide_part_
+        slide_part_.next_shape_ids.return_value = range(42, 44)
+        kwargs = {
+            'kind': kind, 'lefts': (1, 2.0), 'tops': [3, 4], 'widths': (5, 6),
+            'heights': (7, 8), 'texts': texts, 'names': names,
+            'autoshape_type': autoshape_type,
+        }
+        expected_xml = xml(expected_cxml)
+        return shapes, kwargs, expected_xml
+
+    @pytest.fixture(params=[
+        (MSO_SHAPE_TYPE.PICTURE, (1, 2), None),
+        (MSO_SHAPE_TYPE.TEXT_BOX, (1,), None),
+        (MSO_SHAPE_TYPE.AUTO_SHAPE, (1, 2), ('a', 'b', 'c')),
+    ])
+    def bulk_raises_fixture(self, request):
+        kind, lefts, texts = request.param
+        shapes = _BaseGroupShapes(element('p:spTree'), None)
+        kwargs = {
+            'kind': kind, 'lefts': lefts, 'tops': (1, 2), 'widths': (1, 2),
+            'heights': (1, 2), 'texts': texts,
+        }
+        return shapes, kwargs
+
     @pytest.fixture
     def group_fixture(self, CT_GroupShape_add_grpSp_, _shape_factory_,
-                      group_shape_):
+                      group_shape_, _next_shape_id_prop_):
         spTree = element('p:spTree{id=2e838acdc755e83113ed03904d2fe081f}')
         grpSp = element('p:grpSp{id=052874e154b48f9bec4266f80913cae38f}')
         shapes = _BaseGroupShapes(spTree, None)
 
         CT_GroupShape_add_grpSp_.return_value = grpSp
         _shape_factory_.return_value = group_shape_
+        _next_shape_id_prop_.return_value = 42
 
         return shapes, spTree, grpSp, group_shape_
 
@@ -788,15 +942,19 @@ class Describe_BaseGroupShapes(object):
 class DescribeGroupShapes(object):
 
     def it_recalculates_its_extents_to_help(self, recalc_fixture):
-        shapes = recalc_fixture
+        shapes, grpSp_, slide_part_ = recalc_fixture
         shapes._recalculate_extents()
-        shapes._grpSp.recalculate_extents.assert_called_once_with()
+        slide_part_.recalculate_group_extents.assert_called_once_with(grpSp_)
 
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def recalc_fixture(self, grpSp_):
-        return GroupShapes(grpSp_, None)
+    def recalc_fixture(self, request, grpSp_, slide_part_):
+        shapes = GroupShapes(grpSp_, None)
+        property_mock(
+            request, GroupShapes, 'part', return_value=slide_part_
+        )
+        return shapes, grpSp_, slide_part_
 
     # fixture components ---------------------------------------------
 
@@ -804,6 +962,90 @@ class DescribeGroupShapes(object):
     def grpSp_(self, request):
         return instance_mock(request, CT_GroupShape)
 
+    @pytest.fixture
+    def slide_part_(self, request):
+        return instance_mock(request, SlidePart)
+
+
+class Describe_ShapeIndex(object):
+
+    def it_provides_indexed_access_to_member_elements(self, spTree):
+        index = _ShapeIndex(spTree, spTree.iter_shape_elms)
+        sps = spTree.xpath('p:sp')
+        assert len(index) == 3
+        assert [index.elm_at(i) for i in (0, 1, 2, -1)] == sps + sps[2:]
+        assert index.index_of(sps[1]) == 1
+        assert index.index_of(spTree[0]) is None
+        with pytest.raises(IndexError):
+            index.elm_at(3)
+
+    def it_can_find_elements_by_key(self, spTree):
+        index = _ShapeIndex(spTree, spTree.iter_shape_elms)
+        sps = spTree.xpath('p:sp')
+        assert index.elm_with_id(3) is sps[1]
+        assert index.elm_named('Bar') is sps[1]
+        assert index.ph_elm_with_idx(1) is sps[2]
+        assert index.ph_elm_of_type(PP_PLACEHOLDER.TITLE) is sps[0]
+        assert index.elm_with_id(42) is None
+        assert index.ph_elm_with_idx(42) is None
+
+    def it_does_not_rescan_for_repeated_lookups(self, spTree, request):
+        index = _ShapeIndex(spTree, spTree.iter_shape_elms)
+        index.elm_named('Foo')
+        _rebuild_ = method_mock(request, _ShapeIndex, '_rebuild')
+        index.elm_named('Foo')
+        index.elm_with_id(4)
+        index.elm_at(1)
+        assert _rebuild_.call_count == 0
+
+    def it_does_not_rescan_when_a_lookup_finds_nothing(self, spTree, request):
+        index = _ShapeIndex(spTree, spTree.iter_shape_elms)
+        len(index)
+        _rebuild_ = method_mock(request, _ShapeIndex, '_rebuild')
+        assert index.elm_with_id(42) is None
+        assert index.elm_named('Baz') is None
+        assert index.ph_elm_with_idx(42) is None
+        assert _rebuild_.call_count == 0
+
+    def it_keeps_up_with_changes_to_the_shape_tree(self, spTree):
+        index = _ShapeIndex(spTree, spTree.iter_shape_elms)
+        sps = spTree.xpath('p:sp')
+        assert index.elm_named('Bar') is sps[1]
+
+        sps[1].nvSpPr.cNvPr.name = 'Baz'
+        assert index.elm_named('Bar') is sps[2]
+        assert index.elm_named('Baz') is sps[1]
+
+        spTree.remove(sps[0])
+        spTree.append(sps[0])
+        assert index.elm_at(0) is sps[1]
+        assert index.index_of(sps[0]) == 2
+
+        spTree.remove(sps[2])
+        assert len(index) == 2
+        assert index.ph_elm_with_idx(1) is None
+        assert index.elm_with_id(4) is None
+
+    def it_reports_each_rebuild_to_its_owner(self, spTree):
+        calls = []
+        index = _ShapeIndex(spTree, spTree.iter_shape_elms, calls.append)
+        sps = spTree.xpath('p:sp')
+        len(index)
+        spTree.remove(sps[0])
+        len(index)
+        assert calls == [sps, sps[1:]]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def spTree(self):
+        return element(
+            'p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1,name=tree},p:sp/p:nvSpPr/(p:c'
+            'NvPr{id=2,name=Foo},p:nvPr/p:ph{type=title}),p:sp/p:nvSpPr/p:cNv'
+            'Pr{id=3,name=Bar},p:sp/p:nvSpPr/(p:cNvPr{id=4,name=Bar},p:nvPr/p'
+            ':ph{idx=1}))'
+        )
+
 
 class DescribeBasePlaceholders(object):
 
@@ -922,6 +1164,20 @@ class DescribeSlidePlaceholders(object):
         assert SlideShapeFactory_.call_args_list == expected_calls
         assert ps == expected_values
 
+    def it_reuses_the_placeholder_objects_it_provides(self):
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvSpPr/p'
+            ':nvPr/p:ph{type=body,idx=1})'
+        )
+        placeholders = SlidePlaceholders(spTree, None)
+
+        first_placeholders = list(placeholders)
+
+        assert all(
+            a is b for a, b in zip(placeholders, first_placeholders)
+        )
+        assert placeholders[1] is first_placeholders[1]
+
     def it_knows_how_many_placeholders_it_contains(self, len_fixture):
         placeholders, expected_value = len_fixture
         assert len(placeholders) == expected_value
@@ -991,87 +1247,35 @@ class DescribeSlidePlaceholders(object):
 class Describe_SlidePlaceholderFactory(object):
 
     def it_constructs_the_right_type_of_placeholder(self, factory_fixture):
-        element, parent_, Constructor_, placeholder_ = factory_fixture
+        element, parent_, PlaceholderCls = factory_fixture
         placeholder = _SlidePlaceholderFactory(element, parent_)
-        Constructor_.assert_called_once_with(element, parent_)
-        assert placeholder is placeholder_
+        assert type(placeholder) is PlaceholderCls
+        assert placeholder._element is element
+        assert placeholder._parent is parent_
 
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
-        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=title}',                 'sp'),
-        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=pic,idx=1}',             'pph'),
-        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=clipArt,idx=1}',         'pph'),
-        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=tbl,idx=1}',             'tph'),
-        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=chart,idx=10}',          'cph'),
-        ('p:pic/p:nvPicPr/p:nvPr/p:ph{type=pic,idx=1}',           'php'),
-        ('p:graphicFrame/p:nvSpPr/p:nvPr/p:ph{type=tbl,idx=2}',   'phgf'),
-        ('p:graphicFrame/p:nvSpPr/p:nvPr/p:ph{type=chart,idx=2}', 'phgf'),
-        ('p:graphicFrame/p:nvSpPr/p:nvPr/p:ph{type=dgm,idx=2}',   'phgf'),
+        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=title}',     SlidePlaceholder),
+        ('p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1}',          SlidePlaceholder),
+        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=pic,idx=1}', PicturePlaceholder),
+        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=clipArt,idx=1}',
+         PicturePlaceholder),
+        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=tbl,idx=1}', TablePlaceholder),
+        ('p:sp/p:nvSpPr/p:nvPr/p:ph{type=chart,idx=10}', ChartPlaceholder),
+        ('p:pic/p:nvPicPr/p:nvPr/p:ph{type=pic,idx=1}', PlaceholderPicture),
+        ('p:graphicFrame/p:nvSpPr/p:nvPr/p:ph{type=tbl,idx=2}',
+         PlaceholderGraphicFrame),
+        ('p:graphicFrame/p:nvSpPr/p:nvPr/p:ph{type=chart,idx=2}',
+         PlaceholderGraphicFrame),
+        ('p:graphicFrame/p:nvSpPr/p:nvPr/p:ph{type=dgm,idx=2}',
+         PlaceholderGraphicFrame),
+        ('p:cxnSp/p:nvCxnSpPr/p:nvPr/p:ph{type=body,idx=3}', Connector),
     ])
-    def factory_fixture(
-            self, request, SlidePlaceholder_, ChartPlaceholder_,
-            PicturePlaceholder_, TablePlaceholder_, PlaceholderGraphicFrame_,
-            PlaceholderPicture_, placeholder_):
-        shape_cxml, constructor_key = request.param
+    def factory_fixture(self, request):
+        shape_cxml, PlaceholderCls = request.param
         shape_elm = element(shape_cxml)
-        Constructor_, shape_ = {
-            'sp':   (SlidePlaceholder_,        placeholder_),
-            'cph':  (ChartPlaceholder_,        placeholder_),
-            'pph':  (PicturePlaceholder_,      placeholder_),
-            'tph':  (TablePlaceholder_,        placeholder_),
-            'phgf': (PlaceholderGraphicFrame_, placeholder_),
-            'php':  (PlaceholderPicture_,      placeholder_),
-        }[constructor_key]
-        return shape_elm, 42, Constructor_, shape_
-
-    # fixture components -----------------------------------
-
-    @pytest.fixture
-    def ChartPlaceholder_(self, request, placeholder_):
-        return class_mock(
-            request, 'pptx.shapes.shapetree.ChartPlaceholder',
-            return_value=placeholder_
-        )
-
-    @pytest.fixture
-    def PicturePlaceholder_(self, request, placeholder_):
-        return class_mock(
-            request, 'pptx.shapes.shapetree.PicturePlaceholder',
-            return_value=placeholder_
-        )
-
-    @pytest.fixture
-    def PlaceholderGraphicFrame_(self, request, placeholder_):
-        return class_mock(
-            request, 'pptx.shapes.shapetree.PlaceholderGraphicFrame',
-            return_value=placeholder_
-        )
-
-    @pytest.fixture
-    def PlaceholderPicture_(self, request, placeholder_):
-        return class_mock(
-            request, 'pptx.shapes.shapetree.PlaceholderPicture',
-            return_value=placeholder_
-        )
-
-    @pytest.fixture
-    def placeholder_(self, request):
-        return instance_mock(request, _BaseSlidePlaceholder)
-
-    @pytest.fixture
-    def SlidePlaceholder_(self, request, placeholder_):
-        return class_mock(
-            request, 'pptx.shapes.shapetree.SlidePlaceholder',
-            return_value=placeholder_
-        )
-
-    @pytest.fixture
-    def TablePlaceholder_(self, request, placeholder_):
-        return class_mock(
-            request, 'pptx.shapes.shapetree.TablePlaceholder',
-            return_value=placeholder_
-        )
+        return shape_elm, 42, PlaceholderCls
 
 
 class DescribeSlideShapeFactory(object):
@@ -1139,6 +1343,28 @@ class DescribeSlideShapes(object):
         assert _shape_factory_.call_args_list == calls
         assert title_placeholder is shape_
 
+    def it_can_compute_the_absolute_geometry_of_its_shapes(self, request):
+        absolute_geometry_ = function_mock(
+            request, 'pptx.shapes.shapetree.absolute_geometry'
+        )
+        shapes = SlideShapes(None, None)
+
+        geometry = shapes.absolute_geometry()
+
+        absolute_geometry_.assert_called_once_with(shapes)
+        assert geometry is absolute_geometry_.return_value
+
+    def it_can_build_a_spatial_index_of_its_shapes(self, request):
+        SpatialIndex_ = class_mock(
+            request, 'pptx.shapes.shapetree.SpatialIndex'
+        )
+        shapes = SlideShapes(None, None)
+
+        spatial_index = shapes.spatial_index()
+
+        SpatialIndex_.assert_called_once_with(shapes)
+        assert spatial_index is SpatialIndex_.return_value
+
     def it_can_add_a_movie(self, movie_fixture):
         shapes, movie_file, x, y, cx, cy = movie_fixture[:6]
         poster_frame_image, mime_type, shape_id_ = movie_fixture[6:9]
@@ -1154,6 +1380,9 @@ class DescribeSlideShapes(object):
             mime_type
         )
         shapes._spTree[-1] is movie_pic
+        shapes.part.register_shape_name.assert_called_once_with(
+            'foobar.mp4'
+        )
         _add_video_timing_.assert_called_once_with(shapes, movie_pic)
         _shape_factory_.assert_called_once_with(shapes, movie_pic)
         assert movie is movie_
@@ -1168,6 +1397,28 @@ class DescribeSlideShapes(object):
         assert table is table_
         assert shapes._element.xml == expected_xml
 
+    def it_can_add_a_table_from_data(self, request):
+        graphic_frame_ = loose_mock(request)
+        add_table_ = method_mock(
+            request, SlideShapes, 'add_table', return_value=graphic_frame_
+        )
+        shapes = SlideShapes(None, None)
+
+        graphic_frame = shapes.add_table_from_data(
+            [[1.5, 'a'], [None]], 1, 2, 3, 4, '.2f'
+        )
+
+        add_table_.assert_called_once_with(2, 2, 1, 2, 3, 4)
+        graphic_frame_.table.fill.assert_called_once_with(
+            [['1.50', 'a'], ['']]
+        )
+        assert graphic_frame is graphic_frame_
+
+    def but_it_raises_on_empty_table_data(self):
+        shapes = SlideShapes(None, None)
+        with pytest.raises(ValueError):
+            shapes.add_table_from_data([[]], 1, 2, 3, 4)
+
     def it_can_clone_placeholder_shapes_from_a_layout(self, clone_fixture):
         shapes, slide_layout_, calls = clone_fixture
         shapes.clone_layout_placeholders(slide_layout_)
@@ -1211,12 +1462,14 @@ class DescribeSlideShapes(object):
         return shapes, sp, SlideShapeFactory_, shape_
 
     @pytest.fixture
-    def movie_fixture(self, _MoviePicElementCreator_, _add_video_timing_,
-                      _shape_factory_, movie_, _next_shape_id_prop_):
+    def movie_fixture(self, request, _MoviePicElementCreator_,
+                      _add_video_timing_, _shape_factory_, movie_,
+                      _next_shape_id_prop_):
+        property_mock(request, SlideShapes, 'part')
         shapes = SlideShapes(element('p:spTree'), None)
         movie_file, x, y, cx, cy = 'foobar.mp4', 1, 2, 3, 4
         poster_frame_image, mime_type = 'foobar.png', 'video/mp4'
-        movie_pic = element('p:pic')
+        movie_pic = element('p:pic/p:nvPicPr/p:cNvPr{name=foobar.mp4}')
         _MoviePicElementCreator_.new_movie_pic.return_value = movie_pic
         _shape_factory_.return_value = movie_
         shape_id_ = _next_shape_id_prop_.return_value
@@ -1227,8 +1480,9 @@ class DescribeSlideShapes(object):
         )
 
     @pytest.fixture
-    def table_fixture(self, table_, _shape_factory_):
+    def table_fixture(self, table_, _shape_factory_, _next_shape_id_prop_):
         shapes = SlideShapes(element('p:spTree'), None)
+        _next_shape_id_prop_.return_value = 1
         rows, cols, x, y, cx, cy = 1, 2, 10, 11, 12, 13
         _shape_factory_.return_value = table_
         expected_xml = (
@@ -1435,8 +1689,29 @@ class DescribeLayoutPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_idx_value(self, get_fixture):
-        placeholders, idx, placeholder_ = get_fixture
-        assert placeholders.get(idx) is placeholder_
+        placeholders, idx, ph_elm, _LayoutShapeFactory_ = get_fixture[:4]
+        placeholder_ = get_fixture[4]
+        placeholder = placeholders.get(idx)
+        _LayoutShapeFactory_.assert_called_once_with(ph_elm, placeholders)
+        assert placeholder is placeholder_
+
+    def it_holds_the_placeholders_it_returns(self):
+        spTree = element('p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1}')
+        placeholders = LayoutPlaceholders(spTree, None)
+        placeholder_ref = weakref.ref(placeholders.get(1))
+        assert placeholder_ref() is placeholders.get(1)
+
+    def it_drops_the_placeholders_removed_from_the_tree(self):
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1},p:sp/p:nvSpPr/p:nvP'
+            'r/p:ph{idx=2})'
+        )
+        placeholders = LayoutPlaceholders(spTree, None)
+        sps = spTree.xpath('p:sp')
+        placeholders.get(1), placeholders.get(2)
+        spTree.remove(sps[0])
+        assert placeholders.get(2) is not None
+        assert list(placeholders._shapes.keys()) == [sps[1]]
 
     def it_returns_default_on_ph_idx_not_found(self, default_fixture):
         placeholders, default = default_fixture
@@ -1445,8 +1720,9 @@ class DescribeLayoutPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = LayoutPlaceholders(None, None)
+    def default_fixture(self):
+        spTree = element('p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1},p:sp)')
+        placeholders = LayoutPlaceholders(spTree, None)
         default = 'barfoo'
         return placeholders, default
 
@@ -1457,22 +1733,21 @@ class DescribeLayoutPlaceholders(object):
         return placeholders, sp, _LayoutShapeFactory_, placeholder_
 
     @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
+    def get_fixture(self, request, _LayoutShapeFactory_, placeholder_):
         idx = request.param
-        layout_placeholders = LayoutPlaceholders(None, None)
-        _placeholder_ = (placeholder_, placeholder_2_)[idx]
-        placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
-        return layout_placeholders, idx, _placeholder_
+        spTree = element(
+            'p:spTree/(p:sp,p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvS'
+            'pPr/p:nvPr/p:ph{idx=1},p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1})'
+        )
+        layout_placeholders = LayoutPlaceholders(spTree, None)
+        ph_elm = spTree[idx + 1]
+        return (
+            layout_placeholders, idx, ph_elm, _LayoutShapeFactory_,
+            placeholder_
+        )
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, LayoutPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
-        )
-
     @pytest.fixture
     def _LayoutShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1488,10 +1763,6 @@ class DescribeLayoutPlaceholders(object):
     def placeholder_(self, request):
         return instance_mock(request, LayoutPlaceholder)
 
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, LayoutPlaceholder)
-
 
 class Describe_MasterShapeFactory(object):
 
@@ -1593,18 +1864,24 @@ class DescribeMasterPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_type(self, get_fixture):
-        placeholders, ph_type, placeholder_ = get_fixture
-        assert placeholders.get(ph_type) is placeholder_
+        placeholders, ph_type, ph_elm, _MasterShapeFactory_ = get_fixture[:4]
+        placeholder_ = get_fixture[4]
+        placeholder = placeholders.get(ph_type)
+        _MasterShapeFactory_.assert_called_once_with(ph_elm, placeholders)
+        assert placeholder is placeholder_
 
     def it_returns_default_on_ph_type_not_found(self, default_fixture):
         placeholders, default = default_fixture
-        assert placeholders.get(42, default) is default
+        assert placeholders.get(PP_PLACEHOLDER.CHART, default) is default
 
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = MasterPlaceholders(None, None)
+    def default_fixture(self):
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp)'
+        )
+        placeholders = MasterPlaceholders(spTree, None)
         default = 'barfoo'
         return placeholders, default
 
@@ -1614,24 +1891,25 @@ class DescribeMasterPlaceholders(object):
         sp = element('p:sp')
         return placeholders, sp, _MasterShapeFactory_, placeholder_
 
-    @pytest.fixture(params=['title', 'body'])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        ph_type = request.param
-        placeholders = MasterPlaceholders(None, None)
-        _placeholder_ = {
-            'title': placeholder_, 'body': placeholder_2_
-        }[ph_type]
-        return placeholders, ph_type, _placeholder_
+    @pytest.fixture(params=[
+        (PP_PLACEHOLDER.TITLE, 1),
+        (PP_PLACEHOLDER.BODY,  2),
+    ])
+    def get_fixture(self, request, _MasterShapeFactory_, placeholder_):
+        ph_type, elm_idx = request.param
+        spTree = element(
+            'p:spTree/(p:sp,p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvS'
+            'pPr/p:nvPr/p:ph{type=body,idx=1},p:sp/p:nvSpPr/p:nvPr/p:ph{type='
+            'body,idx=2})'
+        )
+        placeholders = MasterPlaceholders(spTree, None)
+        ph_elm = spTree[elm_idx]
+        return (
+            placeholders, ph_type, ph_elm, _MasterShapeFactory_, placeholder_
+        )
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, MasterPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
-        )
-
     @pytest.fixture
     def _MasterShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1641,11 +1919,7 @@ class DescribeMasterPlaceholders(object):
 
     @pytest.fixture
     def placeholder_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type='title')
-
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type='body')
+        return instance_mock(request, MasterPlaceholder)
 
 
 class Describe_MoviePicElementCreator(object):
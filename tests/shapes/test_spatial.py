@@ -0,0 +1,200 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.shapes.spatial` module."""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from pptx.shapes.shapetree import SlideShapes
+from pptx.shapes.spatial import (
+    _abs_child_transform, _ABS_IDENTITY, absolute_geometry, SpatialIndex
+)
+
+from ..unitutil.cxml import element
+from ..unitutil.mock import var_mock
+
+
+class Describe_absolute_geometry(object):
+
+    def it_computes_the_slide_geometry_of_each_shape(self, request):
+        var_mock(request, 'pptx.shapes.spatial.numpy', new=None)
+        spTree = element(
+            'p:spTree/(p:sp/(p:nvSpPr/p:cNvPr{id=2,name=A},p:spPr/a:xfrm{rot'
+            '=1800000}/(a:off{x=10,y=20},a:ext{cx=30,cy=40})),p:grpSp/(p:nvGr'
+            'pSpPr/p:cNvPr{id=3,name=G},p:grpSpPr/a:xfrm{rot=5400000}/(a:off{'
+            'x=0,y=0},a:ext{cx=200,cy=100},a:chOff{x=0,y=0},a:chExt{cx=100,cy'
+            '=100}),p:sp/(p:nvSpPr/p:cNvPr{id=4,name=B},p:spPr/a:xfrm/(a:off{'
+            'x=0,y=0},a:ext{cx=10,cy=10}))),p:sp/(p:nvSpPr/p:cNvPr{id=5,name='
+            'C},p:spPr))'
+        )
+        shapes = SlideShapes(spTree, None)
+
+        values = absolute_geometry(shapes)
+
+        assert len(values) == 18
+        assert list(values[:12]) == [
+            2, 10, 20, 30, 40, 30,
+            3, 0, 0, 200, 100, 90,
+        ]
+        assert [round(v, 6) for v in values[12:]] == [4, 135, -45, 20, 10, 90]
+
+    def it_returns_a_numpy_array_when_numpy_is_installed(self, request):
+        numpy_ = var_mock(request, 'pptx.shapes.spatial.numpy')
+        shapes = SlideShapes(element('p:spTree'), None)
+
+        result = absolute_geometry(shapes)
+
+        values, kwargs = numpy_.frombuffer.call_args
+        assert list(values[0]) == []
+        assert kwargs == {'dtype': numpy_.float64}
+        numpy_.frombuffer.return_value.reshape.assert_called_once_with(-1, 6)
+        assert result is numpy_.frombuffer.return_value.reshape.return_value
+
+
+class Describe_abs_child_transform(object):
+
+    def it_maps_group_child_coordinates_to_slide(self, transform_fixture):
+        grpSp, transform, expected_value = transform_fixture
+        value = _abs_child_transform(grpSp, transform)
+        assert tuple(round(v, 6) for v in value) == expected_value
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('p:grpSp/p:grpSpPr', _ABS_IDENTITY, _ABS_IDENTITY),
+        ('p:grpSp/p:grpSpPr/a:xfrm/(a:off{x=10,y=20},a:ext{cx=100,cy=100},a'
+         ':chOff{x=5,y=5},a:chExt{cx=50,cy=200})', _ABS_IDENTITY,
+         (2.0, 0.0, 0.0, 0.5, 0.0, 17.5, 2.0, 0.5, 0.0)),
+        ('p:grpSp/p:grpSpPr/a:xfrm{rot=5400000}/(a:off{x=0,y=0},a:ext{cx=10'
+         '0,cy=50},a:chOff{x=0,y=0},a:chExt{cx=100,cy=50})',
+         (1.0, 0.0, 0.0, 1.0, 5.0, 0.0, 2.0, 1.0, 10.0),
+         (0.0, -1.0, 1.0, 0.0, 80.0, -25.0, 2.0, 1.0, 100.0)),
+        ('p:grpSp/p:grpSpPr/a:xfrm/(a:off{x=10,y=20},a:ext{cx=100,cy=100},a'
+         ':chOff{x=5,y=5},a:chExt{cx=0,cy=0})', _ABS_IDENTITY,
+         (1.0, 0.0, 0.0, 1.0, 5.0, 15.0, 1.0, 1.0, 0.0)),
+    ])
+    def transform_fixture(self, request):
+        grpSp_cxml, transform, expected_value = request.param
+        grpSp = element(grpSp_cxml)
+        return grpSp, transform, expected_value
+
+
+class DescribeSpatialIndex(object):
+
+    def it_indexes_each_shape_by_its_slide_bounding_box(self, shapes):
+        spatial_index = SpatialIndex(shapes)
+        assert len(spatial_index) == 4
+        assert list(spatial_index._lefts) == [0, 50, 250, 1100]
+        assert list(spatial_index._bottoms) == [100, 150, 350, 1120]
+
+    def it_encloses_each_shape_as_rotated(self):
+        spTree = element(
+            'p:spTree/(p:sp/(p:nvSpPr/p:cNvPr{id=2,name=A},p:spPr/a:xfrm{rot'
+            '=5400000}/(a:off{x=0,y=0},a:ext{cx=100,cy=20})),p:grpSp/(p:nvGr'
+            'pSpPr/p:cNvPr{id=3,name=G},p:grpSpPr/a:xfrm{rot=5400000}/(a:off{'
+            'x=0,y=0},a:ext{cx=200,cy=100},a:chOff{x=0,y=0},a:chExt{cx=100,cy'
+            '=100}),p:sp/(p:nvSpPr/p:cNvPr{id=4,name=B},p:spPr/a:xfrm/(a:off{'
+            'x=0,y=0},a:ext{cx=10,cy=10}))))'
+        )
+        spatial_index = SpatialIndex(SlideShapes(spTree, None))
+        assert len(spatial_index) == 2
+        boxes = zip(
+            spatial_index._lefts, spatial_index._tops, spatial_index._rights,
+            spatial_index._bottoms
+        )
+        assert [tuple(round(v, 6) for v in box) for box in boxes] == [
+            (40, -40, 60, 60), (140, -50, 150, -30),
+        ]
+
+    def it_can_find_the_shapes_in_a_region(self, query_fixture):
+        spatial_index, rect, expected_names = query_fixture
+        shapes = spatial_index.query(rect)
+        assert [shape.name for shape in shapes] == expected_names
+
+    def it_can_find_overlapping_shapes(self, shapes):
+        spatial_index = SpatialIndex(shapes)
+        pairs = spatial_index.overlaps()
+        assert [(a.name, b.name) for a, b in pairs] == [('A', 'B')]
+
+    def it_can_find_the_nearest_shape(self, nearest_fixture):
+        spatial_index, point, expected_name = nearest_fixture
+        shape = spatial_index.nearest(point)
+        assert shape.name == expected_name
+
+    def it_can_find_shapes_extending_beyond_the_slide(self, shapes):
+        spatial_index = SpatialIndex(shapes)
+        shapes = spatial_index.out_of_bounds(1000, 1000)
+        assert [shape.name for shape in shapes] == ['D']
+
+    def it_is_rebuilt_when_the_shape_tree_changes(self, shapes):
+        spatial_index = SpatialIndex(shapes)
+        assert len(spatial_index) == 4
+
+        spTree = shapes._spTree
+        spTree.remove(spTree.xpath('p:sp')[0])
+        assert [s.name for s in spatial_index.query((0, 0, 10, 10))] == []
+
+        spTree.append(element(
+            'p:sp/(p:nvSpPr/p:cNvPr{id=8,name=F},p:spPr/a:xfrm/(a:off{x=0,y'
+            '=0},a:ext{cx=10,cy=10}))'
+        ))
+        assert [s.name for s in spatial_index.query((0, 0, 10, 10))] == ['F']
+        assert len(spatial_index) == 4
+
+    def it_returns_the_shape_objects_of_its_collection(self, shapes):
+        spatial_index = SpatialIndex(shapes)
+        shape = spatial_index.nearest((20, 20))
+        assert shape is shapes[0]
+        group_shape = shapes[2]
+        assert spatial_index.nearest((400, 400)) is group_shape.shapes[0]
+
+    def it_handles_an_empty_slide(self):
+        shapes = SlideShapes(element('p:spTree'), None)
+        spatial_index = SpatialIndex(shapes)
+        assert spatial_index.query((0, 0, 10, 10)) == []
+        assert spatial_index.overlaps() == []
+        assert spatial_index.nearest((0, 0)) is None
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ((0, 0, 10, 10),         ['A']),
+        ((60, 60, 10, 10),       ['A', 'B']),
+        ((100, 100, 0, 0),       ['A', 'B']),
+        ((200, 200, 1000, 1000), ['C', 'D']),
+        ((2000, 2000, 10, 10),   []),
+    ])
+    def query_fixture(self, request, shapes):
+        rect, expected_names = request.param
+        spatial_index = SpatialIndex(shapes)
+        return spatial_index, rect, expected_names
+
+    @pytest.fixture(params=[
+        ((20, 20),     'A'),
+        ((120, 120),   'B'),
+        ((400, 400),   'C'),
+        ((5000, 5000), 'D'),
+        ((-50, -50),   'A'),
+    ])
+    def nearest_fixture(self, request, shapes):
+        point, expected_name = request.param
+        spatial_index = SpatialIndex(shapes)
+        return spatial_index, point, expected_name
+
+    @pytest.fixture
+    def shapes(self):
+        spTree = element(
+            'p:spTree/(p:sp/(p:nvSpPr/p:cNvPr{id=2,name=A},p:spPr/a:xfrm/(a:o'
+            'ff{x=0,y=0},a:ext{cx=100,cy=100})),p:sp/(p:nvSpPr/p:cNvPr{id=3,n'
+            'ame=B},p:spPr/a:xfrm/(a:off{x=50,y=50},a:ext{cx=100,cy=100})),p:'
+            'grpSp/(p:nvGrpSpPr/p:cNvPr{id=4,name=G},p:grpSpPr/a:xfrm/(a:off{'
+            'x=250,y=250},a:ext{cx=1000,cy=1000},a:chOff{x=0,y=0},a:chExt{cx='
+            '500,cy=500}),p:sp/(p:nvSpPr/p:cNvPr{id=5,name=C},p:spPr/a:xfrm/('
+            'a:off{x=0,y=0},a:ext{cx=50,cy=50})),p:sp/(p:nvSpPr/p:cNvPr{id=6,'
+            'name=D},p:spPr/a:xfrm/(a:off{x=425,y=425},a:ext{cx=10,cy=10}))),'
+            'p:sp/(p:nvSpPr/p:cNvPr{id=7,name=E},p:spPr))'
+        )
+        return SlideShapes(spTree, None)
@@ -8,18 +8,21 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from pptx.dml.color import RGBColor
 from pptx.dml.fill import FillFormat
-from pptx.enum.text import MSO_ANCHOR
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
 from pptx.oxml.ns import qn
 from pptx.shapes.graphfrm import GraphicFrame
 from pptx.shapes.table import (
-    _Cell, _CellCollection, _Column, _ColumnCollection, _Row, _RowCollection,
-    Table
+    _Cell, _CellCollection, _CellRange, _Column, _ColumnCollection, _Row,
+    _RowCollection, Table
 )
 from pptx.util import Inches, Length, Pt
 
 from ..unitutil.cxml import element, xml
-from ..unitutil.mock import class_mock, instance_mock
+from ..unitutil.mock import (
+    call, class_mock, function_mock, instance_mock, loose_mock, var_mock
+)
 
 
 class DescribeTable(object):
@@ -37,6 +40,111 @@ class DescribeTable(object):
         table, expected_columns_ = columns_fixture
         assert table.columns is expected_columns_
 
+    def it_provides_access_to_a_range_of_cells(self):
+        table = Table(element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol,a:gridCol),a:tr,a:tr)'
+        ), None)
+
+        cell_range = table.range(0, 1, 1, 2)
+
+        assert isinstance(cell_range, _CellRange)
+        assert cell_range._tbl is table._tbl
+        assert cell_range._rows == (0, 2)
+        assert cell_range._cols == (1, 3)
+
+    def it_can_fill_its_cells_from_data(self, fill_fixture):
+        table, data, number_format, start, expected_texts = fill_fixture
+
+        table.fill(data, number_format, start)
+
+        texts = [
+            [tc.xpath('string(.)') for tc in tr.tc_lst]
+            for tr in table._tbl.tr_lst
+        ]
+        assert texts == expected_texts
+
+    def it_accepts_array_like_data_to_fill(self, request):
+        data_ = loose_mock(request)
+        data_.to_numpy.return_value.tolist.return_value = [[1, 2.5]]
+        table = Table(element('a:tbl/a:tr/(a:tc,a:tc)'), None)
+
+        table.fill(data_, '.1f')
+
+        tcs = table._tbl.xpath('.//a:tc')
+        assert [tc.xpath('string(.)') for tc in tcs] == ['1.0', '2.5']
+
+    def it_can_autofit_its_rows_and_columns(self, autofit_fixture):
+        table, min_row_height, max_width = autofit_fixture[:3]
+        expected_widths, expected_heights = autofit_fixture[3:5]
+        _rendered_size_ = autofit_fixture[5]
+        tbl = table._tbl
+
+        table.autofit('foo.ttf', 12, min_row_height, max_width)
+
+        assert [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst] == (
+            expected_widths
+        )
+        assert [tr.h for tr in tbl.tr_lst] == expected_heights
+        assert table._graphic_frame.width == sum(expected_widths)
+        assert table._graphic_frame.height == sum(expected_heights)
+        assert call('x', 24, 'foo.ttf') in _rendered_size_.call_args_list
+
+    def it_widens_the_columns_spanned_by_a_merged_cell(
+            self, request, graphic_frame_):
+        tcPr = 'a:tcPr{marL=0,marR=0,marT=0,marB=0}'
+        table = Table(element(
+            'a:tbl/(a:tblGrid/(a:gridCol{w=100},a:gridCol{w=100},a:gridCol{w'
+            '=100}),a:tr/(a:tc{gridSpan=2}/(a:txBody/a:p/a:r/a:t"abcdefghijk"'
+            ',%s),a:tc{hMerge=1},a:tc/(a:txBody/a:p/a:r/a:t"a",%s)),a:tr/(a:t'
+            'c/(a:txBody/a:p/a:r/a:t"ab",%s),a:tc/(a:txBody/a:p/a:r/a:t"a",%s'
+            '),a:tc/(a:txBody/a:p,%s)))' % ((tcPr,) * 5)
+        ), graphic_frame_)
+        function_mock(
+            request, 'pptx.text.layout._rendered_size',
+            side_effect=lambda text, point_size, font_file: (
+                len(text) * 10, 20
+            )
+        )
+
+        table.autofit('foo.ttf', 12, max_width=1000)
+
+        tbl = table._tbl
+        assert [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst] == (
+            [60, 50, 10]
+        )
+        assert [tr.h for tr in tbl.tr_lst] == [20, 20]
+
+    def it_can_paginate_its_rows(self, paginate_fixture):
+        table, max_height, header_rows, expected_value = paginate_fixture
+        assert table.paginate(max_height, header_rows) == expected_value
+
+    def it_can_extract_the_text_of_its_cells_as_rows(self):
+        table = Table(element(
+            'a:tbl/(a:tr/(a:tc/a:txBody/a:p/a:r/a:t"a",a:tc),a:tr/(a:tc,a:tc'
+            '/a:txBody/a:p/a:r/a:t"b"))'
+        ), None)
+        assert table.to_rows() == [['a', ''], ['', 'b']]
+
+    def it_can_extract_the_text_of_its_cells_as_an_array(self, request):
+        numpy_ = var_mock(request, 'pptx.shapes.table.numpy')
+        table = Table(element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc/a:txBody/a:p/a'
+            ':r/a:t"a",a:tc))'
+        ), None)
+
+        array = table.to_array()
+
+        numpy_.empty.assert_called_once_with((1, 2), dtype=object)
+        assert array is numpy_.empty.return_value
+        array.__setitem__.assert_called_once_with(
+            (0, slice(None, 2)), ['a', '']
+        )
+
+    def but_it_returns_rows_when_numpy_is_not_installed(self, request):
+        var_mock(request, 'pptx.shapes.table.numpy', new=None)
+        table = Table(element('a:tbl/(a:tblGrid/a:gridCol,a:tr/a:tc)'), None)
+        assert table.to_array() == [['']]
+
     def it_updates_graphic_frame_width_on_width_change(self, dx_fixture):
         table, expected_width = dx_fixture
         table.notify_width_changed()
@@ -49,6 +157,33 @@ class DescribeTable(object):
 
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        (0,  None, [60, 10], [20, 20]),
+        (25, None, [60, 10], [25, 25]),
+        (0,  35,   [30, 5],  [40, 20]),
+    ])
+    def autofit_fixture(self, request, graphic_frame_):
+        min_row_height, max_width, expected_widths, expected_heights = (
+            request.param
+        )
+        tcPr = 'a:tcPr{marL=0,marR=0,marT=0,marB=0}'
+        table = Table(element(
+            'a:tbl/(a:tblGrid/(a:gridCol{w=100},a:gridCol{w=100}),a:tr{h=1}/'
+            '(a:tc/(a:txBody/a:p/a:r/a:t"ab cd",%s),a:tc/(a:txBody/a:p/a:r/(a'
+            ':rPr{sz=2400},a:t"x"),%s)),a:tr{h=1}/(a:tc/(a:txBody/a:p/a:r/a:t'
+            '"abcdef",%s),a:tc/(a:txBody/a:p,%s)))' % (tcPr, tcPr, tcPr, tcPr)
+        ), graphic_frame_)
+        _rendered_size_ = function_mock(
+            request, 'pptx.text.layout._rendered_size',
+            side_effect=lambda text, point_size, font_file: (
+                len(text) * 10, 20
+            )
+        )
+        return (
+            table, min_row_height, max_width, expected_widths,
+            expected_heights, _rendered_size_
+        )
+
     @pytest.fixture
     def cell_fixture(self, table, row_, cell_):
         table._rows = [row_]
@@ -75,6 +210,34 @@ class DescribeTable(object):
         expected_height = 300
         return table, expected_height
 
+    @pytest.fixture(params=[
+        ([['a', 1], [None, 2.5]], None, (0, 0),
+         [['a', '1', ''], ['', '2.5', ''], ['', '', '']]),
+        ([[1234.5, True]], ',.2f', (2, 1),
+         [['', '', ''], ['', '', ''], ['', '1,234.50', 'True']]),
+        ((('x',), ('y',)), None, (1, 2),
+         [['', '', ''], ['', '', 'x'], ['', '', 'y']]),
+    ])
+    def fill_fixture(self, request):
+        data, number_format, start, expected_texts = request.param
+        table = Table(element(
+            'a:tbl/(a:tr/(a:tc,a:tc,a:tc),a:tr/(a:tc,a:tc,a:tc),a:tr/(a:tc,a:'
+            'tc,a:tc))'
+        ), None)
+        return table, data, number_format, start, expected_texts
+
+    @pytest.fixture(params=[
+        ('a:tbl',                                 80,  0, [(0, 0)]),
+        ('a:tbl/(a:tr{h=10},a:tr{h=30})',          80,  0, [(0, 2)]),
+        ('a:tbl/(a:tr{h=10},a:tr{h=30},a:tr{h=30},a:tr{h=50},a:tr{h=100},a:'
+         'tr{h=20})',                              80,  1,
+         [(1, 3), (3, 4), (4, 5), (5, 6)]),
+    ])
+    def paginate_fixture(self, request):
+        tbl_cxml, max_height, header_rows, expected_value = request.param
+        table = Table(element(tbl_cxml), None)
+        return table, max_height, header_rows, expected_value
+
     @pytest.fixture
     def rows_fixture(self, table, rows_):
         table._rows = rows_
@@ -292,6 +455,61 @@ class Describe_Cell(object):
         return _Cell(element('a:tc'), None)
 
 
+class Describe_CellRange(object):
+
+    def it_raises_on_a_range_outside_the_table(self, range_raise_fixture):
+        tbl, first_row, first_col, last_row, last_col = range_raise_fixture
+        with pytest.raises(IndexError):
+            _CellRange(tbl, first_row, first_col, last_row, last_col)
+
+    def it_can_format_the_cells_in_the_range(self):
+        tbl = element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc/a:txBody/a:p/a'
+            ':r/a:t"x",a:tc/(a:txBody/a:p,a:tcPr{marL=5}/a:noFill)),a:tr/a:tc'
+            '/a:txBody/a:p)'
+        )
+        cell_range = _CellRange(tbl, 0, 0, 0, 1)
+
+        cell_range.apply(
+            fill=RGBColor(0x12, 0x34, 0x56),
+            font={'bold': True, 'size': Pt(12)},
+            align=PP_ALIGN.RIGHT,
+            margins=0,
+            anchor=MSO_ANCHOR.MIDDLE
+        )
+
+        assert tbl.xml == xml(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc/(a:txBody/a:p'
+            '/(a:pPr{algn=r},a:r/(a:rPr{b=1,sz=1200},a:t"x"),a:endParaRPr{b=1'
+            ',sz=1200}),a:tcPr{marL=0,marT=0,marR=0,marB=0,anchor=ctr}/a:soli'
+            'dFill/a:srgbClr{val=123456}),a:tc/(a:txBody/a:p/(a:pPr{algn=r},a'
+            ':endParaRPr{b=1,sz=1200}),a:tcPr{marL=0,marT=0,marR=0,marB=0,anc'
+            'hor=ctr}/a:solidFill/a:srgbClr{val=123456})),a:tr/a:tc/a:txBody/'
+            'a:p)'
+        )
+
+    def it_raises_on_an_unknown_font_property(self):
+        tbl = element('a:tbl/(a:tblGrid/a:gridCol,a:tr/a:tc)')
+        with pytest.raises(ValueError):
+            _CellRange(tbl, 0, 0, 0, 0).apply(font={'weight': 700})
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (0,  0, 2, 0),
+        (0,  0, 0, 2),
+        (1,  0, 0, 0),
+        (-1, 0, 0, 0),
+    ])
+    def range_raise_fixture(self, request):
+        first_row, first_col, last_row, last_col = request.param
+        tbl = element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc,a:tc),a:tr/(a'
+            ':tc,a:tc))'
+        )
+        return tbl, first_row, first_col, last_row, last_col
+
+
 class Describe_CellCollection(object):
 
     def it_knows_how_many_cells_it_contains(self, len_fixture):
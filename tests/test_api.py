@@ -24,9 +24,32 @@ class DescribePresentation(object):
     def it_opens_default_template_on_no_path_provided(self, call_fixture):
         Package_, path, prs_ = call_fixture
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+        Package_.open.assert_called_once_with(path, None)
         assert prs is prs_
 
+    def it_can_load_only_selected_part_groups(self, call_fixture):
+        Package_ = call_fixture[0]
+        Presentation(load=('slides', 'charts'))
+        part_filter = Package_.open.call_args[0][1]
+        assert part_filter(CT.PML_SLIDE) is True
+        assert part_filter(CT.DML_CHART) is True
+        assert part_filter(CT.PML_PRESENTATION_MAIN) is True
+        assert part_filter(CT.OPC_CORE_PROPERTIES) is True
+        assert part_filter(CT.PML_SLIDE_LAYOUT) is False
+        assert part_filter(CT.PNG) is False
+
+    def it_can_load_parts_selected_by_a_predicate(self, call_fixture):
+        Package_ = call_fixture[0]
+        Presentation(load=lambda content_type: content_type == CT.PNG)
+        part_filter = Package_.open.call_args[0][1]
+        assert part_filter(CT.PNG) is True
+        assert part_filter(CT.PML_PRESENTATION_MAIN) is True
+        assert part_filter(CT.PML_SLIDE) is False
+
+    def it_raises_on_an_unknown_load_group(self, call_fixture):
+        with pytest.raises(ValueError):
+            Presentation(load=('slides', 'foobar'))
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -91,6 +91,9 @@ class DescribeXmlEnumeration(object):
         with pytest.raises(ValueError):
             XMLFOO.to_xml(XMLFOO.RO)
 
+    def it_can_convert_a_member_to_XML_without_validating_it(self):
+        assert XMLFOO.convert_to_xml(XMLFOO.XML_RW) == 'attrVal'
+
     def it_can_map_each_of_its_xml_members_from_the_XML_value(self):
         assert XMLFOO.from_xml(None) is None
         assert XMLFOO.from_xml('attrVal') == XMLFOO.XML_RW
@@ -0,0 +1,108 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.extract module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from zipfile import ZipFile
+
+from pptx import Presentation
+from pptx.compat import BytesIO
+from pptx.extract import _iter_paragraphs, iter_notes_text, iter_text
+from pptx.opc.packuri import PackURI
+from pptx.opc.phys_pkg import _ZipPkgReader
+from pptx.util import Inches
+
+
+class DescribeIterText(object):
+
+    def it_generates_the_text_of_each_slide_paragraph(self, pptx_file):
+        assert list(iter_text(pptx_file)) == [
+            (0, 2, 'Title'),
+            (0, 3, 'first'),
+            (0, 3, 'second\nline'),
+            (0, 4, 'a'),
+            (0, 4, ''),
+            (0, 4, ''),
+            (0, 4, 'd'),
+            (0, 6, 'grouped'),
+            (1, 2, 'Second'),
+        ]
+
+    def it_generates_the_text_of_each_notes_paragraph(self, pptx_file):
+        assert list(iter_notes_text(pptx_file)) == [
+            (1, 3, 'speaker\nnotes'),
+        ]
+
+    def it_skips_a_slide_id_with_no_relationship(self, pptx_file):
+        dangling_file = BytesIO()
+        with ZipFile(pptx_file) as src, ZipFile(dangling_file, 'w') as dst:
+            for item in src.infolist():
+                blob = src.read(item.filename)
+                if item.filename == 'ppt/presentation.xml':
+                    blob = blob.replace(
+                        b'<p:sldIdLst>',
+                        b'<p:sldIdLst><p:sldId id="999" r:id="rId999"/>'
+                    )
+                dst.writestr(item, blob)
+
+        texts = list(iter_text(dangling_file))
+
+        assert texts[0] == (1, 2, 'Title')
+        assert texts[-1] == (2, 2, 'Second')
+
+    def it_skips_the_content_of_fallback_elements(self, fallback_file):
+        phys_reader = _ZipPkgReader(fallback_file)
+        partname = PackURI('/ppt/slides/slide1.xml')
+        paragraphs = list(_iter_paragraphs(phys_reader, partname))
+        phys_reader.close()
+        assert paragraphs == [(7, 'choice')]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def fallback_file(self):
+        slide_xml = (
+            '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/'
+            'main" xmlns:p="http://schemas.openxmlformats.org/presentationml/2'
+            '006/main" xmlns:mc="http://schemas.openxmlformats.org/markup-comp'
+            'atibility/2006"><p:cSld><p:spTree><mc:AlternateContent><mc:Choic'
+            'e Requires="p14"><p:sp><p:nvSpPr><p:cNvPr id="7" name="A"/></p:n'
+            'vSpPr><p:txBody><a:p><a:r><a:t>choice</a:t></a:r></a:p></p:txBo'
+            'dy></p:sp></mc:Choice><mc:Fallback><p:sp><p:nvSpPr><p:cNvPr id="'
+            '8" name="B"/></p:nvSpPr><p:txBody><a:p><a:r><a:t>fallback</a:t><'
+            '/a:r></a:p></p:txBody></p:sp></mc:Fallback></mc:AlternateContent'
+            '></p:spTree></p:cSld></p:sld>'
+        )
+        fallback_file = BytesIO()
+        zipf = ZipFile(fallback_file, 'w')
+        zipf.writestr('ppt/slides/slide1.xml', slide_xml.encode('utf-8'))
+        zipf.close()
+        return fallback_file
+
+    @pytest.fixture(scope='class')
+    def pptx_file(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = 'Title'
+        text_frame = slide.shapes.add_textbox(0, 0, 10, 10).text_frame
+        text_frame.text = 'first'
+        text_frame.add_paragraph().text = 'second\nline'
+        table = slide.shapes.add_table(
+            2, 2, 0, 0, Inches(2), Inches(1)
+        ).table
+        table.cell(0, 0).text, table.cell(1, 1).text = 'a', 'd'
+        group = slide.shapes.add_group_shape()
+        group.shapes.add_textbox(0, 0, 10, 10).text = 'grouped'
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(0, 0, 10, 10).text = 'Second'
+        slide.notes_slide.notes_text_frame.text = 'speaker\nnotes'
+        pptx_file = BytesIO()
+        prs.save(pptx_file)
+        return pptx_file
@@ -324,6 +324,20 @@ class Describe_MediaParts(object):
         media_part = media_parts._find_by_sha1(sha1)
         assert media_part is expected_value
 
+    def but_it_skips_media_parts_not_loaded_as_MediaPart(
+            self, request, _iter_):
+        sha1 = 'f00beed'
+        blob_part_ = instance_mock(request, Part, name='blob_part_')
+        media_part_ = instance_mock(
+            request, MediaPart, name='media_part_', sha1=sha1
+        )
+        _iter_.return_value = iter((blob_part_, media_part_))
+        media_parts = _MediaParts(None)
+
+        result = media_parts._find_by_sha1(sha1)
+
+        assert result is media_part_
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[
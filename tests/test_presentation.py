@@ -17,7 +17,9 @@ from pptx.presentation import Presentation
 from pptx.slide import SlideLayouts, SlideMaster, SlideMasters, Slides
 
 from .unitutil.cxml import element, xml
-from .unitutil.mock import class_mock, instance_mock, property_mock
+from .unitutil.mock import (
+    call, class_mock, function_mock, instance_mock, loose_mock, property_mock
+)
 
 
 class DescribePresentation(object):
@@ -82,10 +84,50 @@ class DescribePresentation(object):
         assert slide_masters is slide_masters_
         assert prs._element.xml == expected_xml
 
+    def it_can_iterate_the_tables_on_its_slides(self, slides_prop_, request):
+        table_shape_ = loose_mock(request, has_table=True)
+        other_shape_ = loose_mock(request, has_table=False)
+        slides_prop_.return_value = [
+            loose_mock(request, shapes=[other_shape_, table_shape_]),
+            loose_mock(request, shapes=[]),
+            loose_mock(request, shapes=[table_shape_]),
+        ]
+        prs = Presentation(None, None)
+
+        tables = list(prs.iter_tables())
+
+        assert tables == [table_shape_.table, table_shape_.table]
+
+    def it_can_rescale_its_slides(self, rescale_fixture):
+        prs, slide_master_, slide_layout_, slide_ = rescale_fixture[:4]
+        rescale_part_element_, scale_font_sizes_ = rescale_fixture[4:6]
+        expected_transform, expected_xml = rescale_fixture[6:]
+
+        prs.rescale(16000000, 9000000, scale_fonts=True)
+
+        assert rescale_part_element_.call_args_list == [
+            call(slide_master_._element, expected_transform, 3.0),
+            call(slide_layout_._element, expected_transform, 3.0),
+            call(slide_._element, expected_transform, 3.0),
+        ]
+        scale_font_sizes_.assert_called_once_with(prs._element, 3.0)
+        assert prs._element.xml == expected_xml
+
+    def but_it_raises_when_there_is_no_slide_size_to_rescale(self):
+        prs = Presentation(element('p:presentation'), None)
+        with pytest.raises(ValueError):
+            prs.rescale(16000000, 9000000)
+
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
         prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        prs_part_.save.assert_called_once_with(file_, False)
+
+    def it_can_minify_the_presentation_on_save(self, save_fixture):
+        prs, file_, prs_part_ = save_fixture
+        savings = prs.save(file_, minify=True)
+        prs_part_.save.assert_called_once_with(file_, True)
+        assert savings is prs_part_.save.return_value
 
     # fixtures -------------------------------------------------------
 
@@ -133,6 +175,32 @@ class DescribePresentation(object):
         prs = Presentation(None, prs_part_)
         return prs, prs_part_
 
+    @pytest.fixture
+    def rescale_fixture(self, request, masters_prop_, slides_prop_):
+        slide_master_ = loose_mock(request, _element=element('p:sldMaster'))
+        slide_layout_ = loose_mock(request, _element=element('p:sldLayout'))
+        slide_ = loose_mock(request, _element=element('p:sld'))
+        slide_master_.slide_layouts = [slide_layout_]
+        masters_prop_.return_value = [slide_master_]
+        slides_prop_.return_value = [slide_]
+        rescale_part_element_ = function_mock(
+            request, 'pptx.presentation.rescale_part_element'
+        )
+        scale_font_sizes_ = function_mock(
+            request, 'pptx.presentation.scale_font_sizes'
+        )
+        prs = Presentation(
+            element('p:presentation/p:sldSz{cx=4000000,cy=3000000}'), None
+        )
+        expected_transform = (3.0, 2000000.0, 3.0, 0.0)
+        expected_xml = xml(
+            'p:presentation/p:sldSz{cx=16000000,cy=9000000}'
+        )
+        return (
+            prs, slide_master_, slide_layout_, slide_, rescale_part_element_,
+            scale_font_sizes_, expected_transform, expected_xml
+        )
+
     @pytest.fixture
     def save_fixture(self, prs_part_):
         prs = Presentation(None, prs_part_)
@@ -237,6 +305,10 @@ class DescribePresentation(object):
     def slide_masters_(self, request):
         return instance_mock(request, SlideMasters)
 
+    @pytest.fixture
+    def slides_prop_(self, request):
+        return property_mock(request, Presentation, 'slides')
+
     @pytest.fixture
     def Slides_(self, request, slides_):
         return class_mock(
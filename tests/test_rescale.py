@@ -0,0 +1,95 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.rescale` module."""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from pptx.rescale import (
+    rescale_part_element, rescale_transform, scale_font_sizes
+)
+
+from .unitutil.cxml import element, xml
+from .unitutil.mock import var_mock
+
+
+class Describe_rescale_part_element(object):
+
+    def it_transforms_the_position_and_size_of_each_shape(self, request):
+        var_mock(request, 'pptx.rescale.numpy', new=None)
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:sp/(p:spPr/a:xfrm/(a:off{x=10,y=20},a:'
+            'ext{cx=30,cy=40}),p:txBody/a:p/a:r/a:rPr{sz=1800}),p:grpSp/(p:g'
+            'rpSpPr/a:xfrm/(a:off{x=0,y=0},a:ext{cx=8,cy=8},a:chOff{x=0,y=0}'
+            ',a:chExt{cx=8,cy=8}),p:sp/p:spPr/a:xfrm/(a:off{x=1,y=1},a:ext{c'
+            'x=2,cy=2})),p:sp/p:spPr)'
+        )
+
+        rescale_part_element(sld, (2.0, 5.0, 0.5, 0.0), 0.5)
+
+        assert sld.xml == xml(
+            'p:sld/p:cSld/p:spTree/(p:sp/(p:spPr/a:xfrm/(a:off{x=25,y=10},a:'
+            'ext{cx=60,cy=20}),p:txBody/a:p/a:r/a:rPr{sz=900}),p:grpSp/(p:gr'
+            'pSpPr/a:xfrm/(a:off{x=5,y=0},a:ext{cx=16,cy=4},a:chOff{x=0,y=0}'
+            ',a:chExt{cx=8,cy=8}),p:sp/p:spPr/a:xfrm/(a:off{x=1,y=1},a:ext{c'
+            'x=2,cy=2})),p:sp/p:spPr)'
+        )
+
+    def it_scales_the_grid_of_a_table_with_its_frame(self, request):
+        var_mock(request, 'pptx.rescale.numpy', new=None)
+        sld = element(
+            'p:sld/p:cSld/p:spTree/p:graphicFrame/(p:xfrm/(a:off{x=0,y=0},a:'
+            'ext{cx=300,cy=100}),a:graphic/a:graphicData{uri=http://schemas.'
+            'openxmlformats.org/drawingml/2006/table}/a:tbl/(a:tblGrid/(a:gr'
+            'idCol{w=100},a:gridCol{w=200}),a:tr{h=50},a:tr{h=50}))'
+        )
+
+        rescale_part_element(sld, (0.5, 0.0, 1.5, 0.0))
+
+        assert sld.xml == xml(
+            'p:sld/p:cSld/p:spTree/p:graphicFrame/(p:xfrm/(a:off{x=0,y=0},a:'
+            'ext{cx=150,cy=150}),a:graphic/a:graphicData{uri=http://schemas.'
+            'openxmlformats.org/drawingml/2006/table}/a:tbl/(a:tblGrid/(a:gr'
+            'idCol{w=50},a:gridCol{w=100}),a:tr{h=75},a:tr{h=75}))'
+        )
+
+
+class Describe_rescale_transform(object):
+
+    def it_maps_the_slide_onto_the_new_size(self, transform_fixture):
+        args, expected_value = transform_fixture
+        assert rescale_transform(*args) == expected_value
+
+    def it_raises_on_an_unrecognized_mode(self):
+        with pytest.raises(ValueError):
+            rescale_transform(4, 3, 16, 9, 'zoom')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ((400, 300, 1600, 900, 'stretch'), (4.0, 0.0, 3.0, 0.0)),
+        ((400, 300, 1600, 900, 'fit'),     (3.0, 200.0, 3.0, 0.0)),
+        ((400, 300, 1600, 900, 'center'),  (1.0, 600.0, 1.0, 300.0)),
+    ])
+    def transform_fixture(self, request):
+        args, expected_value = request.param
+        return args, expected_value
+
+
+class Describe_scale_font_sizes(object):
+
+    def it_scales_each_explicit_font_size(self):
+        txBody = element(
+            'p:txBody/(a:lstStyle/a:lvl1pPr/a:defRPr{sz=1000},a:p/(a:r/a:rP'
+            'r{sz=1200},a:r/a:rPr,a:endParaRPr{sz=399000}))'
+        )
+
+        scale_font_sizes(txBody, 1.5)
+
+        assert txBody.xml == xml(
+            'p:txBody/(a:lstStyle/a:lvl1pPr/a:defRPr{sz=1500},a:p/(a:r/a:rP'
+            'r{sz=1800},a:r/a:rPr,a:endParaRPr{sz=400000}))'
+        )
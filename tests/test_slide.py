@@ -28,7 +28,7 @@ from pptx.text.text import TextFrame
 
 from .unitutil.cxml import element, xml
 from .unitutil.mock import (
-    call, class_mock, instance_mock, method_mock, property_mock
+    call, class_mock, instance_mock, loose_mock, method_mock, property_mock
 )
 
 
@@ -517,6 +517,62 @@ class DescribeSlides(object):
         assert slides._sldIdLst.xml == expected_xml
         assert slide is slide_
 
+    def it_can_add_many_new_slides(self, request, slide_layout_, prs_part_,
+                                   part_prop_):
+        slides = Slides(element('p:sldIdLst/p:sldId{r:id=rId1,id=256}'), None)
+        first_slide_ = loose_mock(request, _element=element('p:sld'))
+        add_slide_ = method_mock(
+            request, Slides, 'add_slide', return_value=first_slide_
+        )
+        slide_2_, slide_3_ = loose_mock(request), loose_mock(request)
+        prs_part_.add_slides.return_value = [
+            ('rId2', slide_2_), ('rId3', slide_3_)
+        ]
+
+        new_slides = slides.add_slides(slide_layout_, 3)
+
+        add_slide_.assert_called_once_with(slide_layout_)
+        prs_part_.add_slides.assert_called_once_with(
+            slide_layout_, first_slide_._element, 2
+        )
+        assert slides._sldIdLst.xml == xml(
+            'p:sldIdLst/(p:sldId{r:id=rId1,id=256},p:sldId{r:id=rId2,id=257}'
+            ',p:sldId{r:id=rId3,id=258})'
+        )
+        assert new_slides == [first_slide_, slide_2_, slide_3_]
+
+    def it_can_duplicate_a_slide(self, duplicate_fixture):
+        slides, slide_, index, prs_part_ = duplicate_fixture[:4]
+        new_slide_, expected_xml, expected_rIds = duplicate_fixture[4:]
+
+        slide = slides.duplicate(slide_, index, copy_notes=False)
+
+        prs_part_.duplicate_slide.assert_called_once_with(slide_.part, False)
+        assert slides._sldIdLst.xml == expected_xml
+        if expected_rIds is None:
+            assert prs_part_.rename_slide_parts.call_count == 0
+        else:
+            prs_part_.rename_slide_parts.assert_called_once_with(
+                expected_rIds
+            )
+        assert slide is new_slide_
+
+    def it_can_move_a_slide(self, move_fixture):
+        slides, slide, new_index, expected_xml, prs_part_ = move_fixture
+        slides.move(slide, new_index)
+        assert slides._sldIdLst.xml == expected_xml
+        prs_part_.reset_slide_lookup.assert_called_once_with()
+
+    def but_it_raises_on_a_move_out_of_range(self, move_fixture):
+        slides, slide = move_fixture[:2]
+        with pytest.raises(IndexError):
+            slides.move(slide, 3)
+
+    def it_can_remove_a_slide(self, part_prop_, prs_part_, slide_):
+        slides = Slides(element('p:sldIdLst'), None)
+        slides.remove(slide_)
+        prs_part_.remove_slide.assert_called_once_with(slide_.part)
+
     def it_finds_a_slide_by_slide_id(self, get_fixture):
         slides, slide_id, default, prs_part_, expected_value = get_fixture
         slide = slides.get(slide_id, default)
@@ -539,6 +595,44 @@ class DescribeSlides(object):
             expected_xml, slide_
         )
 
+    @pytest.fixture(params=[
+        (None, 'p:sldIdLst/(p:sldId{r:id=rId1,id=256},p:sldId{r:id=rId2,id=2'
+               '57},p:sldId{r:id=rId3,id=258})', None),
+        (0,    'p:sldIdLst/(p:sldId{r:id=rId3,id=258},p:sldId{r:id=rId1,id=2'
+               '56},p:sldId{r:id=rId2,id=257})', ['rId3', 'rId1', 'rId2']),
+    ])
+    def duplicate_fixture(self, request, part_prop_, prs_part_):
+        index, expected_cxml, expected_rIds = request.param
+        slides = Slides(element(
+            'p:sldIdLst/(p:sldId{r:id=rId1,id=256},p:sldId{r:id=rId2,id=257})'
+        ), None)
+        slide_, new_slide_ = loose_mock(request), loose_mock(request)
+        prs_part_.duplicate_slide.return_value = 'rId3', new_slide_
+        return (
+            slides, slide_, index, prs_part_, new_slide_, xml(expected_cxml),
+            expected_rIds
+        )
+
+    @pytest.fixture(params=[
+        (0, 2, 'rId2,rId3,rId1'),
+        (2, 0, 'rId3,rId1,rId2'),
+        (1, 1, 'rId1,rId2,rId3'),
+    ])
+    def move_fixture(self, request, part_prop_, prs_part_):
+        old_index, new_index, expected_rIds = request.param
+        slides = Slides(element(
+            'p:sldIdLst/(p:sldId{r:id=rId1},p:sldId{r:id=rId2},p:sldId{r:id='
+            'rId3})'
+        ), None)
+        slide = loose_mock(request)
+        prs_part_.slide_index.return_value = old_index
+        expected_xml = xml(
+            'p:sldIdLst/(%s)' % ','.join(
+                'p:sldId{r:id=%s}' % rId for rId in expected_rIds.split(',')
+            )
+        )
+        return slides, slide, new_index, expected_xml, prs_part_
+
     @pytest.fixture(params=[True, False])
     def get_fixture(self, request, part_prop_, prs_part_, slide_):
         found = request.param
@@ -562,18 +656,11 @@ class DescribeSlides(object):
         return slides
 
     @pytest.fixture(params=[0, 1])
-    def index_fixture(self, request, part_prop_):
+    def index_fixture(self, request, part_prop_, prs_part_, slide_):
         idx = request.param
-        sldIdLst = element('p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})')
-        slides = Slides(sldIdLst, None)
-        _slides = [
-            Slide(element('p:sld'), None),
-            Slide(element('p:sld'), None)
-        ]
-        part_prop_.return_value.related_slide.side_effect = (
-            _slides
-        )
-        return slides, _slides[idx], idx
+        slides = Slides(element('p:sldIdLst'), None)
+        prs_part_.slide_index.return_value = idx
+        return slides, slide_, idx
 
     @pytest.fixture
     def iter_fixture(self, part_prop_, slide_):
@@ -596,10 +683,10 @@ class DescribeSlides(object):
         return slides, expected_value
 
     @pytest.fixture
-    def raises_fixture(self):
+    def raises_fixture(self, part_prop_, prs_part_, slide_):
         slides = Slides(element('p:sldIdLst'), None)
-        slide = Slide(element('p:sld'), None)
-        return slides, slide
+        prs_part_.slide_index.side_effect = ValueError
+        return slides, slide_
 
     # fixture components ---------------------------------------------
 
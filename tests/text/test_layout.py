@@ -9,7 +9,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 import pytest
 
 from pptx.text.layout import (
-    _BinarySearchTree, _Line, _LineSource, TextFitter
+    _BinarySearchTree, _Line, _LineSource, TextFitter, TextMeasurer
 )
 
 from ..unitutil.mock import (
@@ -222,6 +222,56 @@ class DescribeTextFitter(object):
         return method_mock(request, TextFitter, '_wrap_lines')
 
 
+class DescribeTextMeasurer(object):
+
+    def it_measures_the_width_of_a_line(self, _rendered_size_):
+        measurer = TextMeasurer('foo.ttf', 12)
+        assert measurer.line_width('ab  cde f') == 80
+        assert measurer.line_width('  ') == 0
+
+    def it_counts_the_lines_a_line_wraps_to(self, count_fixture):
+        measurer, line, width, expected_value = count_fixture
+        assert measurer.line_count(line, width) == expected_value
+
+    def it_measures_each_word_only_once(self, _rendered_size_):
+        measurer = TextMeasurer('foo.ttf', 12)
+        measurer.line_width('ab ab ab')
+        measurer.line_count('ab ab', 100)
+        assert _rendered_size_.call_args_list == [
+            call('ab', 12, 'foo.ttf'), call(' ', 12, 'foo.ttf')
+        ]
+
+    def it_knows_the_height_of_a_line(self, _rendered_size_):
+        measurer = TextMeasurer('foo.ttf', 12)
+        assert measurer.line_height == 20
+        _rendered_size_.assert_called_once_with('Ty', 12, 'foo.ttf')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('',            50, 1),
+        ('ab cd',       50, 1),
+        ('ab cd',       49, 2),
+        ('ab cd ef',    50, 2),
+        ('abcdefg h',   30, 2),
+    ])
+    def count_fixture(self, request, _rendered_size_):
+        line, width, expected_value = request.param
+        measurer = TextMeasurer('foo.ttf', 12)
+        return measurer, line, width, expected_value
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def _rendered_size_(self, request):
+        return function_mock(
+            request, 'pptx.text.layout._rendered_size',
+            side_effect=lambda text, point_size, font_file: (
+                len(text) * 10, 20
+            )
+        )
+
+
 class Describe_BinarySearchTree(object):
 
     def it_can_construct_from_an_ordered_sequence(self):